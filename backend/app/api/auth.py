@@ -92,7 +92,7 @@ async def login(
     # Get user by email
     user = await user_service.get_user_by_email(user_credentials.email)
     
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    if not user or not await verify_password(user_credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.services.auth_service import AuthService
+from app.services.org_stats_service import OrgStatsService
 from app.models.saas import (
     UserSignup, UserLogin, OrganizationCreate, InviteUser, 
     UpgradeSubscription, PlanType, PLAN_LIMITS
@@ -123,12 +124,9 @@ async def get_organization(
         )
     
     # Get member count and project count
-    member_count = await db.organization_members.count_documents(
-        {"organization_id": str(org["_id"])}
-    )
-    project_count = await db.projects.count_documents(
-        {"organization_id": str(org["_id"])}
-    )
+    stats = await OrgStatsService(db).get(str(org["_id"]))
+    member_count = stats.get("members", 0)
+    project_count = stats.get("projects", 0)
     
     org_data = {
         "id": str(org["_id"]),
@@ -171,7 +169,7 @@ async def get_organization_members(
     
     # Get members with user details
     members = []
-    async for membership in db.organization_members.find({"organization_id": str(org["_id"])}):
+    async for membership in db.organization_members.find({"organization_id": org["_id"]}):
         user = await db.users.find_one({"_id": membership["user_id"]})
         if user:
             members.append({
@@ -215,7 +213,7 @@ async def invite_user(
     
     # Check plan limits
     current_member_count = await db.organization_members.count_documents(
-        {"organization_id": str(org["_id"])}
+        {"organization_id": org["_id"]}
     )
     
     can_add_member = await auth_service.check_plan_limits(
@@ -345,12 +343,9 @@ async def get_billing_info(
         )
     
     # Get current usage
-    member_count = await db.organization_members.count_documents(
-        {"organization_id": str(org["_id"])}
-    )
-    project_count = await db.projects.count_documents(
-        {"organization_id": str(org["_id"])}
-    )
+    stats = await OrgStatsService(db).get(str(org["_id"]))
+    member_count = stats.get("members", 0)
+    project_count = stats.get("projects", 0)
     
     plan_type = org.get("plan_type", "free")
     plan_limits = PLAN_LIMITS.get(plan_type)
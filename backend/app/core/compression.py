@@ -0,0 +1,204 @@
+"""
+Response compression middleware
+
+Negotiates brotli, zstd or gzip from Accept-Encoding (brotli and zstd only
+when the optional ``brotli`` / ``zstandard`` packages are installed) and
+compresses text-like responses:
+
+* Complete responses smaller than ``minimum_size`` are sent as-is, since
+  the framing overhead outweighs the savings.
+* Streaming responses (StreamingResponse exports) are compressed chunk by
+  chunk with a flush after each chunk, so rows still reach the client as
+  they are produced, or passed through untouched when ``streaming`` is off.
+* WebSocket connections and excluded path prefixes (e.g. Socket.IO
+  long-polling) are never touched.
+"""
+import zlib
+from typing import Iterable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce, in server preference order"""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, preferred: Iterable[str]) -> Optional[str]:
+    """Pick the first preferred encoding the client accepts with q > 0"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    for encoding in preferred:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Incremental compressor with a common compress/flush/finish interface"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=min(level, 11))
+        elif encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + self._brotli.flush() if flush else out
+        if self.encoding == "zstd":
+            out = self._zstd.compress(data)
+            return out + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else out
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        if self.encoding == "zstd":
+            return self._zstd.flush()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, level: int = 6,
+                 encodings: Optional[Iterable[str]] = None, streaming: bool = True,
+                 exclude_paths: Iterable[str] = ()):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        supported = available_encodings()
+        self.encodings = [e for e in (encodings or supported) if e in supported]
+        self.streaming = streaming
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request state: decides on the first body message, then streams"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _start_compressed(self) -> Message:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "content-length" in headers:
+            del headers["content-length"]
+        self.compressor = _Compressor(self.encoding, self.middleware.level)
+        return self.start
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            if not self._compressible(Headers(raw=message["headers"])):
+                self.passthrough = True
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        if self.passthrough:
+            if self.start is not None:
+                await self.downstream(self.start)
+                self.start = None
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            # First body message: decide how to handle the whole response
+            if not more_body:
+                if len(body) < self.middleware.minimum_size:
+                    await self.downstream(self.start)
+                    await self.downstream(message)
+                    return
+                start = self._start_compressed()
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                MutableHeaders(raw=start["headers"])["Content-Length"] = str(len(compressed))
+                await self.downstream(start)
+                await self.downstream({"type": "http.response.body", "body": compressed})
+                return
+
+            if not self.middleware.streaming:
+                self.passthrough = True
+                await self.downstream(self.start)
+                self.start = None
+                await self.downstream(message)
+                return
+
+            await self.downstream(self._start_compressed())
+
+        if more_body:
+            chunk = self.compressor.compress(body, flush=True)
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -15,6 +15,40 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing worker pool
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 256
+
+    # Authenticated principal cache (per process)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Organization slug and membership role caches (per process)
+    ORG_CACHE_TTL_SECONDS: int = 60
+    ORG_CACHE_MAX_SIZE: int = 10000
+
+    # Per-organization change versions behind ETags; short so other workers'
+    # writes show up quickly
+    CHANGE_VERSION_CACHE_TTL_SECONDS: int = 5
+
+    # Delta sync: how long delete tombstones (and so sync tokens) stay valid
+    SYNC_TOMBSTONE_TTL_DAYS: int = 30
+    # Writes still pending after this long are taken to have died and stop
+    # holding sync tokens back
+    CHANGE_WRITE_TIMEOUT_SECONDS: int = 60
+
+    # Response compression (br/zstd need the optional brotli/zstandard packages)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_ENCODINGS: List[str] = ["br", "zstd", "gzip"]
+    COMPRESSION_STREAMING: bool = True
+    COMPRESSION_EXCLUDE_PATHS: List[str] = ["/ws", "/socket.io"]
+
+    # Real-time updates: a client that takes longer than this to accept a
+    # broadcast is disconnected
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = 5.0
+
     # CORS
     ALLOWED_HOSTS: List[str] = [
         "http://localhost:3000",
@@ -23,7 +57,7 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5173"
     ]
 
-    # Database
+    # Database; needs MongoDB 7.0 or later (the reports overview uses $percentile)
     MONGODB_URL: str = "mongodb://localhost:27017"  # Default fallback, use .env for production
     DATABASE_NAME: str = "project_management"
 
@@ -45,9 +79,24 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
 
+    # Streaming exports: documents fetched and written per batch
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Bulk task endpoint: operations accepted per request
+    BULK_MAX_OPERATIONS: int = 500
+
+    # Task imports: rows validated and inserted per batch, row errors kept per import
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ERRORS: int = 100
+
+    # Board ordering: rebalance a column once a card's rank grows past this length
+    RANK_REBALANCE_LENGTH: int = 12
+
     class Config:
         env_file = ".env"
         case_sensitive = True
+        # .env is shared with saas_server/email_service, which read extra keys
+        extra = "ignore"
 
 
 settings = Settings()
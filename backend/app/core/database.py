@@ -1,5 +1,6 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
+from app.core.indexes import reconcile_indexes
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,39 +44,9 @@ async def close_mongo_connection():
 
 
 async def create_indexes():
-    """Create database indexes for better performance"""
+    """Create any indexes from the shared index spec that are missing"""
     try:
-        # Users collection indexes
-        await db.database.users.create_index("email", unique=True)
-        await db.database.users.create_index("created_at")
-        
-        # Projects collection indexes
-        await db.database.projects.create_index("owner_id")
-        await db.database.projects.create_index("members")
-        await db.database.projects.create_index("created_at")
-        await db.database.projects.create_index("status")
-        
-        # Tasks collection indexes
-        await db.database.tasks.create_index("project_id")
-        await db.database.tasks.create_index("assignee_id")
-        await db.database.tasks.create_index("status")
-        await db.database.tasks.create_index("priority")
-        await db.database.tasks.create_index("due_date")
-        await db.database.tasks.create_index("created_at")
-        await db.database.tasks.create_index("position")
-        
-        # Comments collection indexes
-        await db.database.comments.create_index("task_id")
-        await db.database.comments.create_index("user_id")
-        await db.database.comments.create_index("created_at")
-        
-        # Notifications collection indexes
-        await db.database.notifications.create_index("user_id")
-        await db.database.notifications.create_index("read")
-        await db.database.notifications.create_index("created_at")
-        
-        logger.info("Database indexes created successfully")
-        
+        await reconcile_indexes(db.database)
     except Exception as e:
         logger.error(f"Error creating indexes: {e}")
         raise
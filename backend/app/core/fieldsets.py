@@ -0,0 +1,60 @@
+"""
+Sparse fieldsets for list endpoints
+
+``fields=title,status`` (or a named preset such as ``fields=board``) is
+compiled into a Mongo projection, so unrequested fields never leave the
+database. Only whitelisted fields can be asked for; ``id`` is always
+returned, and the page's sort field is always projected because the next
+page cursor is built from it. Without ``fields`` the full document is
+returned.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.schema import InvalidDocument
+from app.core.task_filters import split_values
+
+TASK_FIELDS = (
+    "title", "description", "status", "priority", "project_id", "assigned_to", "created_by",
+    "due_date", "tags", "rank", "created_at", "updated_at", "completed_at", "change_seq",
+)
+PROJECT_FIELDS = (
+    "name", "description", "status", "owner_id", "start_date", "end_date",
+    "created_at", "updated_at", "change_seq",
+)
+MEMBER_FIELDS = (
+    "email", "first_name", "last_name", "role", "status", "joined_date", "last_active",
+)
+
+# What a task card on a board renders; no description, tags or audit fields
+TASK_BOARD_FIELDS = ("title", "status", "priority", "assigned_to", "due_date", "project_id", "rank", "change_seq")
+
+TASK_PRESETS = {"board": TASK_BOARD_FIELDS}
+
+
+def select_fields(fields: Optional[str], allowed: Tuple[str, ...],
+                  presets: Optional[Dict[str, Tuple[str, ...]]] = None) -> Optional[Tuple[str, ...]]:
+    """Validated field names for ``fields``, or None for the full document"""
+    values = split_values(fields)
+    if not values:
+        return None
+    if len(values) == 1 and presets and values[0] in presets:
+        return presets[values[0]]
+
+    selected = []
+    for value in values:
+        if value == "id":
+            continue
+        if value not in allowed:
+            raise InvalidDocument("fields", value, expected="field name")
+        if value not in selected:
+            selected.append(value)
+    return tuple(selected)
+
+
+def projection(fields: Optional[Iterable[str]], required: Iterable[str] = ()) -> Optional[Dict[str, int]]:
+    """Mongo projection for selected fields plus ``required`` ones (e.g. the sort field)"""
+    if fields is None:
+        return None
+    spec = {field: 1 for field in fields}
+    spec.update((field, 1) for field in required)
+    return spec
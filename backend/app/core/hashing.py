@@ -0,0 +1,141 @@
+"""
+Async password hashing backed by a bounded worker pool.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call), so
+running it on the event loop stalls every other request. The hasher below
+pushes the work onto a small thread pool (bcrypt releases the GIL), admits
+callers in FIFO order and keeps simple queue/latency metrics.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+import bcrypt
+
+from app.core.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full and the request should be retried"""
+
+
+class PasswordHasher:
+    """Runs bcrypt hash/verify calls in a bounded thread pool"""
+
+    def __init__(self, max_workers: int, max_queue: int, sample_size: int = 1024):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_samples: deque = deque(maxlen=sample_size)
+        self._hash_samples: deque = deque(maxlen=sample_size)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    def _run(self, fn: Callable, enqueued_at: float, *args) -> Any:
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._wait_samples.append(started_at - enqueued_at)
+                self._hash_samples.append(finished_at - started_at)
+
+    async def _submit(self, fn: Callable, *args) -> Any:
+        # ThreadPoolExecutor drains its work queue in FIFO order, so callers
+        # are served in arrival order once admitted.
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusy("Password hashing queue is full")
+            self._queued += 1
+
+        try:
+            future = self._get_executor().submit(self._run, fn, time.perf_counter(), *args)
+        except RuntimeError:
+            # Executor shut down, so the job never started and _run will not
+            # release its queue slot; errors raised by the job itself come
+            # from the await below, after _run has already released it
+            with self._lock:
+                self._queued -= 1
+            raise
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with a fresh salt"""
+        return await self._submit(_bcrypt_hash, password)
+
+    async def verify(self, password: str, hashed: Union[str, bytes]) -> bool:
+        """Verify a password against its bcrypt hash"""
+        return await self._submit(_bcrypt_verify, password, hashed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depth and latency (milliseconds)"""
+        with self._lock:
+            wait_samples = list(self._wait_samples)
+            hash_samples = list(self._hash_samples)
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "in_flight": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_ms": _summarize(wait_samples),
+                "hash_ms": _summarize(hash_samples),
+            }
+
+    def shutdown(self):
+        """Stop the worker pool, waiting for in-flight hashes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _bcrypt_hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def _bcrypt_verify(password: str, hashed: Union[str, bytes]) -> bool:
+    # Handle both string and bytes for the stored hash
+    if isinstance(hashed, str):
+        hashed = hashed.encode('utf-8')
+    return bcrypt.checkpw(password.encode('utf-8'), hashed)
+
+
+def _summarize(samples) -> Dict[str, float]:
+    if not samples:
+        return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "avg": round(sum(ordered) / count * 1000, 2),
+        "p50": round(ordered[int(0.5 * (count - 1))] * 1000, 2),
+        "p95": round(ordered[int(0.95 * (count - 1))] * 1000, 2),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
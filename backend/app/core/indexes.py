@@ -0,0 +1,173 @@
+"""
+Declarative MongoDB index specification and reconciler
+
+INDEX_SPEC is the single source of truth for indexes used by both
+saas_server.py and the app package. Each entry mirrors a query shape an
+endpoint actually issues; compound indexes are ordered equality fields
+first, then sort/range fields, so they also serve their prefixes and no
+separate single-field index is needed for the leading field.
+"""
+import logging
+from typing import Any, Dict, List, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_SPEC: Dict[str, List[Dict[str, Any]]] = {
+    "users": [
+        {"keys": [("email", ASCENDING)], "unique": True},
+        {"keys": [("created_at", ASCENDING)]},
+    ],
+    "organizations": [
+        {"keys": [("slug", ASCENDING)], "unique": True},
+    ],
+    "organization_members": [
+        # Membership checks, member lists, role updates
+        {"keys": [("organization_id", ASCENDING), ("user_id", ASCENDING)]},
+        # Organizations of a user at login
+        {"keys": [("user_id", ASCENDING)]},
+    ],
+    "invitations": [
+        {"keys": [("organization_id", ASCENDING), ("email", ASCENDING)]},
+        {"keys": [("organization_id", ASCENDING), ("status", ASCENDING)]},
+    ],
+    "projects": [
+        # Keyset-paginated project lists (newest first) and recent projects
+        {"keys": [("organization_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]},
+        {"keys": [("organization_id", ASCENDING), ("status", ASCENDING)]},
+        {"keys": [("owner_id", ASCENDING)]},
+        # Delta sync (app.services.sync_service)
+        {"keys": [("organization_id", ASCENDING), ("change_seq", ASCENDING), ("_id", ASCENDING)]},
+        {"keys": [("members", ASCENDING)]},
+    ],
+    "tasks": [
+        # Status counters, status-filtered org task lists (see app.core.task_filters)
+        {"keys": [("organization_id", ASCENDING), ("status", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        {"keys": [("organization_id", ASCENDING), ("status", ASCENDING), ("due_date", ASCENDING), ("_id", ASCENDING)]},
+        # Team report and assignee filters
+        {"keys": [("organization_id", ASCENDING), ("assigned_to", ASCENDING), ("status", ASCENDING),
+                  ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        # Priority and tag filters
+        {"keys": [("organization_id", ASCENDING), ("priority", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        {"keys": [("organization_id", ASCENDING), ("tags", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        # Overdue counts, due-date ranges and due-date sorts
+        {"keys": [("organization_id", ASCENDING), ("due_date", ASCENDING), ("_id", ASCENDING)]},
+        # Keyset-paginated org task listing in creation order
+        {"keys": [("organization_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        # Keyset-paginated project task listing
+        {"keys": [("project_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)]},
+        # Delta sync (app.services.sync_service)
+        {"keys": [("organization_id", ASCENDING), ("change_seq", ASCENDING), ("_id", ASCENDING)]},
+        # Completion-time reports
+        {"keys": [("organization_id", ASCENDING), ("completed_at", ASCENDING)]},
+        # Board column order and board reads (rank_service, board_service);
+        # its prefixes serve project task lists, per-project report counters
+        # and cascade deletes
+        {"keys": [("project_id", ASCENDING), ("status", ASCENDING), ("rank", ASCENDING), ("_id", ASCENDING)]},
+        # app package: assignee lookups
+        {"keys": [("assignee_id", ASCENDING), ("status", ASCENDING)]},
+    ],
+    "tombstones": [
+        {"keys": [("organization_id", ASCENDING), ("change_seq", ASCENDING), ("_id", ASCENDING)]},
+        {"keys": [("deleted_at", ASCENDING)], "expireAfterSeconds": settings.SYNC_TOMBSTONE_TTL_DAYS * 86400},
+    ],
+    "task_imports": [
+        # Recent imports of an organization, for progress polling
+        {"keys": [("organization_id", ASCENDING), ("started_at", DESCENDING)]},
+    ],
+    "comments": [
+        {"keys": [("task_id", ASCENDING), ("created_at", ASCENDING)]},
+        {"keys": [("user_id", ASCENDING)]},
+    ],
+    "notifications": [
+        {"keys": [("user_id", ASCENDING), ("read", ASCENDING), ("created_at", DESCENDING)]},
+    ],
+}
+
+
+def _key_pattern(keys) -> Tuple[Tuple[str, Any], ...]:
+    # Directions come back from the server as floats; special index types
+    # ("text", "2dsphere", ...) are strings
+    return tuple(
+        (field, direction if isinstance(direction, str) else int(direction))
+        for field, direction in keys
+    )
+
+
+def _index_model(spec: Dict[str, Any]) -> IndexModel:
+    options = {option: value for option, value in spec.items() if option != "keys"}
+    return IndexModel(spec["keys"], **options)
+
+
+async def _index_usage(collection) -> Dict[str, int]:
+    """Operation counts per index name since the last server restart"""
+    usage = {}
+    async for stat in collection.aggregate([{"$indexStats": {}}]):
+        usage[stat["name"]] = stat["accesses"]["ops"]
+    return usage
+
+
+async def reconcile_indexes(database, spec: Dict[str, List[Dict[str, Any]]] = INDEX_SPEC,
+                            include_usage: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """Diff the spec against existing indexes and build whatever is missing
+
+    Nothing is ever dropped: indexes outside the spec are reported as
+    ``extra``, and with ``include_usage`` indexes that $indexStats shows
+    zero operations for are reported as ``unused`` so they can be removed
+    by hand once confirmed.
+    """
+    report = {"created": [], "existing": [], "conflicts": [], "extra": [], "unused": []}
+
+    for collection_name, wanted in spec.items():
+        collection = database[collection_name]
+        existing = await collection.index_information()
+        existing_by_keys = {
+            _key_pattern(info["key"]): (name, info) for name, info in existing.items()
+        }
+
+        missing = []
+        wanted_patterns = set()
+        for index in wanted:
+            pattern = _key_pattern(index["keys"])
+            wanted_patterns.add(pattern)
+            match = existing_by_keys.get(pattern)
+            if match is None:
+                missing.append(index)
+                continue
+
+            name, info = match
+            entry = {"collection": collection_name, "name": name}
+            if bool(info.get("unique", False)) != bool(index.get("unique", False)):
+                report["conflicts"].append({**entry, "reason": "unique option differs from spec"})
+            else:
+                report["existing"].append(entry)
+
+        if missing:
+            names = await collection.create_indexes([_index_model(index) for index in missing])
+            report["created"].extend({"collection": collection_name, "name": name} for name in names)
+
+        for pattern, (name, _) in existing_by_keys.items():
+            if name != "_id_" and pattern not in wanted_patterns:
+                report["extra"].append({"collection": collection_name, "name": name})
+
+        if include_usage and existing:
+            try:
+                usage = await _index_usage(collection)
+            except OperationFailure as e:
+                logger.warning(f"$indexStats unavailable for {collection_name}: {e}")
+                continue
+            for name, ops in usage.items():
+                if name != "_id_" and ops == 0:
+                    report["unused"].append({"collection": collection_name, "name": name})
+
+    for conflict in report["conflicts"]:
+        logger.warning(f"Index conflict on {conflict['collection']}.{conflict['name']}: {conflict['reason']}")
+    logger.info(
+        f"Indexes reconciled: {len(report['created'])} created, "
+        f"{len(report['existing'])} present, {len(report['extra'])} outside spec"
+    )
+    return report
@@ -0,0 +1,87 @@
+"""
+Keyset pagination for list endpoints
+
+Lists are ordered by ``(sort_field, _id)`` (``created_at`` unless the
+endpoint allows another sort) and each page continues from the last key of
+the previous one, so fetching page N costs the same as page 1 (an index
+seek plus ``limit`` documents) instead of skipping N * limit entries.
+Cursors are opaque to clients: a URL-safe base64 of the extended JSON key,
+which keeps the BSON types of the key intact.
+"""
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId, json_util
+
+from app.core.config import settings
+from app.core.schema import InvalidDocument
+
+ASCENDING = 1
+DESCENDING = -1
+
+
+def page_limit(limit: Optional[int]) -> int:
+    """Clamp a requested page size to 1..MAX_PAGE_SIZE, defaulting to DEFAULT_PAGE_SIZE"""
+    if limit is None:
+        return settings.DEFAULT_PAGE_SIZE
+    return max(1, min(limit, settings.MAX_PAGE_SIZE))
+
+
+def encode_cursor(doc: Dict[str, Any], sort_field: str = "created_at") -> str:
+    """Continuation token pointing just past ``doc``"""
+    key = json_util.dumps([sort_field, doc.get(sort_field), doc["_id"]])
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str = "created_at") -> Tuple[Any, ObjectId]:
+    """Inverse of encode_cursor; raises InvalidDocument for tampered tokens
+    or tokens issued for a different sort"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, value, last_id = json_util.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidDocument("cursor", cursor, expected="page cursor")
+    if field != sort_field or not isinstance(last_id, ObjectId):
+        raise InvalidDocument("cursor", cursor, expected="page cursor")
+    return value, last_id
+
+
+def keyset_filter(query: Dict[str, Any], cursor: Optional[str], sort_field: str = "created_at",
+                  direction: int = ASCENDING) -> Dict[str, Any]:
+    """Restrict ``query`` to documents after the cursor in (sort_field, _id) order"""
+    if not cursor:
+        return query
+    value, last_id = decode_cursor(cursor, sort_field)
+    after = "$gt" if direction == ASCENDING else "$lt"
+    tie = {sort_field: value, "_id": {after: last_id}}
+
+    # Nulls (and missing fields) sort before every date, but range operators
+    # never match across types, so they need their own branches
+    if value is None:
+        following = [tie, {sort_field: {"$ne": None}}] if direction == ASCENDING else [tie]
+    else:
+        following = [tie, {sort_field: {after: value}}]
+        if direction == DESCENDING:
+            following.append({sort_field: None})
+
+    keyset = {"$or": following}
+    return {"$and": [query, keyset]} if "$or" in query else {**query, **keyset}
+
+
+async def fetch_page(collection, query: Dict[str, Any], cursor: Optional[str] = None,
+                     limit: Optional[int] = None, direction: int = ASCENDING,
+                     projection: Optional[Dict[str, Any]] = None,
+                     sort_field: str = "created_at") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return one page of documents and the cursor for the next page (None on the last page)"""
+    limit = page_limit(limit)
+    docs = await collection.find(keyset_filter(query, cursor, sort_field, direction), projection) \
+        .sort([(sort_field, direction), ("_id", direction)]) \
+        .limit(limit + 1) \
+        .to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1], sort_field)
+    return docs, next_cursor
@@ -0,0 +1,92 @@
+"""
+Lexicographic fractional ranks for ordering cards within a board column
+
+A rank is a string of base-62 digits read as a fraction in (0, 1), never
+ending in "0" so that no two ranks denote the same fraction. Plain string
+comparison (Mongo's default binary collation) gives the card order, and
+there is always a rank strictly between two others, so moving a card
+rewrites only that card's rank. Appends increment a fixed
+width prefix instead of halving the remaining space, so columns filled by
+appending stay at RANK_WIDTH characters; repeated inserts into the same gap
+grow ranks by roughly one character per six inserts until the column is
+rebalanced (see ``spaced_ranks``).
+"""
+import math
+from typing import Iterator, Optional
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+RANK_WIDTH = 4
+FIRST_RANK = "V"
+
+_VALUE = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Rank strictly between ``low`` ("" for 0) and ``high`` (None for 1)"""
+    if high is not None:
+        # Keep the common prefix, treating missing digits of ``low`` as 0
+        shared = 0
+        while shared < len(high) and (low[shared] if shared < len(low) else DIGITS[0]) == high[shared]:
+            shared += 1
+        if shared:
+            return high[:shared] + _midpoint(low[shared:], high[shared:])
+
+    low_digit = _VALUE[low[0]] if low else 0
+    high_digit = _VALUE[high[0]] if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    # Consecutive digits: a longer ``high`` leaves room right below it,
+    # otherwise go one digit deeper above ``low``
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def rank_after(rank: str) -> str:
+    """A rank above ``rank`` with nothing assumed above it (appending to a column)"""
+    digits = list(rank[:RANK_WIDTH].ljust(RANK_WIDTH, DIGITS[0]))
+    for index in reversed(range(RANK_WIDTH)):
+        if digits[index] != DIGITS[-1]:
+            digits[index] = DIGITS[_VALUE[digits[index]] + 1]
+            return "".join(digits[:index + 1])
+    return _midpoint(rank, None)
+
+
+def rank_before(rank: str) -> str:
+    """A rank below ``rank`` with nothing assumed below it (prepending to a column)"""
+    digits = list(rank[:RANK_WIDTH].ljust(RANK_WIDTH, DIGITS[0]))
+    for index in reversed(range(RANK_WIDTH)):
+        if digits[index] != DIGITS[0]:
+            digits[index] = DIGITS[_VALUE[digits[index]] - 1]
+            lower = "".join(digits[:index + 1]).ljust(RANK_WIDTH, DIGITS[-1]).rstrip(DIGITS[0])
+            if lower:
+                return lower
+            break  # would be 0 itself; "" is not a rank
+    return _midpoint("", rank)
+
+
+def rank_between(low: Optional[str], high: Optional[str]) -> str:
+    """Rank strictly between two neighbours; None means the column end"""
+    if low is None and high is None:
+        return FIRST_RANK
+    if high is None:
+        return rank_after(low)
+    if low is None:
+        return rank_before(high)
+    if low >= high:
+        raise ValueError(f"Ranks out of order: {low!r} >= {high!r}")
+    return _midpoint(low, high)
+
+
+def spaced_ranks(count: int) -> Iterator[str]:
+    """``count`` ascending ranks spread evenly, leaving room between each pair"""
+    width = max(RANK_WIDTH, math.ceil(math.log(max(count + 1, 2) * BASE, BASE)))
+    step = BASE ** width // (count + 1)
+    for position in range(1, count + 1):
+        value = position * step
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        yield "".join(reversed(digits)).rstrip(DIGITS[0])
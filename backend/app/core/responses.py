@@ -0,0 +1,54 @@
+"""
+orjson-backed JSON responses that understand BSON types
+
+FastAPI normally walks a returned dict with ``jsonable_encoder`` and then
+``json.dumps`` it. BSONJSONResponse encodes in a single orjson pass,
+handling datetimes natively and ObjectIds through ``default``; endpoints
+that return it directly (see ``bson_response``) skip ``jsonable_encoder``
+entirely, so Mongo documents go from driver to bytes without being copied
+into JSON-safe structures first.
+"""
+from typing import Any, Dict, Optional
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from starlette.responses import Response
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode to JSON bytes; ObjectIds become strings, naive datetimes stay offset-free"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class BSONJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def document_view(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """API shape of a stored document: ``_id`` exposed as ``id``
+
+    Returns a new shallow dict and leaves ``doc`` untouched; nested values
+    are encoded as-is by BSONJSONResponse.
+    """
+    view = {"id": doc["_id"]} if "_id" in doc else {}
+    view.update((key, value) for key, value in doc.items() if key != "_id")
+    return view
+
+
+def bson_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> BSONJSONResponse:
+    """Return ``content`` encoded by orjson, bypassing jsonable_encoder
+
+    Headers already set on the endpoint's injected ``response`` (e.g. ETag)
+    are carried over, since FastAPI only merges them into non-Response
+    return values.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return BSONJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,128 @@
+"""
+Write-time schema for tenant documents
+
+Timestamps and due dates used to be stored as a mix of ISO strings and BSON
+dates, which breaks range queries (a string never compares $lt a date) and
+keeps them off the (organization_id, due_date) style indexes. References to
+organizations, projects and users were stored as 24-character hex strings,
+which doubles the size of every index they lead.
+
+Every task, project, membership and invitation write goes through the
+helpers below so dates are always naive-UTC BSON dates and references are
+always native ObjectIds (or absent/None). ``public_document`` is the read
+side: it turns ObjectIds back into strings for API responses.
+"""
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from bson import ObjectId
+
+TASK_DATE_FIELDS = ("created_at", "updated_at", "completed_at", "due_date")
+PROJECT_DATE_FIELDS = ("created_at", "updated_at", "start_date", "end_date")
+
+TASK_REFERENCE_FIELDS = ("organization_id", "project_id", "assigned_to", "assignee_id", "created_by")
+PROJECT_REFERENCE_FIELDS = ("organization_id", "owner_id")
+MEMBER_REFERENCE_FIELDS = ("organization_id", "user_id")
+INVITATION_REFERENCE_FIELDS = ("organization_id", "invited_by")
+
+
+class InvalidDocument(ValueError):
+    """Raised when a field can't be coerced to its schema type"""
+
+    def __init__(self, field: str, value: Any, expected: str = "date"):
+        super().__init__(f"Invalid {expected} for {field}: {value!r}")
+        self.field = field
+        self.value = value
+
+
+def coerce_datetime(value: Any, field: str = "value") -> Optional[datetime]:
+    """Convert ISO strings, dates and aware datetimes to a naive UTC datetime
+
+    Empty strings become None, which is what clients send for cleared dates.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        try:
+            return coerce_datetime(datetime.fromisoformat(text.replace("Z", "+00:00")), field)
+        except ValueError:
+            raise InvalidDocument(field, value)
+    raise InvalidDocument(field, value)
+
+
+def coerce_object_id(value: Any, field: str = "value") -> Optional[ObjectId]:
+    """Convert a hex string reference to an ObjectId; empty values become None"""
+    if value is None or isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        if ObjectId.is_valid(text):
+            return ObjectId(text)
+    raise InvalidDocument(field, value, expected="id")
+
+
+def object_id(value: Any, field: str = "id") -> ObjectId:
+    """Like coerce_object_id, for lookups where the reference is required"""
+    oid = coerce_object_id(value, field)
+    if oid is None:
+        raise InvalidDocument(field, value, expected="id")
+    return oid
+
+
+def coerce_dates(doc: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Coerce the given date fields of a document in place and return it"""
+    for field in fields:
+        if field in doc:
+            doc[field] = coerce_datetime(doc[field], field)
+    return doc
+
+
+def coerce_references(doc: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Coerce the given reference fields of a document in place and return it"""
+    for field in fields:
+        if field in doc:
+            doc[field] = coerce_object_id(doc[field], field)
+    return doc
+
+
+def task_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a task document (or $set payload) before writing it"""
+    return coerce_references(coerce_dates(doc, TASK_DATE_FIELDS), TASK_REFERENCE_FIELDS)
+
+
+def project_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a project document (or $set payload) before writing it"""
+    return coerce_references(coerce_dates(doc, PROJECT_DATE_FIELDS), PROJECT_REFERENCE_FIELDS)
+
+
+def member_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an organization membership before writing it"""
+    return coerce_references(doc, MEMBER_REFERENCE_FIELDS)
+
+
+def invitation_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an invitation before writing it"""
+    return coerce_references(doc, INVITATION_REFERENCE_FIELDS)
+
+
+def public_document(doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Rename _id to id and render top-level ObjectId references as strings"""
+    if not doc:
+        return doc
+    if "_id" in doc:
+        doc["id"] = doc.pop("_id")
+    for field, value in doc.items():
+        if isinstance(value, ObjectId):
+            doc[field] = str(value)
+    return doc
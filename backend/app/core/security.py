@@ -1,11 +1,8 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
 from jose import jwt, JWTError
 from app.core.config import settings
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.hashing import password_hasher
 
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None):
@@ -40,14 +37,14 @@ def verify_token(token: str):
         return None
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (off the event loop)"""
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    """Hash a password (off the event loop)"""
+    return await password_hasher.hash(password)
 
 
 def create_email_token(email: str):
@@ -0,0 +1,63 @@
+"""
+Task and project status vocabulary shared by the API servers
+
+Statuses are normalized when written so that every read can filter with an
+exact, index-covered equality match instead of case-insensitive regexes or
+``$in`` lists of alternative spellings.
+"""
+import re
+from typing import Optional
+
+TASK_STATUS_TODO = "todo"
+TASK_STATUS_DONE = "done"
+TASK_STATUSES = [TASK_STATUS_TODO, "in_progress", "review", TASK_STATUS_DONE]
+
+PROJECT_STATUS_ACTIVE = "active"
+PROJECT_STATUS_COMPLETED = "completed"
+PROJECT_STATUSES = ["planning", PROJECT_STATUS_ACTIVE, "on-hold", PROJECT_STATUS_COMPLETED, "archived"]
+
+# Alternative spellings seen in stored data, keyed by their compacted form
+_TASK_STATUS_ALIASES = {
+    "todo": TASK_STATUS_TODO,
+    "inprogress": "in_progress",
+    "doing": "in_progress",
+    "inreview": "review",
+    "review": "review",
+    "done": TASK_STATUS_DONE,
+    "completed": TASK_STATUS_DONE,
+    "complete": TASK_STATUS_DONE,
+}
+
+_PROJECT_STATUS_ALIASES = {
+    "planning": "planning",
+    "active": PROJECT_STATUS_ACTIVE,
+    "onhold": "on-hold",
+    "completed": PROJECT_STATUS_COMPLETED,
+    "complete": PROJECT_STATUS_COMPLETED,
+    "done": PROJECT_STATUS_COMPLETED,
+    "archived": "archived",
+}
+
+
+def _compact(status: str) -> str:
+    return re.sub(r"[\s_\-]+", "", status.strip().lower())
+
+
+def normalize_task_status(status: Optional[str]) -> Optional[str]:
+    """Canonical task status, e.g. "Completed" -> "done", "In Progress" -> "in_progress"
+
+    Unknown values are kept, lowercased and trimmed, so custom columns survive.
+    """
+    if status is None:
+        return None
+    return _TASK_STATUS_ALIASES.get(_compact(status), status.strip().lower())
+
+
+def normalize_project_status(status: Optional[str]) -> Optional[str]:
+    """Canonical project status, e.g. "Active" -> "active", "on_hold" -> "on-hold"
+
+    Unknown values are kept, lowercased and trimmed.
+    """
+    if status is None:
+        return None
+    return _PROJECT_STATUS_ALIASES.get(_compact(status), status.strip().lower())
@@ -1,10 +1,13 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import socketio
 
 from app.core.config import settings
 from app.core.database import connect_to_mongo, close_mongo_connection
+from app.core.hashing import password_hasher, PasswordHasherBusy
+from app.core.compression import CompressionMiddleware
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
 from app.api.projects import router as projects_router
@@ -28,6 +31,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     await close_mongo_connection()
+    password_hasher.shutdown()
 
 
 # Create FastAPI instance
@@ -47,6 +51,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        level=settings.COMPRESSION_LEVEL,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        streaming=settings.COMPRESSION_STREAMING,
+        exclude_paths=settings.COMPRESSION_EXCLUDE_PATHS
+    )
+
 # Include routers
 app.include_router(auth_router, prefix="/api/auth", tags=["authentication"])
 app.include_router(users_router, prefix="/api/users", tags=["users"])
@@ -65,6 +79,20 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    return {"password_hashing": password_hasher.metrics()}
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Socket.IO event handlers
 @sio.event
 async def connect(sid, environ):
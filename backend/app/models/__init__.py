@@ -175,14 +175,16 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
     assignee_id: Optional[str] = None
     tags: Optional[List[str]] = None
-    position: Optional[int] = None
+    # Neighbours in the target column; see app.services.rank_service
+    after_id: Optional[str] = None
+    before_id: Optional[str] = None
 
 
 class TaskInDB(BaseDocument, TaskBase):
     project_id: PyObjectId
     assignee_id: Optional[PyObjectId] = None
     status: TaskStatus = TaskStatus.TODO
-    position: int = 0
+    rank: Optional[str] = None
     created_by: PyObjectId
     subtasks: List[Subtask] = []
 
@@ -191,7 +193,7 @@ class Task(BaseDocument, TaskBase):
     project_id: str
     assignee_id: Optional[str] = None
     status: TaskStatus = TaskStatus.TODO
-    position: int = 0
+    rank: Optional[str] = None
     created_by: str
     subtasks: List[Subtask] = []
 
@@ -2,11 +2,12 @@
 SaaS Authentication & Authorization Service
 """
 import jwt
-import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.models.saas import User, Organization, OrganizationMember, UserRole, PlanType
+from app.core.hashing import password_hasher
+from app.core.schema import member_document, object_id
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi import Depends
@@ -23,14 +24,13 @@ class AuthService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
     
-    def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    async def hash_password(self, password: str) -> str:
+        """Hash a password using bcrypt on the hashing worker pool"""
+        return await password_hasher.hash(password)
     
-    def verify_password(self, password: str, hashed: str) -> bool:
-        """Verify a password against its hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    async def verify_password(self, password: str, hashed: str) -> bool:
+        """Verify a password against its hash on the hashing worker pool"""
+        return await password_hasher.verify(password, hashed)
     
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token"""
@@ -74,12 +74,12 @@ class AuthService:
         if not user:
             return None
         
-        if not self.verify_password(password, user["password_hash"]):
+        if not await self.verify_password(password, user["password_hash"]):
             return None
         
         # Get user's organizations
         memberships = await self.db.organization_members.find(
-            {"user_id": str(user["_id"])}
+            {"user_id": user["_id"]}
         ).to_list(length=100)
         
         organizations = []
@@ -128,7 +128,7 @@ class AuthService:
             "email": email,
             "first_name": first_name,
             "last_name": last_name,
-            "password_hash": self.hash_password(password),
+            "password_hash": await self.hash_password(password),
             "is_verified": False,
             "is_active": True,
             "created_at": datetime.utcnow().isoformat(),
@@ -154,13 +154,13 @@ class AuthService:
         org_id = str(org_result.inserted_id)
         
         # Add user as owner of the organization
-        membership_doc = {
+        membership_doc = member_document({
             "organization_id": org_id,
             "user_id": user_id,
             "role": UserRole.OWNER.value,
             "joined_at": datetime.utcnow().isoformat(),
             "created_at": datetime.utcnow().isoformat()
-        }
+        })
         
         await self.db.organization_members.insert_one(membership_doc)
         
@@ -215,8 +215,8 @@ class AuthService:
                                           required_role: UserRole = UserRole.MEMBER) -> bool:
         """Check if user has required permission in organization"""
         membership = await self.db.organization_members.find_one({
-            "user_id": user_id,
-            "organization_id": org_id
+            "user_id": object_id(user_id, "user_id"),
+            "organization_id": object_id(org_id, "organization_id")
         })
         
         if not membership:
@@ -0,0 +1,73 @@
+"""
+Kanban board reads
+
+The first paint of a board is one aggregation: the project's tasks are
+read in (status, rank, _id) order from the (project_id, status, rank, _id)
+index, projected down to the card fields, and a ``$facet`` cuts that
+stream into one capped page per status column plus per-column counts.
+Each column carries its own cursor; further pages of a single column are
+plain keyset queries on the same index (see ``column_page``).
+"""
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.pagination import ASCENDING, encode_cursor, fetch_page, page_limit
+from app.core.statuses import TASK_STATUSES
+
+
+class BoardService:
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+
+    async def columns(self, project_id: ObjectId, limit: Optional[int] = None,
+                      projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Every column with its count, first page of cards and next-page cursor
+
+        Columns follow TASK_STATUSES; statuses outside it are appended with
+        their counts and no cards, to be fetched through ``column_page``.
+        """
+        limit = page_limit(limit)
+        facets = {
+            f"column_{index}": [{"$match": {"status": status}}, {"$limit": limit + 1}]
+            for index, status in enumerate(TASK_STATUSES)
+        }
+        facets["counts"] = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+
+        pipeline = [
+            {"$match": {"project_id": project_id}},
+            {"$sort": {"status": 1, "rank": 1, "_id": 1}},
+        ]
+        if projection:
+            pipeline.append({"$project": {**projection, "status": 1, "rank": 1}})
+        pipeline.append({"$facet": facets})
+
+        result = (await self.db.tasks.aggregate(pipeline).to_list(length=1))[0]
+        counts = {entry["_id"]: entry["count"] for entry in result["counts"]}
+
+        columns = []
+        for index, status in enumerate(TASK_STATUSES):
+            tasks = result[f"column_{index}"]
+            next_cursor = None
+            if len(tasks) > limit:
+                tasks = tasks[:limit]
+                next_cursor = encode_cursor(tasks[-1], "rank")
+            columns.append({"status": status, "count": counts.get(status, 0), "tasks": tasks, "next_cursor": next_cursor})
+
+        for status, count in counts.items():
+            if status not in TASK_STATUSES:
+                columns.append({"status": status, "count": count, "tasks": [], "next_cursor": None})
+        return columns
+
+    async def column_page(self, project_id: ObjectId, status: str, cursor: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          projection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """One page of a single column, continuing from its cursor"""
+        query = {"project_id": project_id, "status": status}
+        tasks, next_cursor = await fetch_page(
+            self.db.tasks, query, cursor=cursor, limit=limit, direction=ASCENDING,
+            projection=projection, sort_field="rank"
+        )
+        count = await self.db.tasks.count_documents(query)
+        return {"status": status, "count": count, "tasks": tasks, "next_cursor": next_cursor}
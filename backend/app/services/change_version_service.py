@@ -0,0 +1,136 @@
+"""
+Per-organization change versions
+
+Every write to an organization's data bumps a counter in ``org_versions``
+(keyed by the organization ObjectId). GET endpoints expose the committed
+version (see below) as an ETag, so a poll whose If-None-Match still matches can be answered with
+304 before any data is read. Versions are cached per process with a short
+TTL: writes handled here update the cache once they have finished, and the
+TTL bounds how long another worker's write can go unnoticed.
+
+Writes that stamp documents with their version (``change_seq``, see
+SyncService) take it through ``write``, which lists the version as pending
+on the counter document until the write has finished. A version handed out
+is not yet a version committed: ``committed`` stops just below the lowest
+pending one, so a sync token never moves past a write still in flight and
+an ETag never names data that is still being written.
+Pending entries older than CHANGE_WRITE_TIMEOUT_SECONDS belong to a writer
+that died mid-write and stop holding tokens back.
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.schema import object_id
+
+
+class ChangeVersionService:
+    def __init__(self, db: AsyncIOMotorDatabase, cache: Optional[TTLCache] = None):
+        self.collection = db.org_versions
+        self.cache = cache
+
+    async def bump(self, org_id: str) -> int:
+        """Increment and return the organization's version"""
+        doc = await self.collection.find_one_and_update(
+            {"_id": object_id(org_id)},
+            {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+            projection={"version": 1, "pending": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self._cache_committed(org_id, doc)
+        return doc["version"]
+
+    @staticmethod
+    def _live_pending(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.CHANGE_WRITE_TIMEOUT_SECONDS)
+        return [entry for entry in doc.get("pending", []) if entry["at"] >= cutoff]
+
+    @classmethod
+    def _committed(cls, doc: Optional[Dict[str, Any]]) -> int:
+        if not doc:
+            return 0
+        pending = cls._live_pending(doc)
+        if pending:
+            return min(entry["seq"] for entry in pending) - 1
+        return doc["version"]
+
+    def _cache_committed(self, org_id: str, doc: Optional[Dict[str, Any]]) -> int:
+        version = self._committed(doc)
+        if self.cache is not None:
+            # A request holding an older view may finish last; never move backwards
+            version = max(version, self.cache.get(str(org_id)) or 0)
+            self.cache.set(str(org_id), version)
+        return version
+
+    async def _acquire(self, org_id: str) -> int:
+        """Increment the version and list it as pending in the same update
+
+        Compare-and-swap on the version, so the pending list is always
+        rewritten from the state it was read in (dropping expired entries).
+        """
+        org_oid = object_id(org_id)
+        while True:
+            doc = await self.collection.find_one({"_id": org_oid}, {"version": 1, "pending": 1}) or {}
+            version = doc.get("version", 0) + 1
+            now = datetime.utcnow()
+            pending = self._live_pending(doc) + [{"seq": version, "at": now}]
+            query = {"_id": org_oid, "version": doc["version"]} if doc else {"_id": org_oid, "version": {"$exists": False}}
+            try:
+                # On a lost race the query misses and the upsert hits the existing _id
+                await self.collection.update_one(
+                    query, {"$set": {"version": version, "pending": pending, "updated_at": now}}, upsert=True
+                )
+                break
+            except DuplicateKeyError:  # another write took this version first
+                continue
+        return version
+
+    @asynccontextmanager
+    async def write(self, org_id: str) -> AsyncIterator[int]:
+        """Bump the version for a write, keeping it pending until the block exits
+
+        The cached version only moves once the write is done, so ETags
+        handed out meanwhile still name the data from before it.
+        """
+        seq = await self._acquire(org_id)
+        try:
+            yield seq
+        finally:
+            doc = await self.collection.find_one_and_update(
+                {"_id": object_id(org_id)},
+                {"$pull": {"pending": {"seq": seq}}},
+                projection={"version": 1, "pending": 1},
+                return_document=ReturnDocument.AFTER
+            )
+            self._cache_committed(org_id, doc)
+
+    async def committed(self, org_id: str) -> int:
+        """Highest version at or below which every write has finished
+
+        Always read from the database, for sync tokens that must not skip
+        another worker's write.
+        """
+        doc = await self.collection.find_one({"_id": object_id(org_id)}, {"version": 1, "pending": 1})
+        return self._cache_committed(org_id, doc)
+
+    async def current(self, org_id: str) -> int:
+        """The committed version for ETags, cached; 0 if nothing has been written yet"""
+        if self.cache is not None:
+            version = self.cache.get(str(org_id))
+            if version is not None:
+                return version
+
+        doc = await self.collection.find_one({"_id": object_id(org_id)}, {"version": 1, "pending": 1})
+        return self._cache_committed(org_id, doc)
+
+    async def delete(self, org_id: str):
+        await self.collection.delete_one({"_id": object_id(org_id)})
+        if self.cache is not None:
+            self.cache.invalidate(str(org_id))
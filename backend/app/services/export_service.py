@@ -0,0 +1,138 @@
+"""
+Streaming exports of organization data
+
+Documents are read from a Motor cursor in fixed-size batches and each batch
+is encoded and yielded before the next one is fetched, so memory use is
+bounded by the batch size no matter how large the organization is.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Exported columns per collection, in CSV column order
+EXPORT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "tasks": (
+        "id", "project_id", "title", "description", "status", "priority", "assigned_to",
+        "created_by", "due_date", "tags", "created_at", "updated_at", "completed_at",
+    ),
+    "projects": (
+        "id", "name", "description", "status", "owner_id", "start_date", "end_date",
+        "created_at", "updated_at",
+    ),
+    "members": (
+        "user_id", "email", "first_name", "last_name", "role", "joined_at",
+    ),
+}
+
+# Source collection for each export, when it differs from the export name
+_SOURCE_COLLECTIONS = {"members": "organization_members"}
+# Stored fields to read, when not simply the exported ones (members join users)
+_SOURCE_FIELDS = {"members": ("user_id", "role", "joined_at")}
+# Export order, chosen to walk an existing (organization_id, created_at, _id)
+# index instead of sorting in memory; members are few and need no order
+_SORTS = {
+    "tasks": [("created_at", 1), ("_id", 1)],
+    "projects": [("created_at", 1), ("_id", 1)],
+}
+
+
+def _plain(value: Any) -> Any:
+    """JSON/CSV-friendly representation of a BSON value"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class ExportService:
+    def __init__(self, db: AsyncIOMotorDatabase, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+
+    async def _batches(self, collection: str, org_id: ObjectId) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Raw documents of one organization, ``batch_size`` at a time"""
+        fields = _SOURCE_FIELDS.get(collection, EXPORT_FIELDS[collection])
+        projection = {field: 1 for field in fields if field != "id"}
+
+        cursor = self.db[_SOURCE_COLLECTIONS.get(collection, collection)] \
+            .find({"organization_id": org_id}, projection) \
+            .batch_size(self.batch_size)
+        if collection in _SORTS:
+            cursor = cursor.sort(_SORTS[collection])
+
+        batch = []
+        async for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _with_users(self, memberships: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach user name and email with one query per batch"""
+        user_ids = [membership["user_id"] for membership in memberships]
+        users = {}
+        async for user in self.db.users.find(
+            {"_id": {"$in": user_ids}}, {"email": 1, "first_name": 1, "last_name": 1}
+        ):
+            users[user["_id"]] = user
+
+        rows = []
+        for membership in memberships:
+            user = users.get(membership["user_id"], {})
+            rows.append({
+                **membership,
+                "email": user.get("email"),
+                "first_name": user.get("first_name"),
+                "last_name": user.get("last_name"),
+            })
+        return rows
+
+    async def rows(self, collection: str, org_id: ObjectId) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Batches of export rows restricted to the exported fields"""
+        fields = EXPORT_FIELDS[collection]
+        async for batch in self._batches(collection, org_id):
+            if collection == "members":
+                batch = await self._with_users(batch)
+            yield [
+                {field: _plain(doc.get("_id") if field == "id" else doc.get(field)) for field in fields}
+                for doc in batch
+            ]
+
+    async def stream(self, collection: str, org_id: ObjectId, export_format: str) -> AsyncIterator[str]:
+        """Encoded export, one chunk per batch (plus the CSV header)"""
+        if export_format == "csv":
+            fields = EXPORT_FIELDS[collection]
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            yield buffer.getvalue()
+
+            async for batch in self.rows(collection, org_id):
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row in batch:
+                    writer.writerow([
+                        ";".join(map(str, value)) if isinstance(value, list) else value
+                        for value in (row[field] for field in fields)
+                    ])
+                yield buffer.getvalue()
+        else:
+            async for batch in self.rows(collection, org_id):
+                yield "".join(json.dumps(row) + "\n" for row in batch)
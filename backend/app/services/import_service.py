@@ -0,0 +1,165 @@
+"""
+Streaming task imports from CSV or NDJSON
+
+The upload is consumed chunk by chunk from the request body and decoded
+into rows as it arrives; rows are handed on ``batch_size`` at a time and
+inserted with ``insert_many(ordered=False)``, so memory use is bounded by
+the batch size no matter how large the file is. The CSV columns are the
+task export's (see EXPORT_FIELDS), so an export can be imported back.
+
+Every import is recorded in ``task_imports`` and its counters are updated
+after each batch, which is what clients poll for progress.
+"""
+import codecs
+import csv
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError
+
+from app.core.config import settings
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# A decoded row: (row number, fields) or (row number, error message); rows
+# are numbered from 1, not counting the CSV header
+Row = Tuple[int, Any]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines (with their newlines), tolerating a BOM"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Complete CSV records; a quoted field may span several lines"""
+    record = ""
+    async for line in _lines(chunks):
+        record += line
+        # Quotes inside quoted fields are doubled, so an odd count means
+        # the record continues on the next line
+        if record.count('"') % 2 == 0:
+            yield record
+            record = ""
+    if record:
+        yield record
+
+
+class ImportService:
+    def __init__(self, db: AsyncIOMotorDatabase, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+
+    async def _csv_batches(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[List[Row]]:
+        header = None
+        records = []
+        number = 0
+
+        def parse(records: List[str]) -> List[Row]:
+            nonlocal number
+            rows = []
+            for record in csv.reader(records):
+                number += 1
+                if not any(value.strip() for value in record):
+                    continue
+                if len(record) > len(header):
+                    rows.append((number, f"Expected {len(header)} columns, got {len(record)}"))
+                else:
+                    rows.append((number, dict(zip(header, record))))
+            return rows
+
+        async for record in _csv_records(chunks):
+            if header is None:
+                header = [column.strip() for column in next(csv.reader([record]), [])]
+                continue
+            records.append(record)
+            if len(records) >= self.batch_size:
+                yield parse(records)
+                records = []
+        if records:
+            yield parse(records)
+
+    async def _ndjson_batches(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[List[Row]]:
+        rows = []
+        number = 0
+        async for line in _lines(chunks):
+            number += 1
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError as e:
+                rows.append((number, f"Invalid JSON: {e}"))
+            else:
+                rows.append((number, value) if isinstance(value, dict) else (number, "Expected a JSON object"))
+            if len(rows) >= self.batch_size:
+                yield rows
+                rows = []
+        if rows:
+            yield rows
+
+    def batches(self, chunks: AsyncIterator[bytes], import_format: str) -> AsyncIterator[List[Row]]:
+        """Rows of the upload, ``batch_size`` at a time; bad rows carry an error message"""
+        if import_format == "csv":
+            return self._csv_batches(chunks)
+        return self._ndjson_batches(chunks)
+
+    async def insert(self, docs: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Insert one batch, continuing past failures; returns errors by batch index"""
+        if not docs:
+            return {}
+        try:
+            await self.db.tasks.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            return {error["index"]: error.get("errmsg", "Write failed") for error in e.details["writeErrors"]}
+        return {}
+
+    async def start(self, org_id: ObjectId, project_id: ObjectId, user_id: str, import_format: str) -> ObjectId:
+        result = await self.db.task_imports.insert_one({
+            "organization_id": org_id,
+            "project_id": project_id,
+            "created_by": ObjectId(user_id),
+            "format": import_format,
+            "status": "running",
+            "rows": 0,
+            "inserted": 0,
+            "failed": 0,
+            "errors": [],
+            "started_at": datetime.utcnow()
+        })
+        return result.inserted_id
+
+    async def progress(self, import_id: ObjectId, rows: int, inserted: int, errors: List[Dict[str, Any]]):
+        """Add one batch's counts; only the first IMPORT_MAX_ERRORS errors are kept"""
+        await self.db.task_imports.update_one(
+            {"_id": import_id},
+            {
+                "$inc": {"rows": rows, "inserted": inserted, "failed": len(errors)},
+                "$push": {"errors": {"$each": errors, "$slice": settings.IMPORT_MAX_ERRORS}}
+            }
+        )
+
+    async def finish(self, import_id: ObjectId, status: str = "completed") -> Dict[str, Any]:
+        await self.db.task_imports.update_one(
+            {"_id": import_id},
+            {"$set": {"status": status, "finished_at": datetime.utcnow()}}
+        )
+        return await self.db.task_imports.find_one({"_id": import_id})
+
+    async def recent(self, org_id: ObjectId, limit: int = 20) -> List[Dict[str, Any]]:
+        return await self.db.task_imports.find({"organization_id": org_id}, {"errors": 0}) \
+            .sort("started_at", -1) \
+            .limit(limit) \
+            .to_list(length=limit)
@@ -0,0 +1,99 @@
+"""
+Per-organization counters
+
+Each organization has one document in ``org_stats`` (keyed by the
+organization's ObjectId) holding project, task and member counts. Write paths
+adjust it with ``$inc`` so dashboards and billing can read usage with a
+single ``_id`` lookup instead of recounting the source collections.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.schema import object_id
+from app.core.statuses import TASK_STATUS_DONE
+
+
+def status_key(status: Optional[str]) -> str:
+    """Field-name-safe, case-insensitive key for a project status"""
+    return (status or "").strip().lower().replace(".", "_").replace("$", "_")
+
+
+class OrgStatsService:
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db.org_stats
+
+    async def increment(self, org_id: str, **deltas: int):
+        """Atomically apply counter deltas, e.g. increment(org_id, tasks=1)
+
+        Nested counters use dotted names via a dict, e.g.
+        ``increment(org_id, **{"projects_by_status.active": 1})``.
+        Missing documents are left alone: they are rebuilt from the source
+        collections on the next read, so a partial counter is never created.
+        """
+        deltas = {field: value for field, value in deltas.items() if value}
+        if not deltas:
+            return
+        await self.collection.update_one(
+            {"_id": object_id(org_id)},
+            {"$inc": deltas, "$set": {"updated_at": datetime.utcnow()}}
+        )
+
+    async def project_status_changed(self, org_id: str, old_status: Optional[str], new_status: Optional[str]):
+        """Move one project between status buckets"""
+        old_key, new_key = status_key(old_status), status_key(new_status)
+        if old_key == new_key:
+            return
+        await self.increment(org_id, **{
+            f"projects_by_status.{old_key}": -1,
+            f"projects_by_status.{new_key}": 1
+        })
+
+    async def get(self, org_id: str) -> Dict[str, Any]:
+        """Return the counters, rebuilding them if the document is missing"""
+        stats = await self.collection.find_one({"_id": object_id(org_id)})
+        if stats is None:
+            stats = await self.recompute(org_id)
+        return stats
+
+    async def recompute(self, org_id: str) -> Dict[str, Any]:
+        """Recount everything from the source collections and store it"""
+        org_id = object_id(org_id)
+        pipeline = [
+            {"$match": {"organization_id": org_id}},
+            {"$group": {
+                "_id": None,
+                "tasks": {"$sum": 1},
+                "completed_tasks": {"$sum": {
+                    "$cond": [{"$eq": ["$status", TASK_STATUS_DONE]}, 1, 0]
+                }}
+            }}
+        ]
+        task_totals = await self.db.tasks.aggregate(pipeline).to_list(length=1)
+        task_totals = task_totals[0] if task_totals else {}
+
+        projects_by_status: Dict[str, int] = {}
+        status_pipeline = [
+            {"$match": {"organization_id": org_id}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ]
+        async for bucket in self.db.projects.aggregate(status_pipeline):
+            key = status_key(bucket["_id"])
+            projects_by_status[key] = projects_by_status.get(key, 0) + bucket["count"]
+
+        stats = {
+            "_id": org_id,
+            "projects": sum(projects_by_status.values()),
+            "projects_by_status": projects_by_status,
+            "tasks": task_totals.get("tasks", 0),
+            "completed_tasks": task_totals.get("completed_tasks", 0),
+            "members": await self.db.organization_members.count_documents({"organization_id": org_id}),
+            "updated_at": datetime.utcnow()
+        }
+        await self.collection.replace_one({"_id": org_id}, stats, upsert=True)
+        return stats
+
+    async def delete(self, org_id: str):
+        await self.collection.delete_one({"_id": object_id(org_id)})
@@ -0,0 +1,149 @@
+"""
+Card ordering within board columns
+
+Tasks carry a fractional ``rank`` (see app.core.ranking) ordering them
+within their (project_id, status) column, served by the
+(project_id, status, rank, _id) index. Placing a card reads at most its two
+neighbours and the caller writes only the card itself. Ranks that have
+grown past RANK_REBALANCE_LENGTH characters trigger a rebalance, which
+rewrites the whole column with evenly spaced ranks in its current order.
+
+Some columns cannot take a move until they are rebalanced: neighbours
+with equal ranks (two concurrent appends read the same tail) have no rank
+between them, and tasks from before ranks existed have none at all.
+Placing against those raises RankRebalanceNeeded instead of rewriting the
+column in the middle of the caller's request; the caller schedules the
+rebalance and the move can be retried once it has run.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.ranking import rank_between, spaced_ranks
+
+REBALANCE_BATCH_SIZE = 1000
+
+# Column order: legacy tasks without a rank sort first, in creation order
+COLUMN_SORT = [("rank", 1), ("created_at", 1), ("_id", 1)]
+
+
+class RankConflict(Exception):
+    """The neighbours given for a move are not adjacent in that order"""
+
+
+class RankRebalanceNeeded(RankConflict):
+    """The move's neighbours leave no room between them until the column is rebalanced"""
+
+    def __init__(self, project_id: ObjectId, status: Optional[str]):
+        super().__init__("The column is being reordered, retry the move")
+        self.project_id = project_id
+        self.status = status
+
+
+def needs_rebalance(rank: Optional[str]) -> bool:
+    return rank is not None and len(rank) > settings.RANK_REBALANCE_LENGTH
+
+
+class RankService:
+    """Computes ranks for one request; remembers the ranks it hands out so
+    several placements in the same batch see each other before they are written"""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self._tails: Dict[Tuple[ObjectId, Optional[str]], Optional[str]] = {}
+        self._ranks: Dict[ObjectId, str] = {}
+
+    async def _tail(self, project_id: ObjectId, status: Optional[str]) -> Optional[str]:
+        key = (project_id, status)
+        if key not in self._tails:
+            last = await self.db.tasks.find_one(
+                {"project_id": project_id, "status": status, "rank": {"$ne": None}},
+                {"rank": 1},
+                sort=[("rank", -1), ("_id", -1)]
+            )
+            self._tails[key] = last["rank"] if last else None
+        return self._tails[key]
+
+    async def _neighbour_ranks(self, project_id: ObjectId, status: Optional[str],
+                               task_ids: List[ObjectId]) -> Dict[ObjectId, str]:
+        """Current ranks of the neighbours of a move, read in one query"""
+        ranks = {task_id: self._ranks[task_id] for task_id in task_ids if task_id in self._ranks}
+        missing = [task_id for task_id in task_ids if task_id not in ranks]
+        if not missing:
+            return ranks
+
+        found = {}
+        async for task in self.db.tasks.find(
+            {"_id": {"$in": missing}, "project_id": project_id, "status": status}, {"rank": 1}
+        ):
+            found[task["_id"]] = task.get("rank")
+        for task_id in missing:
+            if task_id not in found:
+                raise RankConflict(f"Task {task_id} is not in the target column")
+        if None in found.values():  # column predates ranks
+            raise RankRebalanceNeeded(project_id, status)
+        ranks.update(found)
+        return ranks
+
+    async def place(self, task_id: Optional[ObjectId], project_id: ObjectId, status: Optional[str],
+                    after_id: Optional[ObjectId] = None, before_id: Optional[ObjectId] = None) -> str:
+        """Rank for putting a task after ``after_id`` and/or before ``before_id``
+
+        With neither, the task goes to the end of the column. ``task_id`` is
+        None for tasks that are not inserted yet.
+        """
+        if after_id is None and before_id is None:
+            rank = rank_between(await self._tail(project_id, status), None)
+        else:
+            neighbours = [neighbour for neighbour in (after_id, before_id) if neighbour is not None]
+            ranks = await self._neighbour_ranks(project_id, status, neighbours)
+            if len(ranks) == 2 and ranks[after_id] == ranks[before_id]:
+                raise RankRebalanceNeeded(project_id, status)
+            try:
+                rank = rank_between(ranks.get(after_id), ranks.get(before_id))
+            except ValueError as e:
+                raise RankConflict(str(e))
+
+        key = (project_id, status)
+        if key in self._tails and (self._tails[key] is None or rank > self._tails[key]):
+            self._tails[key] = rank
+        if task_id is not None:
+            self._ranks[task_id] = rank
+        return rank
+
+    async def rebalance(self, project_id: ObjectId, status: Optional[str],
+                        change_seq: Optional[int] = None) -> int:
+        """Rewrite a column's ranks evenly spaced, keeping its order; returns the column size
+
+        ``change_seq`` stamps the rewritten tasks so delta sync clients pick
+        up the new ranks. Ranks computed concurrently from the old values
+        may land out of place; the next move of that card corrects it.
+        """
+        column = {"project_id": project_id, "status": status}
+        count = await self.db.tasks.count_documents(column)
+        ranks = spaced_ranks(count)
+
+        updates = []
+        written = 0
+        async for task in self.db.tasks.find(column, {"_id": 1}).sort(COLUMN_SORT).batch_size(REBALANCE_BATCH_SIZE):
+            rank = next(ranks, None)
+            if rank is None:  # added since counting; keeps the rank it was given
+                break
+            fields: Dict[str, Any] = {"rank": rank}
+            if change_seq is not None:
+                fields["change_seq"] = change_seq
+            updates.append(UpdateOne({"_id": task["_id"]}, {"$set": fields}))
+            self._ranks[task["_id"]] = rank
+            if len(updates) >= REBALANCE_BATCH_SIZE:
+                await self.db.tasks.bulk_write(updates, ordered=False)
+                written += len(updates)
+                updates = []
+        if updates:
+            await self.db.tasks.bulk_write(updates, ordered=False)
+            written += len(updates)
+
+        self._tails.pop((project_id, status), None)
+        return written
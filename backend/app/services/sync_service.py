@@ -0,0 +1,154 @@
+"""
+Delta sync for tasks and projects
+
+Every task and project write is stamped with ``change_seq``, the
+organization's change version (see ChangeVersionService) taken for that
+write, and every delete leaves a tombstone stamped the same way. A sync
+token is a position in the (change_seq, source, _id) order across the
+three sources, so clients can page through exactly what changed since
+their last token using the (organization_id, change_seq, _id) indexes.
+
+A change_seq is taken before its write lands, so pages only reach up to
+the committed version (ChangeVersionService.committed): entries above it
+may still have earlier-numbered writes in flight, and a token past those
+would skip them for good.
+
+Tombstones expire after SYNC_TOMBSTONE_TTL_DAYS; tokens older than that
+are rejected and the client has to reload from the list endpoints.
+"""
+import base64
+import binascii
+import heapq
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId, json_util
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.pagination import page_limit
+from app.core.schema import InvalidDocument, object_id
+
+# Merge order for entries sharing a change_seq; tokens store the index
+SYNC_SOURCES = ("projects", "tasks", "tombstones")
+TOMBSTONE_BATCH_SIZE = 1000
+
+
+class SyncTokenExpired(Exception):
+    """The token predates the tombstone retention window"""
+
+
+def encode_sync_token(seq: int, source: int, last_id: Optional[ObjectId]) -> str:
+    key = json_util.dumps([seq, source, last_id, int(time.time())])
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> Tuple[int, int, Optional[ObjectId], int]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        seq, source, last_id, issued_at = json_util.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidDocument("since", token, expected="sync token")
+    if not isinstance(seq, int) or not isinstance(source, int) or not isinstance(issued_at, int):
+        raise InvalidDocument("since", token, expected="sync token")
+    return seq, source, last_id, issued_at
+
+
+class SyncService:
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+
+    async def record_deletes(self, org_id: str, collection: str, doc_ids: Iterable[ObjectId], seq: int):
+        """Write tombstones for deleted documents, in bounded batches"""
+        org_id = object_id(org_id)
+        now = datetime.utcnow()
+        batch = []
+        for doc_id in doc_ids:
+            batch.append({
+                "organization_id": org_id,
+                "collection": collection,
+                "doc_id": doc_id,
+                "change_seq": seq,
+                "deleted_at": now
+            })
+            if len(batch) >= TOMBSTONE_BATCH_SIZE:
+                await self.db.tombstones.insert_many(batch, ordered=False)
+                batch = []
+        if batch:
+            await self.db.tombstones.insert_many(batch, ordered=False)
+
+    async def record_deletes_matching(self, org_id: str, collection: str, query: Dict[str, Any], seq: int):
+        """Tombstone every document of ``collection`` matching ``query`` before it is deleted"""
+        doc_ids = []
+        async for doc in self.db[collection].find(query, {"_id": 1}).batch_size(TOMBSTONE_BATCH_SIZE):
+            doc_ids.append(doc["_id"])
+            if len(doc_ids) >= TOMBSTONE_BATCH_SIZE:
+                await self.record_deletes(org_id, collection, doc_ids, seq)
+                doc_ids = []
+        await self.record_deletes(org_id, collection, doc_ids, seq)
+
+    @staticmethod
+    def _after(org_id: ObjectId, source: int, position: Tuple[int, int, Optional[ObjectId]],
+               committed: int) -> Dict[str, Any]:
+        """Filter for one source's entries after the token position, up to ``committed``"""
+        seq, token_source, last_id = position
+        if source < token_source:
+            return {"organization_id": org_id, "change_seq": {"$gt": seq, "$lte": committed}}
+        if source > token_source:
+            return {"organization_id": org_id, "change_seq": {"$gte": seq, "$lte": committed}}
+        return {
+            "organization_id": org_id,
+            "change_seq": {"$lte": committed},
+            "$or": [
+                {"change_seq": {"$gt": seq}},
+                {"change_seq": seq, "_id": {"$gt": last_id}}
+            ]
+        }
+
+    async def changes(self, org_id: str, committed: int, since: Optional[str] = None,
+                      limit: Optional[int] = None) -> Dict[str, Any]:
+        """Entries changed after ``since`` up to the ``committed`` version;
+        without a token, just the token for now"""
+        if not since:
+            return {
+                "projects": [], "tasks": [], "deleted": {"projects": [], "tasks": []},
+                "next_token": encode_sync_token(committed, len(SYNC_SOURCES), None),
+                "has_more": False
+            }
+
+        seq, source, last_id, issued_at = decode_sync_token(since)
+        if time.time() - issued_at > settings.SYNC_TOMBSTONE_TTL_DAYS * 86400:
+            raise SyncTokenExpired()
+
+        org_oid = object_id(org_id)
+        limit = page_limit(limit)
+        position = (seq, source, last_id)
+
+        # Each source is read in index order, then merged into one ordering
+        streams: List[List[Tuple[int, int, ObjectId, Dict[str, Any]]]] = []
+        for index, name in enumerate(SYNC_SOURCES):
+            docs = await self.db[name].find(self._after(org_oid, index, position, committed)) \
+                .sort([("change_seq", 1), ("_id", 1)]) \
+                .limit(limit + 1) \
+                .to_list(length=limit + 1)
+            streams.append([(doc["change_seq"], index, doc["_id"], doc) for doc in docs])
+        merged = list(heapq.merge(*streams, key=lambda entry: entry[:3]))
+
+        has_more = len(merged) > limit
+        page = merged[:limit]
+
+        result = {"projects": [], "tasks": [], "deleted": {"projects": [], "tasks": []}}
+        for _, index, _, doc in page:
+            if SYNC_SOURCES[index] == "tombstones":
+                result["deleted"].setdefault(doc["collection"], []).append(str(doc["doc_id"]))
+            else:
+                result[SYNC_SOURCES[index]].append(doc)
+
+        if page:
+            last_seq, last_source, last_doc_id, _ = page[-1]
+            result["next_token"] = encode_sync_token(last_seq, last_source, last_doc_id)
+        else:
+            result["next_token"] = encode_sync_token(seq, source, last_id)
+        result["has_more"] = has_more
+        return result
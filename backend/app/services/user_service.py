@@ -15,7 +15,7 @@ class UserService:
     async def create_user(self, user_data: UserCreate) -> UserInDB:
         """Create a new user"""
         user_dict = user_data.model_dump()
-        user_dict["hashed_password"] = get_password_hash(user_data.password)
+        user_dict["hashed_password"] = await get_password_hash(user_data.password)
         del user_dict["password"]
         user_dict["created_at"] = datetime.utcnow()
         user_dict["updated_at"] = datetime.utcnow()
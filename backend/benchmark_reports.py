@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Report endpoint benchmark
+
+Seeds a throwaway database with organizations of growing size and records,
+for each report endpoint, the number of MongoDB commands issued and the
+wall-clock time. Query counts should stay flat as the organization grows.
+
+Usage:
+    MONGODB_URL=mongodb://localhost:27017 python benchmark_reports.py
+"""
+import asyncio
+import os
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from starlette.requests import Request
+from starlette.responses import Response
+
+import saas_server
+
+BENCH_DATABASE = "project_management_bench"
+PROJECT_COUNTS = [5, 50, 500]
+TASKS_PER_PROJECT = 20
+MEMBERS_PER_PROJECTS = 5  # one member for every five projects
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts commands sent to the server, grouped by command name"""
+
+    def __init__(self):
+        self.commands = Counter()
+
+    def started(self, event):
+        if event.command_name not in ("ping", "endSessions", "getMore"):
+            self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def reset(self):
+        self.commands.clear()
+
+    @property
+    def total(self):
+        return sum(self.commands.values())
+
+
+async def seed_organization(db, project_count: int):
+    """Create an organization with members, projects and tasks"""
+    slug = f"bench-{project_count}"
+    org_id = (await db.organizations.insert_one({
+        "name": f"Bench {project_count}",
+        "slug": slug,
+        "plan_type": "enterprise",
+    })).inserted_id
+
+    member_ids = []
+    for i in range(max(1, project_count // MEMBERS_PER_PROJECTS)):
+        member_ids.append((await db.users.insert_one({
+            "email": f"{slug}-{i}@example.com",
+            "first_name": "Bench",
+            "last_name": f"User {i}",
+            "password_hash": "",
+        })).inserted_id)
+    await db.organization_members.insert_many([
+        {"organization_id": org_id, "user_id": member_id, "role": "owner" if i == 0 else "member"}
+        for i, member_id in enumerate(member_ids)
+    ])
+    user_id = member_ids[0]
+
+    now = datetime.utcnow()
+    projects = [
+        {"_id": ObjectId(), "organization_id": org_id, "name": f"Project {i}", "status": "active", "created_at": now}
+        for i in range(project_count)
+    ]
+    await db.projects.insert_many(projects)
+
+    tasks = []
+    for project in projects:
+        for i in range(TASKS_PER_PROJECT):
+            tasks.append({
+                "organization_id": org_id,
+                "project_id": project["_id"],
+                "title": f"Task {i}",
+                "status": ["todo", "in_progress", "done"][i % 3],
+                "assigned_to": member_ids[i % len(member_ids)],
+                "created_at": now - timedelta(days=i),
+                "updated_at": now,
+                "due_date": now + timedelta(days=i - TASKS_PER_PROJECT // 2),
+            })
+    await db.tasks.insert_many(tasks)
+
+    principal = {"id": str(user_id), "email": f"{slug}-0@example.com", "first_name": "Bench", "last_name": "User 0"}
+    return slug, principal
+
+
+def endpoint_args(endpoint):
+    """Fresh request/response for endpoints that take them (ETag-aware GETs)"""
+    params = endpoint.__code__.co_varnames[:endpoint.__code__.co_argcount]
+    if "request" not in params:
+        return {}
+    return {"request": Request({"type": "http", "headers": []}), "response": Response()}
+
+
+async def run_benchmark():
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(mongodb_url, event_listeners=[counter])
+    await client.drop_database(BENCH_DATABASE)
+    saas_server.db = client[BENCH_DATABASE]
+
+    endpoints = {
+        "reports/projects": saas_server.get_project_reports,
+        "reports/team": saas_server.get_team_reports,
+    }
+
+    try:
+        print(f"{'endpoint':<20} {'projects':>8} {'tasks':>7} {'queries':>8} {'ms':>8}")
+        for project_count in PROJECT_COUNTS:
+            slug, principal = await seed_organization(saas_server.db, project_count)
+            for name, endpoint in endpoints.items():
+                # Warm the org/membership caches so only report queries are counted
+                await endpoint(slug, **endpoint_args(endpoint), current_user=principal)
+                counter.reset()
+
+                started = time.perf_counter()
+                await endpoint(slug, **endpoint_args(endpoint), current_user=principal)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                print(f"{name:<20} {project_count:>8} {project_count * TASKS_PER_PROJECT:>7} "
+                      f"{counter.total:>8} {elapsed_ms:>8.1f}  {dict(counter.commands)}")
+    finally:
+        await client.drop_database(BENCH_DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
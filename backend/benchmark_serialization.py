@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Response serialization benchmark
+
+Compares the old response path for a task list (serialize_document per
+task, jsonable_encoder over the payload, json.dumps via JSONResponse) with
+the orjson path (document_view + BSONJSONResponse) on synthetic 1k and 10k
+task pages. No database is needed.
+
+Usage:
+    python benchmark_serialization.py
+"""
+import copy
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import BSONJSONResponse, document_view
+from app.core.schema import public_document
+
+TASK_COUNTS = [1000, 10000]
+ROUNDS = 5
+
+
+def make_tasks(count: int):
+    org_id, project_id, user_id = ObjectId(), ObjectId(), ObjectId()
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "organization_id": org_id,
+            "project_id": project_id,
+            "title": f"Task {i}",
+            "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+            "status": ["todo", "in_progress", "done"][i % 3],
+            "priority": ["low", "medium", "high"][i % 3],
+            "assigned_to": user_id,
+            "created_by": user_id,
+            "due_date": now + timedelta(days=i % 30),
+            "tags": ["backend", "api"],
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+            "change_seq": i,
+        }
+        for i in range(count)
+    ]
+
+
+def old_path(tasks) -> bytes:
+    # serialize_document mutates, so the old path always worked on fresh driver dicts
+    content = {"success": True, "data": [public_document(task) for task in tasks], "next_cursor": None}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def new_path(tasks) -> bytes:
+    content = {"success": True, "data": [document_view(task) for task in tasks], "next_cursor": None}
+    return BSONJSONResponse(content).body
+
+
+def best_of(path, tasks) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        # Fresh copies outside the timed section, like documents from a cursor
+        batch = copy.deepcopy(tasks)
+        started = time.perf_counter()
+        path(batch)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def run_benchmark():
+    print(f"{'tasks':>7} {'old ms':>9} {'orjson ms':>10} {'speedup':>8} {'bytes':>10}")
+    for count in TASK_COUNTS:
+        tasks = make_tasks(count)
+        old_ms = best_of(old_path, tasks)
+        new_ms = best_of(new_path, tasks)
+        size = len(new_path(copy.deepcopy(tasks)))
+        print(f"{count:>7} {old_ms:>9.1f} {new_ms:>10.1f} {old_ms / new_ms:>7.1f}x {size:>10}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
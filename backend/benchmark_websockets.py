@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+WebSocket broadcast benchmark
+
+Broadcasts a tasks_bulk-sized message (50 tasks) to 1k connections of one
+organization, comparing the old fan-out (json.dumps per connection,
+sequential sends) with WebSocketManager (one encode, concurrent sends with
+a per-connection timeout). Connections are in-memory fakes, so no server
+is needed:
+
+* instant: sends complete immediately, measuring CPU per broadcast
+* 1ms latency: every send takes 1ms, as a client with a busy socket would
+* 1% stalled: ten clients never accept the message; the old fan-out would
+  wait on them indefinitely, so only the new one is measured
+
+Usage:
+    python benchmark_websockets.py
+"""
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from bson import ObjectId
+
+from websocket_manager import WebSocketManager
+
+CONNECTIONS = 1000
+STALLED = 10
+SEND_TIMEOUT = 0.25
+ROUNDS = 5
+
+
+class FakeWebSocket:
+    def __init__(self, latency: float = 0.0, stalled: bool = False):
+        self.latency = latency
+        self.stalled = stalled
+        self.received = 0
+
+    async def send_text(self, text: str):
+        if self.stalled:
+            await asyncio.Event().wait()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received += 1
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def legacy_broadcast(connections, message: dict):
+    """The fan-out WebSocketManager used to do"""
+    disconnected = []
+    for connection in connections:
+        try:
+            await connection.send_text(json.dumps(message))
+        except Exception:
+            disconnected.append(connection)
+    for connection in disconnected:
+        connections.remove(connection)
+
+
+def make_message() -> dict:
+    now = datetime.utcnow().isoformat()
+    task = {
+        "title": "Task", "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "status": "in_progress", "priority": "medium", "tags": ["backend", "api"],
+        "created_at": now, "updated_at": now, "change_seq": 1,
+    }
+    updated = [{"id": str(ObjectId()), "project_id": str(ObjectId()), **task} for _ in range(50)]
+    return {"type": "tasks_bulk", "data": {"created": [], "updated": updated, "deleted": []}, "timestamp": now}
+
+
+async def time_legacy(latency: float, message: dict) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        connections = [FakeWebSocket(latency) for _ in range(CONNECTIONS)]
+        started = time.perf_counter()
+        await legacy_broadcast(connections, message)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def time_manager(latency: float, message: dict, stalled: int = 0):
+    timings = []
+    for _ in range(ROUNDS):
+        manager = WebSocketManager(send_timeout=SEND_TIMEOUT)
+        sockets = [FakeWebSocket(latency) for _ in range(CONNECTIONS - stalled)]
+        sockets += [FakeWebSocket(stalled=True) for _ in range(stalled)]
+        manager.active_connections["org"] = set(sockets)
+        started = time.perf_counter()
+        await manager.broadcast_to_organization(message, "org")
+        timings.append((time.perf_counter() - started) * 1000)
+        remaining = manager.metrics()["connections"]
+    return min(timings), remaining
+
+
+async def run_benchmark():
+    message = make_message()
+    print(f"{CONNECTIONS} connections, {len(json.dumps(message))} byte message, best of {ROUNDS}")
+    print(f"{'scenario':>12} {'old ms':>9} {'new ms':>9} {'speedup':>8} {'kept':>6}")
+    for name, latency in (("instant", 0.0), ("1ms latency", 0.001)):
+        old_ms = await time_legacy(latency, message)
+        new_ms, kept = await time_manager(latency, message)
+        print(f"{name:>12} {old_ms:>9.1f} {new_ms:>9.1f} {old_ms / new_ms:>7.1f}x {kept:>6}")
+    new_ms, kept = await time_manager(0.0, message, stalled=STALLED)
+    print(f"{'1% stalled':>12} {'-':>9} {new_ms:>9.1f} {'-':>8} {kept:>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
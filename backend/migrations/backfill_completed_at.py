@@ -0,0 +1,51 @@
+"""
+Backfill completed_at on finished tasks
+
+Tasks completed before completed_at was tracked get their best available
+completion time: updated_at (parsed when stored as an ISO string), falling
+back to the time of the migration. Safe to run repeatedly; run
+migrations.normalize_statuses first so legacy "completed" tasks are seen.
+
+Usage (from backend/):
+    python -m migrations.backfill_completed_at
+"""
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.statuses import TASK_STATUS_DONE
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+
+async def backfill_completed_at(db) -> int:
+    """Set completed_at on finished tasks that lack it, returns the number updated"""
+    result = await db.tasks.update_many(
+        {
+            "status": TASK_STATUS_DONE,
+            "completed_at": {"$exists": False}
+        },
+        # Update pipeline so the conversion happens server-side in one pass
+        [{"$set": {
+            "completed_at": {"$convert": {
+                "input": "$updated_at",
+                "to": "date",
+                "onError": "$$NOW",
+                "onNull": "$$NOW"
+            }}
+        }}]
+    )
+    return result.modified_count
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    updated = await backfill_completed_at(db)
+    print(f"Backfilled completed_at on {updated} tasks")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
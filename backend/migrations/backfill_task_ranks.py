@@ -0,0 +1,43 @@
+"""
+Give every task a board rank
+
+Tasks created before ranks existed have none. Every (project_id, status)
+column containing such tasks is rebalanced, which ranks the whole column
+in its current order (unranked tasks first, by creation time, then ranked
+ones by rank). Safe to run repeatedly.
+
+Usage (from backend/):
+    python -m migrations.backfill_task_ranks
+"""
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.services.rank_service import RankService
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+
+async def backfill_task_ranks(db) -> int:
+    """Rank all columns holding unranked tasks, returns the number of columns"""
+    rank_service = RankService(db)
+    columns = await db.tasks.aggregate([
+        {"$match": {"rank": None}},
+        {"$group": {"_id": {"project_id": "$project_id", "status": "$status"}}}
+    ]).to_list(length=None)
+    for column in columns:
+        await rank_service.rebalance(column["_id"]["project_id"], column["_id"].get("status"))
+    return len(columns)
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    columns = await backfill_task_ranks(db)
+    print(f"Ranked tasks in {columns} board columns")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+Coerce string timestamps and due dates to BSON dates
+
+Older tasks and projects stored created_at/updated_at as ISO strings and
+due dates as whatever the client sent. Only documents with a string-typed
+date field are read (projecting just those fields), in batches, and each
+batch is written back with one unordered bulk_write. Values that can't be
+parsed are left untouched and reported. Safe to run repeatedly.
+
+Usage (from backend/):
+    python -m migrations.coerce_dates
+"""
+import asyncio
+from typing import Any, Callable, Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from app.core.schema import TASK_DATE_FIELDS, PROJECT_DATE_FIELDS, InvalidDocument, coerce_datetime
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+BATCH_SIZE = 500
+
+
+async def coerce_collection(collection, fields, coerce: Callable[[Any, str], Any] = coerce_datetime,
+                            batch_size: int = BATCH_SIZE) -> Dict[str, object]:
+    """Rewrite string-typed fields of one collection with ``coerce``, returns counts and failures"""
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    projection = {field: 1 for field in fields}
+
+    updated = 0
+    invalid: List[Dict[str, object]] = []
+    batch: List[UpdateOne] = []
+
+    async def flush():
+        nonlocal updated
+        if batch:
+            result = await collection.bulk_write(batch, ordered=False)
+            updated += result.modified_count
+            batch.clear()
+
+    async for doc in collection.find(query, projection).batch_size(batch_size):
+        changes = {}
+        for field in fields:
+            value = doc.get(field)
+            if not isinstance(value, str):
+                continue
+            try:
+                changes[field] = coerce(value, field)
+            except InvalidDocument:
+                invalid.append({"_id": str(doc["_id"]), "field": field, "value": value})
+        if changes:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+        if len(batch) >= batch_size:
+            await flush()
+    await flush()
+
+    return {"updated": updated, "invalid": invalid}
+
+
+async def coerce_dates(db) -> Dict[str, Dict[str, object]]:
+    return {
+        "tasks": await coerce_collection(db.tasks, TASK_DATE_FIELDS),
+        "projects": await coerce_collection(db.projects, PROJECT_DATE_FIELDS),
+    }
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    report = await coerce_dates(db)
+    for collection, result in report.items():
+        print(f"{collection}: {result['updated']} documents updated, {len(result['invalid'])} unparsable values")
+        for failure in result["invalid"]:
+            print(f"  {failure['_id']} {failure['field']}={failure['value']!r}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+Normalize stored task and project statuses
+
+Rewrites every legacy spelling ("Completed", "completed", "In Progress",
+"Active", ...) to the canonical values from app/core/statuses.py so status
+filters can be exact equality matches. Works per distinct value, so it
+issues one update per spelling rather than touching documents one by one.
+Rebuilds org_stats afterwards because project status buckets change.
+Safe to run repeatedly.
+
+Usage (from backend/):
+    python -m migrations.normalize_statuses
+"""
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.statuses import normalize_task_status, normalize_project_status
+from migrations.repair_org_stats import repair_org_stats
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+
+async def normalize_collection(collection, normalize) -> int:
+    """Rewrite every non-canonical status in a collection, returns documents changed"""
+    changed = 0
+    for status in await collection.distinct("status"):
+        if not isinstance(status, str):
+            continue
+        canonical = normalize(status)
+        if canonical != status:
+            result = await collection.update_many({"status": status}, {"$set": {"status": canonical}})
+            print(f"  {collection.name}: {status!r} -> {canonical!r} ({result.modified_count})")
+            changed += result.modified_count
+    return changed
+
+
+async def normalize_statuses(db) -> int:
+    changed = await normalize_collection(db.tasks, normalize_task_status)
+    changed += await normalize_collection(db.projects, normalize_project_status)
+    await repair_org_stats(db)
+    return changed
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    changed = await normalize_statuses(db)
+    print(f"Normalized status on {changed} documents")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Store tenant references as ObjectIds
+
+organization_id, project_id and user references used to be written as
+24-character hex strings. This rewrites every string reference in tasks,
+projects, organization_members and invitations to a native ObjectId, in
+batches with unordered bulk writes, and reports values that aren't valid
+ids. org_stats documents keyed by the string id are rebuilt under the
+ObjectId key. Safe to run repeatedly.
+
+Usage (from backend/):
+    python -m migrations.object_id_references
+"""
+import asyncio
+from typing import Dict
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.schema import (
+    TASK_REFERENCE_FIELDS, PROJECT_REFERENCE_FIELDS, MEMBER_REFERENCE_FIELDS,
+    INVITATION_REFERENCE_FIELDS, coerce_object_id
+)
+from migrations.coerce_dates import coerce_collection
+from migrations.repair_org_stats import repair_org_stats
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+REFERENCE_FIELDS = {
+    "tasks": TASK_REFERENCE_FIELDS,
+    "projects": PROJECT_REFERENCE_FIELDS,
+    "organization_members": MEMBER_REFERENCE_FIELDS,
+    "invitations": INVITATION_REFERENCE_FIELDS,
+}
+
+
+async def object_id_references(db) -> Dict[str, Dict[str, object]]:
+    report = {}
+    for collection_name, fields in REFERENCE_FIELDS.items():
+        report[collection_name] = await coerce_collection(db[collection_name], fields, coerce=coerce_object_id)
+
+    # _id can't be updated in place, so drop string-keyed counters and recount
+    await db.org_stats.delete_many({"_id": {"$type": "string"}})
+    await repair_org_stats(db)
+    return report
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    report = await object_id_references(db)
+    for collection, result in report.items():
+        print(f"{collection}: {result['updated']} documents updated, {len(result['invalid'])} invalid references")
+        for failure in result["invalid"]:
+            print(f"  {failure['_id']} {failure['field']}={failure['value']!r}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
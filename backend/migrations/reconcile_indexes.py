@@ -0,0 +1,34 @@
+"""
+Reconcile indexes against app/core/indexes.py and report usage
+
+Builds missing indexes, then lists indexes that exist outside the spec and
+those $indexStats reports as never used since the last server restart.
+Nothing is dropped; review the report and remove indexes by hand.
+
+Usage (from backend/):
+    python -m migrations.reconcile_indexes
+"""
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.indexes import reconcile_indexes
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    report = await reconcile_indexes(db, include_usage=True)
+    for section in ("created", "conflicts", "extra", "unused"):
+        print(f"{section}: {len(report[section])}")
+        for entry in report[section]:
+            reason = f" ({entry['reason']})" if "reason" in entry else ""
+            print(f"  {entry['collection']}.{entry['name']}{reason}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""
+Rebuild org_stats counters for every organization
+
+Recounts projects, tasks and members from the source collections. Run it
+after the first deploy of org_stats, or whenever the counters are suspected
+to have drifted (e.g. after manual data fixes).
+
+Usage (from backend/):
+    python -m migrations.repair_org_stats
+"""
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.services.org_stats_service import OrgStatsService
+from saas_server import MONGODB_URL, DATABASE_NAME
+
+
+async def repair_org_stats(db) -> int:
+    """Recompute counters for all organizations, returns the number repaired"""
+    stats_service = OrgStatsService(db)
+    repaired = 0
+    async for org in db.organizations.find({}, {"_id": 1}):
+        await stats_service.recompute(str(org["_id"]))
+        repaired += 1
+    return repaired
+
+
+async def main():
+    client = AsyncIOMotorClient(MONGODB_URL)
+    db = client[DATABASE_NAME]
+
+    repaired = await repair_org_stats(db)
+    print(f"Rebuilt org_stats for {repaired} organizations")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,22 +2,50 @@
 SaaS Project Management Platform - Multi-tenant FastAPI Server
 Features: Authentication, Organizations, Subscriptions, Multi-tenancy
 """
+import asyncio
+import logging
 import os
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import secrets
 import string
-from fastapi import FastAPI, HTTPException, Depends, Header, status, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, status, WebSocket, WebSocketDisconnect, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from motor.motor_asyncio import AsyncIOMotorClient
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ValidationError
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 import uvicorn
 import jwt
-import bcrypt
 from websocket_manager import websocket_manager
 from email_service import email_service
 from bson import ObjectId
+from app.core.hashing import password_hasher, PasswordHasherBusy
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.indexes import reconcile_indexes
+from app.core.fieldsets import (
+    MEMBER_FIELDS, PROJECT_FIELDS, TASK_BOARD_FIELDS, TASK_FIELDS, TASK_PRESETS, projection, select_fields
+)
+from app.core.pagination import ASCENDING, DESCENDING, fetch_page
+from app.core.responses import BSONJSONResponse, bson_response, document_view
+from app.core.compression import CompressionMiddleware
+from app.core.task_filters import build_task_filter, parse_task_sort
+from app.core.statuses import TASK_STATUS_DONE, normalize_task_status, normalize_project_status
+from app.core.schema import (
+    InvalidDocument, coerce_object_id, object_id, task_document, project_document,
+    member_document, invitation_document, public_document
+)
+from app.services.org_stats_service import OrgStatsService, status_key
+from app.services.export_service import ExportService, EXPORT_FIELDS, EXPORT_FORMATS
+from app.services.import_service import ImportService, IMPORT_FORMATS
+from app.services.change_version_service import ChangeVersionService
+from app.services.sync_service import SyncService, SyncTokenExpired
+from app.services.rank_service import RankConflict, RankRebalanceNeeded, RankService, needs_rebalance
+from app.services.board_service import BoardService
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables
 try:
@@ -40,9 +68,46 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 client = None
 db = None
 
-app = FastAPI(title="SaaS Project Management API", version="3.0.0")
+# Authenticated principals keyed by token subject (user id)
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+# Organizations keyed by slug, and member roles keyed by (org_id, user_id)
+organization_cache = TTLCache(
+    max_size=settings.ORG_CACHE_MAX_SIZE,
+    ttl=settings.ORG_CACHE_TTL_SECONDS
+)
+membership_cache = TTLCache(
+    max_size=settings.ORG_CACHE_MAX_SIZE,
+    ttl=settings.ORG_CACHE_TTL_SECONDS
+)
+
+# Per-organization change versions (ETags) keyed by org_id
+version_cache = TTLCache(
+    max_size=settings.ORG_CACHE_MAX_SIZE,
+    ttl=settings.CHANGE_VERSION_CACHE_TTL_SECONDS
+)
+
+app = FastAPI(
+    title="SaaS Project Management API",
+    version="3.0.0",
+    default_response_class=BSONJSONResponse
+)
 security = HTTPBearer()
 
+# Compress large JSON/CSV responses, including streamed exports
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        level=settings.COMPRESSION_LEVEL,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        streaming=settings.COMPRESSION_STREAMING,
+        exclude_paths=settings.COMPRESSION_EXCLUDE_PATHS
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -130,20 +195,23 @@ def create_object_id():
     return str(ObjectId())
 
 def serialize_document(doc):
-    if doc and "_id" in doc:
-        doc["id"] = str(doc["_id"])
-        del doc["_id"]
-    return doc
+    return public_document(doc)
+
+async def hash_password(password: str) -> str:
+    # bcrypt runs on the hashing worker pool so logins don't block the event loop
+    return await password_hasher.hash(password)
 
-def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+async def verify_password(password: str, hashed) -> bool:
+    return await password_hasher.verify(password, hashed)
 
-def verify_password(password: str, hashed) -> bool:
-    # Handle both string and bytes for the hashed password
-    if isinstance(hashed, str):
-        hashed = hashed.encode('utf-8')
-    return bcrypt.checkpw(password.encode('utf-8'), hashed)
+def format_completion_time(average_ms: Optional[float]) -> str:
+    """Format an average completion time as hours (under a day) or days"""
+    if average_ms is None:
+        return "N/A"
+    average_days = average_ms / (24 * 3600 * 1000)
+    if average_days < 1:
+        return f"{average_days * 24:.1f} hours"
+    return f"{average_days:.1f} days"
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -178,42 +246,129 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Invalid token"
         )
     
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        user = await db.users.find_one(
+            {"_id": ObjectId(user_id)},
+            {"email": 1, "first_name": 1, "last_name": 1}
         )
-    
-    return {
-        "id": str(user["_id"]),
-        "email": user["email"],
-        "first_name": user["first_name"],
-        "last_name": user["last_name"]
-    }
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        
+        principal = {
+            "id": str(user["_id"]),
+            "email": user["email"],
+            "first_name": user["first_name"],
+            "last_name": user["last_name"]
+        }
+        principal_cache.set(user_id, principal)
+    
+    # Hand out a copy so route handlers can't mutate the cached entry
+    return dict(principal)
+
+async def get_organization_by_slug(org_slug: str):
+    org = organization_cache.get(org_slug)
+    if org is None:
+        org = await db.organizations.find_one({"slug": org_slug})
+        if not org:
+            return None
+        # "_id" stays the ObjectId for queries; "id" is the string form used
+        # for cache keys, websocket rooms and responses
+        org["id"] = str(org["_id"])
+        organization_cache.set(org_slug, org)
+    return dict(org)
 
 async def get_user_organization(org_slug: str, user_id: str):
-    org = await db.organizations.find_one({"slug": org_slug})
+    org = await get_organization_by_slug(org_slug)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
     
-    membership = await db.organization_members.find_one({
-        "organization_id": str(org["_id"]),
-        "user_id": user_id
-    })
-    
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
+    role = membership_cache.get((org["id"], user_id))
+    if role is None:
+        membership = await db.organization_members.find_one(
+            {"organization_id": org["_id"], "user_id": ObjectId(user_id)},
+            {"role": 1}
         )
+        
+        if not membership:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+        
+        role = membership["role"]
+        membership_cache.set((org["id"], user_id), role)
     
-    org["id"] = str(org["_id"])
-    del org["_id"]
-    return org, membership["role"]
+    return org, role
+
+def invalidate_organization_cache(org_slug: str):
+    organization_cache.invalidate(org_slug)
+
+def invalidate_membership_cache(org_id: str, user_id: Optional[str] = None):
+    if user_id is None:
+        membership_cache.invalidate_where(lambda key: key[0] == org_id)
+    else:
+        membership_cache.invalidate((org_id, user_id))
+
+async def bump_change_version(org_id: str) -> int:
+    """Record a write to the organization's data, invalidating client ETags"""
+    return await ChangeVersionService(db, version_cache).bump(org_id)
+
+def change_write(org_id: str):
+    """``async with change_write(org_id) as change_seq:`` around a write stamping change_seq
+
+    The version stays pending until the block exits, so sync tokens cannot
+    pass it before the write has landed.
+    """
+    return ChangeVersionService(db, version_cache).write(org_id)
+
+# Board columns with a rebalance in flight, and the tasks running them
+rebalancing_columns = set()
+background_tasks = set()
+
+def schedule_rank_rebalance(org_id: str, project_id: ObjectId, task_status: Optional[str]):
+    """Rebalance a board column in the background, once at a time per column"""
+    column = (project_id, task_status)
+    if column in rebalancing_columns:
+        return
+    rebalancing_columns.add(column)
+    
+    async def rebalance():
+        try:
+            async with change_write(org_id) as change_seq:
+                await RankService(db).rebalance(project_id, task_status, change_seq)
+        except Exception:
+            logger.exception("Rank rebalance failed for project %s (%s)", project_id, task_status)
+        finally:
+            rebalancing_columns.discard(column)
+    
+    task = asyncio.create_task(rebalance())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+def _etag_value(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+async def check_not_modified(request: Request, response: Response, org_id: str) -> Optional[Response]:
+    """Tag the response with the organization's committed change version
+    
+    Returns a 304 response when If-None-Match already holds that version, so
+    the caller can skip its queries. Must run before any data is read.
+    """
+    etag = f'W/"{await ChangeVersionService(db, version_cache).current(org_id)}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    client_tags = [_etag_value(tag) for tag in request.headers.get("if-none-match", "").split(",")]
+    if "*" in client_tags or _etag_value(etag) in client_tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
 
 # Database Functions
 async def connect_to_mongo():
@@ -224,19 +379,10 @@ async def connect_to_mongo():
         await client.admin.command('ping')
         print(f"Connected to MongoDB Atlas database: {DATABASE_NAME}")
         
-        # Create indexes
-        await db.users.create_index("email", unique=True)
-        await db.organizations.create_index("slug", unique=True)
-        await db.organization_members.create_index([("organization_id", 1), ("user_id", 1)])
-        await db.projects.create_index("organization_id")
-        await db.tasks.create_index("organization_id")
-        await db.tasks.create_index("project_id")
-        await db.tasks.create_index("assigned_to")
-        await db.invitations.create_index([("organization_id", 1), ("email", 1)])
-        await db.tasks.create_index("organization_id")
-        await db.tasks.create_index("project_id")
-        
-        print("Database indexes created")
+        # Build any indexes from the shared spec that are missing
+        index_report = await reconcile_indexes(db)
+        print(f"Database indexes reconciled: {len(index_report['created'])} created, "
+              f"{len(index_report['extra'])} outside spec")
         
     except Exception as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
@@ -255,6 +401,41 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     await close_mongo_connection()
+    password_hasher.shutdown()
+
+@app.exception_handler(InvalidDocument)
+async def invalid_document_handler(request, exc: InvalidDocument):
+    from fastapi.responses import JSONResponse
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc), "field": exc.field}
+    )
+
+@app.exception_handler(RankConflict)
+async def rank_conflict_handler(request, exc: RankConflict):
+    from fastapi.responses import JSONResponse
+    return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)})
+
+@app.exception_handler(RankRebalanceNeeded)
+async def rank_rebalance_needed_handler(request, exc: RankRebalanceNeeded):
+    from fastapi.responses import JSONResponse
+    project = await db.projects.find_one({"_id": exc.project_id}, {"organization_id": 1})
+    if project:
+        schedule_rank_rebalance(str(project["organization_id"]), exc.project_id, exc.status)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request, exc: PasswordHasherBusy):
+    from fastapi.responses import JSONResponse
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"}
+    )
 
 # Routes
 @app.get("/")
@@ -266,6 +447,21 @@ async def root():
         "features": ["Multi-tenancy", "Subscriptions", "Organizations", "Authentication"]
     }
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """Runtime metrics for capacity monitoring"""
+    return {
+        "success": True,
+        "data": {
+            "password_hashing": password_hasher.metrics(),
+            "principal_cache": principal_cache.metrics(),
+            "organization_cache": organization_cache.metrics(),
+            "membership_cache": membership_cache.metrics(),
+            "change_version_cache": version_cache.metrics(),
+            "websockets": websocket_manager.metrics()
+        }
+    }
+
 # Authentication Routes
 @app.post("/api/auth/signup")
 async def signup(user_data: UserSignup):
@@ -291,7 +487,7 @@ async def signup(user_data: UserSignup):
         "email": user_data.email,
         "first_name": user_data.first_name,
         "last_name": user_data.last_name,
-        "password_hash": hash_password(user_data.password),
+        "password_hash": await hash_password(user_data.password),
         "is_verified": False,
         "is_active": True,
         "created_at": datetime.utcnow().isoformat(),
@@ -317,15 +513,16 @@ async def signup(user_data: UserSignup):
     org_id = str(org_result.inserted_id)
     
     # Add user as owner
-    membership_doc = {
+    membership_doc = member_document({
         "organization_id": org_id,
         "user_id": user_id,
         "role": "owner",
         "joined_at": datetime.utcnow().isoformat(),
         "created_at": datetime.utcnow().isoformat()
-    }
+    })
     
     await db.organization_members.insert_one(membership_doc)
+    await OrgStatsService(db).recompute(org_id)
     
     # Create token
     token = create_access_token({"sub": user_id})
@@ -368,19 +565,19 @@ async def login(credentials: UserLogin):
             detail="User password not properly configured"
         )
     
-    if not verify_password(credentials.password, stored_password):
+    if not await verify_password(credentials.password, stored_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
     # Get user's organizations
-    memberships = await db.organization_members.find({"user_id": str(user["_id"])}).to_list(length=100)
+    memberships = await db.organization_members.find({"user_id": user["_id"]}).to_list(length=100)
     organizations = []
     primary_organization = None
     
     for membership in memberships:
-        org = await db.organizations.find_one({"_id": ObjectId(membership["organization_id"])})
+        org = await db.organizations.find_one({"_id": membership["organization_id"]})
         if org:
             org_data = {
                 "id": str(org["_id"]),
@@ -489,7 +686,7 @@ async def reset_password(request: ResetPasswordRequest):
         )
     
     # Hash new password and clear reset token
-    new_password_hash = hash_password(request.new_password)
+    new_password_hash = await hash_password(request.new_password)
     
     await db.users.update_one(
         {"_id": user["_id"]},
@@ -525,52 +722,35 @@ async def get_plans():
 
 # Organization-scoped Routes (Multi-tenant)
 @app.get("/api/{org_slug}/dashboard")
-async def get_dashboard(org_slug: str, current_user = Depends(get_current_user)):
+async def get_dashboard(org_slug: str, request: Request, response: Response, current_user = Depends(get_current_user)):
     """Get organization dashboard data"""
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
-    # Get detailed statistics
-    total_projects = await db.projects.count_documents({"organization_id": org["id"]})
-    
-    # Count active projects (case-insensitive search for active status)
-    active_projects = await db.projects.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$regex": "^active$", "$options": "i"}
-    })
-    completed_projects = await db.projects.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$regex": "^completed$", "$options": "i"}
-    })
-    
-    # Get tasks count
-    total_tasks = await db.tasks.count_documents({"organization_id": org["id"]})
-    
-    # Debug: Let's see what tasks and statuses exist
-    all_tasks = await db.tasks.find({"organization_id": org["id"]}).to_list(length=None)
-    print(f"DEBUG Dashboard: Found {len(all_tasks)} tasks for org {org['id']}")
-    for task in all_tasks:
-        print(f"DEBUG Dashboard: Task '{task.get('title')}' has status '{task.get('status')}'")
-    
-    completed_tasks = await db.tasks.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$in": ["completed", "done"]}
-    })
-    
-    print(f"DEBUG Dashboard: completed_tasks count: {completed_tasks}")
-    print(f"DEBUG Dashboard: total_tasks count: {total_tasks}")
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
     
-    # Get recent projects
-    recent_projects_cursor = db.projects.find({"organization_id": org["id"]}).sort("created_at", -1).limit(5)
+    # Counters come from the incrementally maintained org_stats document
+    stats = await OrgStatsService(db).get(org["id"])
+    recent_projects_cursor = db.projects.find({"organization_id": org["_id"]}).sort("created_at", -1).limit(5)
     recent_projects = await recent_projects_cursor.to_list(length=5)
     recent_projects = [serialize_document(project) for project in recent_projects]
     
+    projects_by_status = stats.get("projects_by_status", {})
+    total_projects = stats.get("projects", 0)
+    active_projects = projects_by_status.get("active", 0)
+    completed_projects = projects_by_status.get("completed", 0)
+    total_tasks = stats.get("tasks", 0)
+    completed_tasks = stats.get("completed_tasks", 0)
+    total_members = stats.get("members", 0)
+    
     return {
         "success": True,
         "data": {
-            "organization": org,
+            "organization": {key: value for key, value in org.items() if key != "_id"},
             "user_role": user_role,
             "stats": {
-                "members": await db.organization_members.count_documents({"organization_id": org["id"]}),
+                "members": total_members,
                 "projects": total_projects,
                 "tasks": total_tasks
             },
@@ -586,15 +766,31 @@ async def get_dashboard(org_slug: str, current_user = Depends(get_current_user))
     }
 
 @app.get("/api/{org_slug}/projects")
-async def get_organization_projects(org_slug: str, current_user = Depends(get_current_user)):
-    """Get projects for organization"""
+async def get_organization_projects(org_slug: str, request: Request, response: Response,
+                                    limit: Optional[int] = None, cursor: Optional[str] = None,
+                                    fields: Optional[str] = None,
+                                    current_user = Depends(get_current_user)):
+    """Get projects for organization, newest first, one page at a time
+    
+    ``fields`` is a comma-separated sparse fieldset (``fields=name,status``).
+    """
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
-    cursor = db.projects.find({"organization_id": org["id"]})
-    projects = await cursor.to_list(length=100)
-    serialized_projects = [serialize_document(project) for project in projects]
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
+    
+    projects, next_cursor = await fetch_page(
+        db.projects, {"organization_id": org["_id"]},
+        cursor=cursor, limit=limit, direction=DESCENDING,
+        projection=projection(select_fields(fields, PROJECT_FIELDS), required=("created_at",))
+    )
     
-    return {"success": True, "data": serialized_projects}
+    return bson_response({
+        "success": True,
+        "data": [document_view(project) for project in projects],
+        "next_cursor": next_cursor
+    }, response)
 
 @app.post("/api/{org_slug}/projects")
 async def create_organization_project(org_slug: str, project: ProjectCreate, current_user = Depends(get_current_user)):
@@ -602,7 +798,7 @@ async def create_organization_project(org_slug: str, project: ProjectCreate, cur
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
     # Check project limit
-    current_projects = await db.projects.count_documents({"organization_id": org["id"]})
+    current_projects = await db.projects.count_documents({"organization_id": org["_id"]})
     plan_limits = PLAN_LIMITS.get(org.get("plan_type", "free"))
     
     if plan_limits["max_projects"] != -1 and current_projects >= plan_limits["max_projects"]:
@@ -611,21 +807,28 @@ async def create_organization_project(org_slug: str, project: ProjectCreate, cur
             detail="Project limit reached. Please upgrade your plan."
         )
     
-    project_doc = {
-        "organization_id": org["id"],
+    now = datetime.utcnow()
+    project_doc = project_document({
+        "organization_id": org["_id"],
         "name": project.name,
         "description": project.description,
-        "status": project.status,
+        "status": normalize_project_status(project.status),
         "owner_id": current_user["id"],
         "start_date": project.start_date,
         "end_date": project.end_date,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
-    }
-    
-    result = await db.projects.insert_one(project_doc)
-    project_doc["id"] = str(result.inserted_id)
-    del project_doc["_id"]
+        "created_at": now,
+        "updated_at": now
+    })
+    # Counters are updated inside the block too, so the new ETag never
+    # names a dashboard computed from the old ones
+    async with change_write(org["id"]) as change_seq:
+        project_doc["change_seq"] = change_seq
+        await db.projects.insert_one(project_doc)
+        await OrgStatsService(db).increment(org["id"], **{
+            "projects": 1,
+            f"projects_by_status.{status_key(project_doc['status'])}": 1
+        })
+    project_doc = serialize_document(project_doc)
     
     return {"success": True, "data": project_doc}
 
@@ -642,26 +845,28 @@ async def update_organization_project(org_slug: str, project_id: str, project: P
     
     existing_project = await db.projects.find_one({
         "_id": project_object_id, 
-        "organization_id": org["id"]
+        "organization_id": org["_id"]
     })
     
     if not existing_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Update project
-    update_doc = {
+    update_doc = project_document({
         "name": project.name,
         "description": project.description,
-        "status": project.status,
+        "status": normalize_project_status(project.status),
         "start_date": project.start_date,
         "end_date": project.end_date,
-        "updated_at": datetime.utcnow().isoformat()
-    }
-    
-    await db.projects.update_one(
-        {"_id": project_object_id, "organization_id": org["id"]},
-        {"$set": update_doc}
-    )
+        "updated_at": datetime.utcnow()
+    })
+    async with change_write(org["id"]) as change_seq:
+        update_doc["change_seq"] = change_seq
+        await db.projects.update_one(
+            {"_id": project_object_id, "organization_id": org["_id"]},
+            {"$set": update_doc}
+        )
+        await OrgStatsService(db).project_status_changed(org["id"], existing_project.get("status"), update_doc["status"])
     
     # Get updated project
     updated_project = await db.projects.find_one({"_id": project_object_id})
@@ -695,7 +900,7 @@ async def delete_organization_project(org_slug: str, project_id: str, current_us
     
     project = await db.projects.find_one({
         "_id": project_object_id, 
-        "organization_id": org["id"]
+        "organization_id": org["_id"]
     })
     
     print(f"DEBUG: Project found (correct org): {project is not None}")
@@ -703,26 +908,97 @@ async def delete_organization_project(org_slug: str, project_id: str, current_us
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Delete associated tasks first
-    await db.tasks.delete_many({"project_id": project_id, "organization_id": org["id"]})
-    
-    # Delete the project
-    await db.projects.delete_one({"_id": project_object_id, "organization_id": org["id"]})
+    # Tombstones first so delta sync clients learn about the cascade
+    async with change_write(org["id"]) as change_seq:
+        sync_service = SyncService(db)
+        await sync_service.record_deletes_matching(
+            org["id"], "tasks", {"project_id": project_object_id, "organization_id": org["_id"]}, change_seq
+        )
+        await sync_service.record_deletes(org["id"], "projects", [project_object_id], change_seq)
+        
+        # Delete associated tasks first, finished ones separately so the
+        # completed counter can be adjusted without another count query
+        completed_result = await db.tasks.delete_many({
+            "project_id": project_object_id,
+            "organization_id": org["_id"],
+            "status": TASK_STATUS_DONE
+        })
+        remaining_result = await db.tasks.delete_many({"project_id": project_object_id, "organization_id": org["_id"]})
+        
+        # Delete the project
+        await db.projects.delete_one({"_id": project_object_id, "organization_id": org["_id"]})
+        
+        await OrgStatsService(db).increment(org["id"], **{
+            "projects": -1,
+            f"projects_by_status.{status_key(project.get('status'))}": -1,
+            "tasks": -(completed_result.deleted_count + remaining_result.deleted_count),
+            "completed_tasks": -completed_result.deleted_count
+        })
     
     print(f"DEBUG: Project deleted successfully")
     
     return {"success": True, "message": "Project deleted successfully"}
 
 @app.get("/api/{org_slug}/tasks")
-async def get_organization_tasks(org_slug: str, current_user = Depends(get_current_user)):
-    """Get tasks for organization"""
+async def get_organization_tasks(org_slug: str, request: Request, response: Response,
+                                 task_status: Optional[str] = Query(None, alias="status"),
+                                 assignee: Optional[str] = None,
+                                 priority: Optional[str] = None, tag: Optional[str] = None,
+                                 project_id: Optional[str] = None, due_before: Optional[str] = None,
+                                 due_after: Optional[str] = None, sort: Optional[str] = None,
+                                 limit: Optional[int] = None, cursor: Optional[str] = None,
+                                 fields: Optional[str] = None,
+                                 current_user = Depends(get_current_user)):
+    """Get tasks for organization, filtered and sorted server-side, one page at a time
+    
+    Multi-valued filters are comma-separated (``status=todo,in_progress``);
+    ``sort`` is ``created_at`` (default) or ``due_date``, prefixed with ``-``
+    for descending. ``fields`` is a sparse fieldset, or ``board`` for the
+    slim card projection.
+    """
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
-    cursor = db.tasks.find({"organization_id": org["id"]})
-    tasks = await cursor.to_list(length=100)
-    serialized_tasks = [serialize_document(task) for task in tasks]
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
     
-    return {"success": True, "data": serialized_tasks}
+    query = build_task_filter(
+        org["_id"], status=task_status, assignee=assignee, priority=priority, tag=tag,
+        project_id=project_id, due_before=due_before, due_after=due_after
+    )
+    sort_field, direction = parse_task_sort(sort)
+    tasks, next_cursor = await fetch_page(
+        db.tasks, query, cursor=cursor, limit=limit, direction=direction, sort_field=sort_field,
+        projection=projection(select_fields(fields, TASK_FIELDS, TASK_PRESETS), required=(sort_field,))
+    )
+    
+    return bson_response({
+        "success": True,
+        "data": [document_view(task) for task in tasks],
+        "next_cursor": next_cursor
+    }, response)
+
+def new_task_document(org_id: ObjectId, task: TaskCreate, created_by: str, change_seq: int) -> Dict[str, Any]:
+    """Stored form of a new task, stamped with the write's change version"""
+    now = datetime.utcnow()
+    task_doc = task_document({
+        "organization_id": org_id,
+        "project_id": task.project_id,
+        "title": task.title,
+        "description": task.description,
+        "status": normalize_task_status(task.status),
+        "priority": task.priority,
+        "assigned_to": task.assignee_id,
+        "created_by": created_by,
+        "due_date": task.due_date,
+        "tags": task.tags,
+        "created_at": now,
+        "updated_at": now
+    })
+    if task_doc["status"] == TASK_STATUS_DONE:
+        task_doc["completed_at"] = now
+    task_doc["change_seq"] = change_seq
+    return task_doc
 
 @app.post("/api/{org_slug}/tasks")
 async def create_organization_task(org_slug: str, task: TaskCreate, current_user = Depends(get_current_user)):
@@ -731,8 +1007,8 @@ async def create_organization_task(org_slug: str, task: TaskCreate, current_user
     
     # Verify project belongs to organization
     project = await db.projects.find_one({
-        "_id": ObjectId(task.project_id),
-        "organization_id": org["id"]
+        "_id": object_id(task.project_id, "project_id"),
+        "organization_id": org["_id"]
     })
     
     if not project:
@@ -741,30 +1017,20 @@ async def create_organization_task(org_slug: str, task: TaskCreate, current_user
             detail="Project not found"
         )
     
-    task_doc = {
-        "organization_id": org["id"],
-        "project_id": task.project_id,
-        "title": task.title,
-        "description": task.description,
-        "status": task.status,
-        "priority": task.priority,
-        "assignee_id": task.assignee_id,
-        "created_by": current_user["id"],
-        "due_date": task.due_date,
-        "tags": task.tags,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
-    }
-    
-    result = await db.tasks.insert_one(task_doc)
-    task_doc["id"] = str(result.inserted_id)
-    del task_doc["_id"]
+    async with change_write(org["id"]) as change_seq:
+        task_doc = new_task_document(org["_id"], task, current_user["id"], change_seq)
+        task_doc["rank"] = await RankService(db).place(None, task_doc["project_id"], task_doc["status"])
+        await db.tasks.insert_one(task_doc)
+        await OrgStatsService(db).increment(
+            org["id"], tasks=1, completed_tasks=int(task_doc["status"] == TASK_STATUS_DONE)
+        )
+    task_doc = serialize_document(task_doc)
     
     # Broadcast real-time update
     await broadcast_update(org["id"], "task_created", {
         "task": task_doc,
         "project_id": task.project_id
-    })
+    }, version=task_doc["change_seq"])
     
     return {"success": True, "data": task_doc}
 
@@ -776,6 +1042,65 @@ class TaskUpdate(BaseModel):
     assignee_id: Optional[str] = None
     due_date: Optional[str] = None
     tags: Optional[List[str]] = None
+    # Drag and drop: the cards the task lands between in its (new) column
+    after_id: Optional[str] = None
+    before_id: Optional[str] = None
+
+def task_changes(task_update: TaskUpdate) -> Dict[str, Any]:
+    """Fields a TaskUpdate sets, under their stored names"""
+    changes = {}
+    if task_update.title is not None:
+        changes["title"] = task_update.title
+    if task_update.description is not None:
+        changes["description"] = task_update.description
+    if task_update.status is not None:
+        changes["status"] = normalize_task_status(task_update.status)
+    if task_update.priority is not None:
+        changes["priority"] = task_update.priority
+    if task_update.assignee_id is not None:
+        changes["assigned_to"] = task_update.assignee_id
+    if task_update.due_date is not None:
+        changes["due_date"] = task_update.due_date
+    if task_update.tags is not None:
+        changes["tags"] = task_update.tags
+    return changes
+
+def task_update_operation(changes: Dict[str, Any], was_completed: bool, change_seq: int) -> Tuple[Dict[str, Any], int]:
+    """Mongo update document for ``changes`` and the completed-task delta it causes"""
+    update_data = dict(changes)
+    update_data["updated_at"] = datetime.utcnow()
+    update_data["change_seq"] = change_seq
+    
+    # Stamp completed_at on the transition into a finished status and
+    # clear it again if the task is reopened
+    update_ops = {}
+    completed_delta = 0
+    if "status" in update_data:
+        is_completed = update_data["status"] == TASK_STATUS_DONE
+        if is_completed and not was_completed:
+            update_data["completed_at"] = update_data["updated_at"]
+            completed_delta = 1
+        elif was_completed and not is_completed:
+            update_ops["$unset"] = {"completed_at": ""}
+            completed_delta = -1
+    
+    update_ops["$set"] = task_document(update_data)
+    return update_ops, completed_delta
+
+async def task_placement(ranks: RankService, task: Dict[str, Any], changes: Dict[str, Any],
+                         task_update: TaskUpdate, field: str = "") -> Optional[str]:
+    """New rank when the update moves the task to another column or position
+    
+    A task moved to another column without neighbours goes to its end.
+    """
+    new_status = changes.get("status", task.get("status"))
+    after_id = coerce_object_id(task_update.after_id, f"{field}after_id")
+    before_id = coerce_object_id(task_update.before_id, f"{field}before_id")
+    if new_status == task.get("status") and after_id is None and before_id is None:
+        return None
+    if task["_id"] in (after_id, before_id):
+        raise RankConflict("A task cannot be placed next to itself")
+    return await ranks.place(task["_id"], task["project_id"], new_status, after_id=after_id, before_id=before_id)
 
 @app.put("/api/{org_slug}/tasks/{task_id}")
 async def update_task(org_slug: str, task_id: str, task_update: TaskUpdate, current_user = Depends(get_current_user)):
@@ -786,7 +1111,7 @@ async def update_task(org_slug: str, task_id: str, task_update: TaskUpdate, curr
     try:
         task = await db.tasks.find_one({
             "_id": ObjectId(task_id),
-            "organization_id": org["id"]
+            "organization_id": org["_id"]
         })
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid task ID format")
@@ -794,65 +1119,274 @@ async def update_task(org_slug: str, task_id: str, task_update: TaskUpdate, curr
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    # Build update document
-    update_data = {}
-    if task_update.title is not None:
-        update_data["title"] = task_update.title
-    if task_update.description is not None:
-        update_data["description"] = task_update.description
-    if task_update.status is not None:
-        update_data["status"] = task_update.status
-    if task_update.priority is not None:
-        update_data["priority"] = task_update.priority
-    if task_update.assignee_id is not None:
-        update_data["assigned_to"] = task_update.assignee_id
-    if task_update.due_date is not None:
-        update_data["due_date"] = task_update.due_date
-    if task_update.tags is not None:
-        update_data["tags"] = task_update.tags
-    
-    if update_data:
-        update_data["updated_at"] = datetime.utcnow()
-        await db.tasks.update_one(
-            {"_id": ObjectId(task_id)},
-            {"$set": update_data}
-        )
+    changes = task_changes(task_update)
+    rank = await task_placement(RankService(db), task, changes, task_update)
+    if rank is not None:
+        changes["rank"] = rank
+    change_seq = None
+    if changes:
+        async with change_write(org["id"]) as change_seq:
+            update_ops, completed_delta = task_update_operation(
+                changes, task.get("status") == TASK_STATUS_DONE, change_seq
+            )
+            await db.tasks.update_one(
+                {"_id": ObjectId(task_id)},
+                update_ops
+            )
+            await OrgStatsService(db).increment(org["id"], completed_tasks=completed_delta)
+        if needs_rebalance(rank):
+            schedule_rank_rebalance(org["id"], task["project_id"], changes.get("status", task.get("status")))
     
     # Get updated task
-    updated_task = await db.tasks.find_one({"_id": ObjectId(task_id)})
-    updated_task["id"] = str(updated_task["_id"])
-    del updated_task["_id"]
+    updated_task = serialize_document(await db.tasks.find_one({"_id": ObjectId(task_id)}))
     
     # Broadcast real-time update
     await broadcast_update(org["id"], "task_updated", {
         "task": updated_task
-    })
+    }, version=change_seq)
     
     return {"success": True, "data": updated_task}
 
+class BulkTaskOperation(BaseModel):
+    op: str  # create, update or delete
+    id: Optional[str] = None  # task to update or delete
+    task: Dict[str, Any] = {}  # TaskCreate fields for create, TaskUpdate fields for update
+
+class BulkTaskRequest(BaseModel):
+    operations: List[BulkTaskOperation]
+
+@app.post("/api/{org_slug}/tasks/bulk")
+async def bulk_task_operations(org_slug: str, bulk: BulkTaskRequest, current_user = Depends(get_current_user)):
+    """Apply many task creates, updates and deletes as one bulk_write
+    
+    Operations run in the order given. All of them are validated, and the
+    tasks and projects they reference looked up in one query each, before
+    anything is written, so a bad operation rejects the whole request. The
+    batch takes a single change version and sends a single ``tasks_bulk``
+    broadcast.
+    
+    A write failing mid-batch (a document the server rejects, a lost node)
+    leaves the operations before it applied: the response is then 207 with
+    ``success`` false, what was applied under ``data`` and the failing
+    operation's index under ``failed``.
+    """
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    if not bulk.operations:
+        raise HTTPException(status_code=400, detail="No operations given")
+    if len(bulk.operations) > settings.BULK_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BULK_MAX_OPERATIONS} operations per request"
+        )
+    
+    parsed = []
+    task_ids = set()
+    project_ids = set()
+    deleted_ids = []
+    for index, operation in enumerate(bulk.operations):
+        field = f"operations[{index}]"
+        try:
+            if operation.op == "create":
+                payload = TaskCreate(**operation.task)
+                project_ids.add(object_id(payload.project_id, f"{field}.task.project_id"))
+                parsed.append((operation.op, None, payload))
+                continue
+            if operation.op == "update":
+                payload = TaskUpdate(**operation.task)
+            elif operation.op == "delete":
+                payload = None
+            else:
+                raise InvalidDocument(f"{field}.op", operation.op, expected="bulk operation")
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            raise HTTPException(status_code=422, detail=f"{field}.task.{location}: {error['msg']}")
+        
+        task_id = object_id(operation.id, f"{field}.id")
+        if task_id in deleted_ids:
+            raise HTTPException(status_code=409, detail=f"{field}: task {task_id} is deleted earlier in this request")
+        if operation.op == "delete":
+            deleted_ids.append(task_id)
+        task_ids.add(task_id)
+        parsed.append((operation.op, task_id, payload))
+    
+    # Current status and project of every task touched, kept up to date as
+    # the operations are applied in order
+    tasks = {}
+    async for task in db.tasks.find(
+        {"_id": {"$in": list(task_ids)}, "organization_id": org["_id"]}, {"status": 1, "project_id": 1}
+    ):
+        tasks[task["_id"]] = task
+    missing = task_ids - tasks.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Task not found: {', '.join(sorted(map(str, missing)))}")
+    
+    if project_ids:
+        found = await db.projects.count_documents({"_id": {"$in": list(project_ids)}, "organization_id": org["_id"]})
+        if found != len(project_ids):
+            raise HTTPException(status_code=404, detail="Project not found")
+    
+    async with change_write(org["id"]) as change_seq:
+        ranks = RankService(db)
+        # Each bulk_write request with the operation it came from and what it
+        # changes once applied, so a partial failure is accounted for exactly
+        requests = []
+        effects = []
+        for index, (op, task_id, payload) in enumerate(parsed):
+            if op == "create":
+                task_doc = new_task_document(org["_id"], payload, current_user["id"], change_seq)
+                task_doc["_id"] = ObjectId()
+                task_doc["rank"] = await ranks.place(task_doc["_id"], task_doc["project_id"], task_doc["status"])
+                requests.append(InsertOne(task_doc))
+                effects.append({"index": index, "created": task_doc, "tasks": 1,
+                                "completed": int(task_doc["status"] == TASK_STATUS_DONE)})
+            elif op == "update":
+                task = tasks[task_id]
+                changes = task_changes(payload)
+                rank = await task_placement(ranks, task, changes, payload, field=f"operations[{index}].task.")
+                if rank is not None:
+                    changes["rank"] = rank
+                if not changes:
+                    continue
+                update_ops, delta = task_update_operation(
+                    changes, task.get("status") == TASK_STATUS_DONE, change_seq
+                )
+                task["status"] = changes.get("status", task.get("status"))
+                requests.append(UpdateOne({"_id": task_id, "organization_id": org["_id"]}, update_ops))
+                effects.append({"index": index, "updated": task_id, "tasks": 0, "completed": delta,
+                                "long_rank": (task["project_id"], task["status"]) if needs_rebalance(rank) else None})
+            else:
+                requests.append(DeleteOne({"_id": task_id, "organization_id": org["_id"]}))
+                effects.append({"index": index, "deleted": task_id, "tasks": -1,
+                                "completed": -int(tasks[task_id].get("status") == TASK_STATUS_DONE)})
+        
+        # Ordered and not transactional: on a failure everything before the
+        # failing request has been written and nothing after it
+        failure = None
+        if requests:
+            try:
+                await db.tasks.bulk_write(requests, ordered=True)
+            except BulkWriteError as e:
+                error = e.details["writeErrors"][0]
+                failure = {"index": effects[error["index"]]["index"], "detail": error.get("errmsg", "Write failed")}
+                effects = effects[:error["index"]]
+        
+        deleted_ids = [effect["deleted"] for effect in effects if "deleted" in effect]
+        await OrgStatsService(db).increment(
+            org["id"], tasks=sum(effect["tasks"] for effect in effects),
+            completed_tasks=sum(effect["completed"] for effect in effects)
+        )
+        if deleted_ids:
+            await SyncService(db).record_deletes(org["id"], "tasks", deleted_ids, change_seq)
+    for project_id, task_status in {effect["long_rank"] for effect in effects if effect.get("long_rank")}:
+        schedule_rank_rebalance(org["id"], project_id, task_status)
+    
+    updated_ids = []
+    for effect in effects:
+        if "updated" in effect and effect["updated"] not in updated_ids and effect["updated"] not in deleted_ids:
+            updated_ids.append(effect["updated"])
+    updated = {}
+    if updated_ids:
+        async for task in db.tasks.find({"_id": {"$in": updated_ids}}):
+            updated[task["_id"]] = task
+    
+    result = {
+        "created": [serialize_document(effect["created"]) for effect in effects if "created" in effect],
+        "updated": [serialize_document(updated[task_id]) for task_id in updated_ids],
+        "deleted": [str(task_id) for task_id in deleted_ids]
+    }
+    
+    # One broadcast for the whole batch instead of one per task
+    if effects:
+        await broadcast_update(org["id"], "tasks_bulk", result, version=change_seq)
+    
+    if failure is not None:
+        # What was applied, and the operation that stopped the batch
+        return bson_response(
+            {"success": False, "data": result, "failed": failure},
+            status_code=status.HTTP_207_MULTI_STATUS
+        )
+    return {"success": True, "data": result}
+
 # Project-specific task endpoints
 @app.get("/api/{org_slug}/projects/{project_id}/tasks")
-async def get_project_tasks(org_slug: str, project_id: str, current_user = Depends(get_current_user)):
-    """Get tasks for a specific project"""
+async def get_project_tasks(org_slug: str, project_id: str, request: Request, response: Response,
+                            limit: Optional[int] = None, cursor: Optional[str] = None,
+                            fields: Optional[str] = None,
+                            current_user = Depends(get_current_user)):
+    """Get tasks for a specific project in creation order, one page at a time
+    
+    ``fields`` is a sparse fieldset, or ``board`` for the slim card projection.
+    """
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
+    
     # Verify project exists and user has access
     project = await db.projects.find_one({
         "_id": ObjectId(project_id),
-        "organization_id": org["id"]
-    })
+        "organization_id": org["_id"]
+    }, {"_id": 1})
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    cursor = db.tasks.find({
-        "organization_id": org["id"], 
-        "project_id": project_id
-    })
-    tasks = await cursor.to_list(length=100)
-    serialized_tasks = [serialize_document(task) for task in tasks]
+    tasks, next_cursor = await fetch_page(
+        db.tasks, {"organization_id": org["_id"], "project_id": project["_id"]},
+        cursor=cursor, limit=limit, direction=ASCENDING,
+        projection=projection(select_fields(fields, TASK_FIELDS, TASK_PRESETS), required=("created_at",))
+    )
     
-    return {"success": True, "data": serialized_tasks}
+    return bson_response({
+        "success": True,
+        "data": [document_view(task) for task in tasks],
+        "next_cursor": next_cursor
+    }, response)
+
+@app.get("/api/{org_slug}/projects/{project_id}/board")
+async def get_project_board(org_slug: str, project_id: str, request: Request, response: Response,
+                            task_status: Optional[str] = Query(None, alias="status"),
+                            cursor: Optional[str] = None,
+                            limit: Optional[int] = None, fields: Optional[str] = None,
+                            current_user = Depends(get_current_user)):
+    """Tasks of a project grouped into board columns, in rank order
+    
+    Without ``status`` every column comes back with its count, its first
+    ``limit`` cards and a ``next_cursor``; ``status`` with that cursor pages
+    through a single column. Cards use the slim ``board`` fieldset unless
+    ``fields`` asks for others.
+    """
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
+    
+    project = await db.projects.find_one({
+        "_id": object_id(project_id, "project_id"),
+        "organization_id": org["_id"]
+    }, {"_id": 1})
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if cursor and not task_status:
+        raise HTTPException(status_code=400, detail="cursor requires the column status")
+    
+    card_fields = select_fields(fields, TASK_FIELDS, TASK_PRESETS) or TASK_BOARD_FIELDS
+    board = BoardService(db)
+    if task_status:
+        columns = [await board.column_page(
+            project["_id"], normalize_task_status(task_status), cursor=cursor, limit=limit,
+            projection=projection(card_fields, required=("status", "rank"))
+        )]
+    else:
+        columns = await board.columns(project["_id"], limit=limit, projection=projection(card_fields))
+    
+    for column in columns:
+        column["tasks"] = [document_view(task) for task in column["tasks"]]
+    return bson_response({"success": True, "data": {"project_id": project_id, "columns": columns}}, response)
 
 @app.post("/api/{org_slug}/projects/{project_id}/tasks")
 async def create_project_task(org_slug: str, project_id: str, task: TaskCreate, current_user = Depends(get_current_user)):
@@ -862,47 +1396,62 @@ async def create_project_task(org_slug: str, project_id: str, task: TaskCreate,
     # Verify project exists and user has access
     project = await db.projects.find_one({
         "_id": ObjectId(project_id),
-        "organization_id": org["id"]
+        "organization_id": org["_id"]
     })
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    task_doc = {
-        "title": task.title,
-        "description": task.description or "",
-        "status": task.status,
-        "priority": task.priority,
-        "project_id": project_id,  # Automatically assign to this project
-        "organization_id": org["id"],
-        "created_by": current_user["id"],
-        "assigned_to": task.assignee_id,
-        "due_date": task.due_date,
-        "tags": task.tags or [],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    result = await db.tasks.insert_one(task_doc)
-    task_doc["id"] = str(result.inserted_id)
-    del task_doc["_id"]
+    # Same document shape as the other task create paths; the path names the project
+    task = task.model_copy(update={"project_id": project_id})
+    async with change_write(org["id"]) as change_seq:
+        task_doc = new_task_document(org["_id"], task, current_user["id"], change_seq)
+        task_doc["rank"] = await RankService(db).place(None, task_doc["project_id"], task_doc["status"])
+        await db.tasks.insert_one(task_doc)
+        await OrgStatsService(db).increment(
+            org["id"], tasks=1, completed_tasks=int(task_doc["status"] == TASK_STATUS_DONE)
+        )
+    task_doc = serialize_document(task_doc)
     
     # Broadcast real-time update
     await broadcast_update(org["id"], "task_created", {
         "task": task_doc,
         "project_id": project_id
-    })
+    }, version=task_doc["change_seq"])
     
     return {"success": True, "data": task_doc}
 
 @app.get("/api/{org_slug}/members")
-async def get_organization_members(org_slug: str, current_user = Depends(get_current_user)):
-    """Get organization members"""
+async def get_organization_members(org_slug: str, request: Request, response: Response,
+                                   fields: Optional[str] = None,
+                                   current_user = Depends(get_current_user)):
+    """Get organization members
+    
+    ``fields`` is a sparse fieldset for members (``fields=email,role``);
+    user documents are only read when a user field is requested.
+    """
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
+    
+    selected = select_fields(fields, MEMBER_FIELDS) or MEMBER_FIELDS
+    user_fields = [field for field in ("email", "first_name", "last_name") if field in selected]
+    
+    memberships = await db.organization_members.find(
+        {"organization_id": org["_id"]}, {"user_id": 1, "role": 1, "joined_at": 1}
+    ).to_list(length=None)
+    users = {}
+    async for user in db.users.find(
+        {"_id": {"$in": [membership["user_id"] for membership in memberships]}},
+        projection(user_fields) if user_fields else {"_id": 1}
+    ):
+        users[user["_id"]] = user
+    
     members = []
-    async for membership in db.organization_members.find({"organization_id": org["id"]}):
-        user = await db.users.find_one({"_id": ObjectId(membership["user_id"])})
+    for membership in memberships:
+        user = users.get(membership["user_id"])
         if user:
             # Handle joined_date - it might be a datetime or string
             joined_at = membership.get("joined_at", datetime.utcnow())
@@ -911,20 +1460,20 @@ async def get_organization_members(org_slug: str, current_user = Depends(get_cur
             else:
                 joined_date = joined_at.isoformat()
             
-            members.append({
-                "id": str(user["_id"]),
-                "email": user["email"],
-                "first_name": user["first_name"],
-                "last_name": user["last_name"],
+            member = {
+                "email": user.get("email"),
+                "first_name": user.get("first_name"),
+                "last_name": user.get("last_name"),
                 "role": membership["role"],
                 "status": "active",
                 "joined_date": joined_date,
                 "last_active": datetime.utcnow().isoformat()
-            })
+            }
+            members.append({"id": str(user["_id"]), **{field: member[field] for field in selected}})
     
     # Get pending invitations
     invited_users = []
-    async for invite in db.invitations.find({"organization_id": org["id"], "status": "pending"}):
+    async for invite in db.invitations.find({"organization_id": org["_id"], "status": "pending"}):
         invited_users.append({
             "id": str(invite["_id"]),
             "email": invite["email"],
@@ -955,15 +1504,15 @@ async def invite_member(org_slug: str, request: InviteMemberRequest, current_use
     if existing_user:
         # Check if already a member
         existing_membership = await db.organization_members.find_one({
-            "organization_id": org["id"], 
-            "user_id": str(existing_user["_id"])
+            "organization_id": org["_id"], 
+            "user_id": existing_user["_id"]
         })
         if existing_membership:
             raise HTTPException(status_code=400, detail="User is already a member of this organization")
     
     # Check if already invited
     existing_invite = await db.invitations.find_one({
-        "organization_id": org["id"],
+        "organization_id": org["_id"],
         "email": request.email,
         "status": "pending"
     })
@@ -971,7 +1520,7 @@ async def invite_member(org_slug: str, request: InviteMemberRequest, current_use
         raise HTTPException(status_code=400, detail="User has already been invited")
     
     # Create invitation
-    invitation = {
+    invitation = invitation_document({
         "organization_id": org["id"],
         "email": request.email,
         "role": request.role,
@@ -980,11 +1529,10 @@ async def invite_member(org_slug: str, request: InviteMemberRequest, current_use
         "invited_by_name": f"{current_user['first_name']} {current_user['last_name']}",
         "status": "pending",
         "created_at": datetime.utcnow()
-    }
+    })
     
-    result = await db.invitations.insert_one(invitation)
-    invitation["id"] = str(result.inserted_id)
-    del invitation["_id"]
+    await db.invitations.insert_one(invitation)
+    invitation = serialize_document(invitation)
     
     # Send email invitation
     print(f"DEBUG: Sending invitation email to {request.email} for organization {org['name']}")
@@ -1023,8 +1571,8 @@ async def update_member_role(org_slug: str, member_id: str, request: UpdateMembe
     
     # Cannot change owner role
     member_membership = await db.organization_members.find_one({
-        "organization_id": org["id"],
-        "user_id": member_id
+        "organization_id": org["_id"],
+        "user_id": object_id(member_id, "member_id")
     })
     
     if not member_membership:
@@ -1035,9 +1583,11 @@ async def update_member_role(org_slug: str, member_id: str, request: UpdateMembe
     
     # Update role
     await db.organization_members.update_one(
-        {"organization_id": org["id"], "user_id": member_id},
+        {"organization_id": org["_id"], "user_id": object_id(member_id, "member_id")},
         {"$set": {"role": request.role, "updated_at": datetime.utcnow()}}
     )
+    invalidate_membership_cache(org["id"], member_id)
+    await bump_change_version(org["id"])
     
     return {"success": True, "message": "Member role updated successfully"}
 
@@ -1052,8 +1602,8 @@ async def remove_member(org_slug: str, member_id: str, current_user = Depends(ge
     
     # Cannot remove owner
     member_membership = await db.organization_members.find_one({
-        "organization_id": org["id"],
-        "user_id": member_id
+        "organization_id": org["_id"],
+        "user_id": object_id(member_id, "member_id")
     })
     
     if not member_membership:
@@ -1064,9 +1614,12 @@ async def remove_member(org_slug: str, member_id: str, current_user = Depends(ge
     
     # Remove member
     await db.organization_members.delete_one({
-        "organization_id": org["id"],
-        "user_id": member_id
+        "organization_id": org["_id"],
+        "user_id": object_id(member_id, "member_id")
     })
+    invalidate_membership_cache(org["id"], member_id)
+    await OrgStatsService(db).increment(org["id"], members=-1)
+    await bump_change_version(org["id"])
     
     return {"success": True, "message": "Member removed successfully"}
 
@@ -1080,12 +1633,13 @@ async def cancel_invitation(org_slug: str, invitation_id: str, current_user = De
     
     result = await db.invitations.delete_one({
         "_id": ObjectId(invitation_id),
-        "organization_id": org["id"],
+        "organization_id": org["_id"],
         "status": "pending"
     })
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Invitation not found")
+    await bump_change_version(org["id"])
     
     return {"success": True, "message": "Invitation cancelled"}
 
@@ -1139,6 +1693,9 @@ async def update_user_settings(org_slug: str, request: UserSettingsRequest, curr
             {"_id": ObjectId(current_user["id"])},
             {"$set": update_data}
         )
+        principal_cache.invalidate(current_user["id"])
+        # Names show up in the member list
+        await bump_change_version(org["id"])
     
     return {"success": True, "message": "Profile updated successfully"}
 
@@ -1188,9 +1745,11 @@ async def update_organization_settings(org_slug: str, request: OrganizationSetti
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         await db.organizations.update_one(
-            {"_id": ObjectId(org["id"])},
+            {"_id": org["_id"]},
             {"$set": update_data}
         )
+        invalidate_organization_cache(org_slug)
+        await bump_change_version(org["id"])
     
     return {"success": True, "message": "Organization settings updated successfully"}
 
@@ -1279,15 +1838,11 @@ async def change_password(org_slug: str, request: PasswordChangeRequest, current
         if not stored_password:
             raise HTTPException(status_code=500, detail="User password not properly configured")
             
-        # Ensure stored_password is bytes for bcrypt
-        if isinstance(stored_password, str):
-            stored_password = stored_password.encode('utf-8')
-            
-        if not bcrypt.checkpw(request.current_password.encode('utf-8'), stored_password):
+        if not await verify_password(request.current_password, stored_password):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
         
         # Hash new password
-        hashed_password = bcrypt.hashpw(request.new_password.encode('utf-8'), bcrypt.gensalt())
+        hashed_password = await hash_password(request.new_password)
         
         # Update password - try both field names for compatibility
         update_fields = {"updated_at": datetime.utcnow()}
@@ -1300,6 +1855,7 @@ async def change_password(org_slug: str, request: PasswordChangeRequest, current
             {"_id": ObjectId(current_user["id"])},
             {"$set": update_fields}
         )
+        principal_cache.invalidate(current_user["id"])
         
         return JSONResponse(
             content={"success": True, "message": "Password updated successfully"},
@@ -1345,6 +1901,8 @@ async def delete_account(org_slug: str, current_user = Depends(get_current_user)
             if admin_count <= 1:
                 # If this is the only admin, delete the entire organization
                 await delete_organization_and_data(org["_id"])
+                invalidate_organization_cache(org_slug)
+                invalidate_membership_cache(org["id"])
             else:
                 # Remove user from organization but keep the org
                 await delete_user_from_organization(user_id, org["_id"])
@@ -1361,6 +1919,8 @@ async def delete_account(org_slug: str, current_user = Depends(get_current_user)
         if other_memberships == 0:
             # User has no other organizations, delete user account
             await db.users.delete_one({"_id": user_id})
+        principal_cache.invalidate(current_user["id"])
+        invalidate_membership_cache(org["id"], current_user["id"])
         
         return JSONResponse(
             content={"success": True, "message": "Account deleted successfully"},
@@ -1377,22 +1937,23 @@ async def delete_account(org_slug: str, current_user = Depends(get_current_user)
 async def delete_user_from_organization(user_id: ObjectId, org_id: ObjectId):
     """Remove user from organization and clean up their data"""
     # Remove user from organization
-    await db.organization_members.delete_one({
+    result = await db.organization_members.delete_one({
         "user_id": user_id,
         "organization_id": org_id
     })
-    
-    # Remove user assignments from tasks
-    await db.tasks.update_many(
-        {"organization_id": org_id, "assigned_to": user_id},
-        {"$unset": {"assigned_to": ""}}
-    )
-    
-    # Remove user from project members
-    await db.projects.update_many(
-        {"organization_id": org_id},
-        {"$pull": {"members": {"user_id": user_id}}}
-    )
+    await OrgStatsService(db).increment(str(org_id), members=-result.deleted_count)
+    async with change_write(str(org_id)) as change_seq:
+        # Remove user assignments from tasks
+        await db.tasks.update_many(
+            {"organization_id": org_id, "assigned_to": user_id},
+            {"$unset": {"assigned_to": ""}, "$set": {"change_seq": change_seq}}
+        )
+        
+        # Remove user from project members
+        await db.projects.update_many(
+            {"organization_id": org_id, "members.user_id": user_id},
+            {"$pull": {"members": {"user_id": user_id}}, "$set": {"change_seq": change_seq}}
+        )
 
 async def delete_organization_and_data(org_id: ObjectId):
     """Delete entire organization and all associated data"""
@@ -1405,8 +1966,187 @@ async def delete_organization_and_data(org_id: ObjectId):
     # Delete all organization members
     await db.organization_members.delete_many({"organization_id": org_id})
     
+    # Nobody is left to sync deletes to
+    await db.tombstones.delete_many({"organization_id": org_id})
+    await db.task_imports.delete_many({"organization_id": org_id})
+    
     # Delete the organization itself
     await db.organizations.delete_one({"_id": org_id})
+    await OrgStatsService(db).delete(str(org_id))
+    await ChangeVersionService(db, version_cache).delete(str(org_id))
+
+@app.post("/api/{org_slug}/stats/repair")
+async def repair_organization_stats(org_slug: str, current_user = Depends(get_current_user)):
+    """Recompute the organization's counters from the source collections"""
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    if user_role not in ["admin", "owner"]:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+    
+    stats = await OrgStatsService(db).recompute(org["id"])
+    del stats["_id"]
+    await bump_change_version(org["id"])
+    
+    return {"success": True, "data": stats}
+
+@app.get("/api/{org_slug}/sync")
+async def sync_changes(org_slug: str, since: Optional[str] = None, limit: Optional[int] = None,
+                       current_user = Depends(get_current_user)):
+    """Tasks and projects created, updated or deleted since a sync token
+    
+    Call without ``since`` before loading the lists to get a starting token,
+    then pass each ``next_token`` back; keep going while ``has_more``.
+    """
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    committed = await ChangeVersionService(db, version_cache).committed(org["id"])
+    try:
+        changes = await SyncService(db).changes(org["id"], committed, since=since, limit=limit)
+    except SyncTokenExpired:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Sync token expired, reload the lists")
+    
+    changes["projects"] = [document_view(project) for project in changes["projects"]]
+    changes["tasks"] = [document_view(task) for task in changes["tasks"]]
+    return bson_response({"success": True, "data": changes})
+
+@app.get("/api/{org_slug}/export/{collection}")
+async def export_organization_data(org_slug: str, collection: str, format: str = "ndjson",
+                                   current_user = Depends(get_current_user)):
+    """Stream all tasks, projects or members of the organization as NDJSON or CSV
+    
+    Admins and owners only: an export is the whole organization at once,
+    member emails included, unlike the paged reads open to every member.
+    """
+    from fastapi.responses import StreamingResponse
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    if user_role not in ["admin", "owner"]:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+    if collection not in EXPORT_FIELDS:
+        raise HTTPException(status_code=404, detail="Unknown export collection")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be ndjson or csv")
+    
+    return StreamingResponse(
+        ExportService(db).stream(collection, org["_id"], format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{org_slug}-{collection}.{format}"'}
+    )
+
+def imported_task(row: Dict[str, Any], project_id: str) -> TaskCreate:
+    """TaskCreate from an import row, using the task export's column names"""
+    fields = {key: value for key, value in row.items() if value not in ("", None)}
+    tags = fields.get("tags", [])
+    if isinstance(tags, str):
+        # CSV exports join tags with ";"
+        tags = [tag.strip() for tag in tags.split(";") if tag.strip()]
+    return TaskCreate(
+        title=fields.get("title"),
+        description=fields.get("description"),
+        status=fields.get("status", "todo"),
+        priority=fields.get("priority", "medium"),
+        project_id=project_id,
+        assignee_id=fields.get("assigned_to", fields.get("assignee_id")),
+        due_date=fields.get("due_date"),
+        tags=tags
+    )
+
+def import_error(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        return f"{'.'.join(str(part) for part in first['loc'])}: {first['msg']}"
+    return str(error)
+
+@app.post("/api/{org_slug}/projects/{project_id}/tasks/import")
+async def import_project_tasks(org_slug: str, project_id: str, request: Request, format: str = "csv",
+                               current_user = Depends(get_current_user)):
+    """Import tasks into a project from a CSV or NDJSON upload
+    
+    The request body is the file itself (not a multipart form) and is
+    processed batch by batch as it arrives. Rows that fail validation or
+    insertion are reported by row number and the rest are still imported.
+    Progress of running imports is available from ``GET /api/{org_slug}/imports``.
+    Any member may import, as any member may create the same tasks one at
+    a time.
+    """
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be csv or ndjson")
+    
+    project = await db.projects.find_one({
+        "_id": object_id(project_id, "project_id"),
+        "organization_id": org["_id"]
+    }, {"_id": 1})
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    service = ImportService(db)
+    import_id = await service.start(org["_id"], project["_id"], current_user["id"], format)
+    change_seq = None
+    try:
+        async for batch in service.batches(request.stream(), format):
+            # Pending until the batch is in, so sync tokens cannot skip past it
+            async with change_write(org["id"]) as change_seq:
+                # Fresh per batch: the column tail moves with concurrent appends
+                ranks = RankService(db)
+                docs, numbers, errors = [], [], []
+                for number, row in batch:
+                    if isinstance(row, str):
+                        errors.append({"row": number, "detail": row})
+                        continue
+                    try:
+                        task_doc = new_task_document(
+                            org["_id"], imported_task(row, project_id), current_user["id"], change_seq
+                        )
+                    except ValueError as e:  # pydantic ValidationError or InvalidDocument
+                        errors.append({"row": number, "detail": import_error(e)})
+                        continue
+                    task_doc["rank"] = await ranks.place(None, project["_id"], task_doc["status"])
+                    docs.append(task_doc)
+                    numbers.append(number)
+            
+                failed = await service.insert(docs)
+                errors.extend({"row": numbers[index], "detail": detail} for index, detail in failed.items())
+                inserted = [task_doc for index, task_doc in enumerate(docs) if index not in failed]
+                await OrgStatsService(db).increment(
+                    org["id"], tasks=len(inserted),
+                    completed_tasks=sum(task_doc["status"] == TASK_STATUS_DONE for task_doc in inserted)
+                )
+            
+            await service.progress(import_id, len(batch), len(inserted), sorted(errors, key=lambda error: error["row"]))
+    except Exception:
+        await service.finish(import_id, status="failed")
+        raise
+    
+    summary = await service.finish(import_id)
+    if summary["inserted"]:
+        # One broadcast for the whole import; clients reload the project's tasks
+        await broadcast_update(org["id"], "tasks_imported", {
+            "project_id": project_id,
+            "inserted": summary["inserted"]
+        }, version=change_seq)
+    
+    return bson_response({"success": True, "data": document_view(summary)})
+
+@app.get("/api/{org_slug}/imports")
+async def get_task_imports(org_slug: str, current_user = Depends(get_current_user)):
+    """Recent task imports of the organization with their progress counters"""
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    imports = await ImportService(db).recent(org["_id"])
+    return bson_response({"success": True, "data": [document_view(task_import) for task_import in imports]})
+
+@app.get("/api/{org_slug}/imports/{import_id}")
+async def get_task_import(org_slug: str, import_id: str, current_user = Depends(get_current_user)):
+    """One task import, including its row errors"""
+    org, user_role = await get_user_organization(org_slug, current_user["id"])
+    task_import = await db.task_imports.find_one({
+        "_id": object_id(import_id, "import_id"),
+        "organization_id": org["_id"]
+    })
+    if not task_import:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return bson_response({"success": True, "data": document_view(task_import)})
 
 # Reports APIs
 @app.get("/api/{org_slug}/reports/overview")
@@ -1425,126 +2165,57 @@ async def get_reports_overview(org_slug: str, timeframe: str = "30d", current_us
     else:  # default 30d
         start_date = now - timedelta(days=30)
     
-    # Get projects count
-    total_projects = await db.projects.count_documents({"organization_id": org["id"]})
-    
-    # Debug: Let's see what projects and statuses exist
-    all_projects = await db.projects.find({"organization_id": org["id"]}).to_list(length=None)
-    print(f"DEBUG Dashboard: Found {len(all_projects)} projects for org {org['id']}")
-    for project in all_projects:
-        print(f"DEBUG Dashboard: Project '{project.get('name')}' has status '{project.get('status')}'")
-    
-    # Count active projects (case-insensitive search for active status)
-    active_projects = await db.projects.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$regex": "^active$", "$options": "i"}
-    })
-    completed_projects = await db.projects.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$regex": "^completed$", "$options": "i"}
-    })
-    
-    print(f"DEBUG Dashboard: active_projects count: {active_projects}")
-    print(f"DEBUG Dashboard: total_projects count: {total_projects}")
+    # Project, task and member totals from the org_stats counters
+    stats = await OrgStatsService(db).get(org["id"])
+    projects_by_status = stats.get("projects_by_status", {})
+    total_projects = stats.get("projects", 0)
+    active_projects = projects_by_status.get("active", 0)
+    completed_projects = projects_by_status.get("completed", 0)
+    total_tasks = stats.get("tasks", 0)
+    completed_tasks = stats.get("completed_tasks", 0)
+    team_members = stats.get("members", 0)
     
-    # Get tasks count
-    total_tasks = await db.tasks.count_documents({"organization_id": org["id"]})
-    completed_tasks = await db.tasks.count_documents({
-        "organization_id": org["id"], 
-        "status": {"$in": ["completed", "done"]}  # Support both "completed" and "done"
-    })
     overdue_tasks = await db.tasks.count_documents({
-        "organization_id": org["id"], 
+        "organization_id": org["_id"], 
         "due_date": {"$lt": now},
-        "status": {"$nin": ["completed", "done"]}  # Exclude both "completed" and "done"
+        "status": {"$ne": TASK_STATUS_DONE}
     })
     
-    # Get team members count
-    team_members = await db.organization_members.count_documents({"organization_id": org["id"]})
-    
-    # Calculate actual average completion time
-    avg_completion_time = "N/A"
-    try:
-        print(f"DEBUG Avg Completion: Starting calculation for org {org['id']}")
-        
-        # Get completed tasks with both created and completion dates
-        completed_tasks_with_dates = await db.tasks.find({
-            "organization_id": org["id"],
-            "status": {"$in": ["completed", "done"]},
-            "created_at": {"$exists": True},
-            "updated_at": {"$exists": True}
-        }).to_list(length=None)
-        
-        print(f"DEBUG Avg Completion: Found {len(completed_tasks_with_dates)} completed tasks with timestamps")
-        
-        if completed_tasks_with_dates:
-            total_completion_days = 0
-            valid_tasks = 0
-            
-            for task in completed_tasks_with_dates:
-                created_at = task.get("created_at")
-                updated_at = task.get("updated_at")
-                
-                print(f"DEBUG Avg Completion: Task '{task.get('title')}' - created: {created_at}, updated: {updated_at}")
-                
-                if created_at and updated_at:
-                    # Parse dates if they're strings
-                    if isinstance(created_at, str):
-                        try:
-                            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        except Exception as e:
-                            print(f"DEBUG Avg Completion: Error parsing created_at '{created_at}': {e}")
-                            continue
-                    if isinstance(updated_at, str):
-                        try:
-                            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                        except Exception as e:
-                            print(f"DEBUG Avg Completion: Error parsing updated_at '{updated_at}': {e}")
-                            continue
-                    
-                    # Calculate completion time in days
-                    completion_time = updated_at - created_at
-                    completion_days = completion_time.total_seconds() / (24 * 3600)  # Convert to days
-                    
-                    print(f"DEBUG Avg Completion: Task completion time: {completion_days:.2f} days")
-                    
-                    # Only count reasonable completion times (0.1 to 365 days)
-                    if 0.1 <= completion_days <= 365:
-                        total_completion_days += completion_days
-                        valid_tasks += 1
-                        print(f"DEBUG Avg Completion: Added to calculation (valid tasks: {valid_tasks})")
-                    else:
-                        print(f"DEBUG Avg Completion: Rejected completion time: {completion_days:.2f} days (out of range)")
-            
-            print(f"DEBUG Avg Completion: Valid tasks: {valid_tasks}, Total days: {total_completion_days}")
-            
-            if valid_tasks > 0:
-                avg_days = total_completion_days / valid_tasks
-                print(f"DEBUG Avg Completion: Calculated average: {avg_days:.2f} days")
-                if avg_days < 1:
-                    avg_completion_time = f"{avg_days * 24:.1f} hours"
-                else:
-                    avg_completion_time = f"{avg_days:.1f} days"
-            else:
-                avg_completion_time = "< 1 day"
-        else:
-            print("DEBUG Avg Completion: No completed tasks with timestamps found")
-            
-            # Check if there are any tasks at all
-            all_tasks_debug = await db.tasks.find({"organization_id": org["id"]}).to_list(length=None)
-            print(f"DEBUG Avg Completion: Total tasks in org: {len(all_tasks_debug)}")
-            for task in all_tasks_debug:
-                print(f"DEBUG Avg Completion: Task '{task.get('title')}' has fields: {list(task.keys())}")
-            
-            avg_completion_time = "No data"
-            
-    except Exception as e:
-        print(f"DEBUG Avg Completion: Error calculating average completion time: {e}")
-        import traceback
-        traceback.print_exc()
-        avg_completion_time = "N/A"
-    
-    print(f"DEBUG Avg Completion: Final result: {avg_completion_time}")
+    # Completion time statistics for tasks finished within the timeframe,
+    # computed server-side from completed_at ($percentile needs MongoDB 7.0+)
+    completion_pipeline = [
+        {"$match": {
+            "organization_id": org["_id"],
+            "status": TASK_STATUS_DONE,
+            "completed_at": {"$gte": start_date}
+        }},
+        {"$project": {
+            "minutes": {"$dateDiff": {
+                "startDate": {"$convert": {"input": "$created_at", "to": "date", "onError": None, "onNull": None}},
+                "endDate": "$completed_at",
+                "unit": "minute"
+            }}
+        }},
+        {"$match": {"minutes": {"$gte": 0}}},
+        {"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "average": {"$avg": "$minutes"},
+            "percentiles": {"$percentile": {"input": "$minutes", "p": [0.5, 0.9], "method": "approximate"}}
+        }}
+    ]
+    completion_results = await db.tasks.aggregate(completion_pipeline).to_list(length=1)
+    
+    if completion_results:
+        completion = completion_results[0]
+        median_minutes, p90_minutes = completion["percentiles"]
+        completed_in_timeframe = completion["count"]
+        avg_completion_time = format_completion_time(completion["average"] * 60 * 1000)
+        median_completion_time = format_completion_time(median_minutes * 60 * 1000)
+        p90_completion_time = format_completion_time(p90_minutes * 60 * 1000)
+    else:
+        completed_in_timeframe = 0
+        avg_completion_time = median_completion_time = p90_completion_time = "No data"
     
     return {"success": True, "data": {
         "total_projects": total_projects,
@@ -1554,7 +2225,11 @@ async def get_reports_overview(org_slug: str, timeframe: str = "30d", current_us
         "completed_tasks": completed_tasks,
         "overdue_tasks": overdue_tasks,
         "team_members": team_members,
-        "avg_completion_time": avg_completion_time
+        "timeframe": timeframe,
+        "completed_in_timeframe": completed_in_timeframe,
+        "avg_completion_time": avg_completion_time,
+        "median_completion_time": median_completion_time,
+        "p90_completion_time": p90_completion_time
     }}
 
 @app.get("/api/{org_slug}/reports/projects")
@@ -1562,18 +2237,41 @@ async def get_project_reports(org_slug: str, current_user = Depends(get_current_
     """Get project performance reports"""
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
+    now = datetime.utcnow()
+    
+    # Per-project task counters in a single $group, independent of project count
+    task_counts = {}
+    pipeline = [
+        {"$match": {"organization_id": org["_id"]}},
+        {"$group": {
+            "_id": "$project_id",
+            "total": {"$sum": 1},
+            "completed": {"$sum": {
+                "$cond": [{"$eq": ["$status", TASK_STATUS_DONE]}, 1, 0]
+            }},
+            "overdue": {"$sum": {
+                "$cond": [
+                    {"$and": [
+                        # Only real dates are comparable, matching the old $lt query semantics
+                        {"$eq": [{"$type": "$due_date"}, "date"]},
+                        {"$lt": ["$due_date", now]},
+                        {"$ne": ["$status", TASK_STATUS_DONE]}
+                    ]},
+                    1,
+                    0
+                ]
+            }}
+        }}
+    ]
+    async for bucket in db.tasks.aggregate(pipeline):
+        task_counts[bucket["_id"]] = bucket
+    
     project_stats = []
-    async for project in db.projects.find({"organization_id": org["id"]}):
-        total_tasks = await db.tasks.count_documents({"project_id": str(project["_id"])})
-        completed_tasks = await db.tasks.count_documents({
-            "project_id": str(project["_id"]), 
-            "status": {"$in": ["completed", "done"]}  # Support both "completed" and "done"
-        })
-        overdue_tasks = await db.tasks.count_documents({
-            "project_id": str(project["_id"]), 
-            "due_date": {"$lt": datetime.utcnow()},
-            "status": {"$nin": ["completed", "done"]}  # Exclude both "completed" and "done"
-        })
+    async for project in db.projects.find({"organization_id": org["_id"]}, {"name": 1}):
+        counts = task_counts.get(project["_id"], {})
+        total_tasks = counts.get("total", 0)
+        completed_tasks = counts.get("completed", 0)
+        overdue_tasks = counts.get("overdue", 0)
         
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
@@ -1588,68 +2286,105 @@ async def get_project_reports(org_slug: str, current_user = Depends(get_current_
     return {"success": True, "data": project_stats}
 
 @app.get("/api/{org_slug}/reports/team")
-async def get_team_reports(org_slug: str, current_user = Depends(get_current_user)):
+async def get_team_reports(org_slug: str, request: Request, response: Response,
+                           current_user = Depends(get_current_user)):
     """Get team performance reports"""
     org, user_role = await get_user_organization(org_slug, current_user["id"])
     
-    # Debug: Check what tasks exist and their assignment
-    all_tasks = await db.tasks.find({"organization_id": org["id"]}).to_list(length=None)
-    print(f"DEBUG Team Reports: Found {len(all_tasks)} total tasks for org {org['id']}")
-    for task in all_tasks:
-        print(f"DEBUG Team Reports: Task '{task.get('title')}' assigned_to: {task.get('assigned_to', 'None')}")
-    
-    # Count unassigned tasks
-    unassigned_tasks = await db.tasks.count_documents({
-        "organization_id": org["id"],
-        "$or": [
-            {"assigned_to": {"$exists": False}},
-            {"assigned_to": None},
-            {"assigned_to": ""}
-        ]
-    })
-    unassigned_completed_tasks = await db.tasks.count_documents({
-        "organization_id": org["id"],
-        "$or": [
-            {"assigned_to": {"$exists": False}},
-            {"assigned_to": None},
-            {"assigned_to": ""}
-        ],
-        "status": {"$in": ["completed", "done"]}
-    })
+    not_modified = await check_not_modified(request, response, org["id"])
+    if not_modified:
+        return not_modified
+    
+    pipeline = [
+        {"$match": {"organization_id": org["_id"]}},
+        {"$project": {
+            # Missing, null and empty assignees all count as unassigned
+            "assignee": {"$cond": [
+                {"$in": [{"$ifNull": ["$assigned_to", ""]}, ["", None]]},
+                None,
+                "$assigned_to"
+            ]},
+            "completed": {"$eq": ["$status", TASK_STATUS_DONE]},
+            "completion_ms": {"$cond": [
+                {"$eq": ["$status", TASK_STATUS_DONE]},
+                {"$subtract": [
+                    # Tasks finished before completed_at existed fall back to updated_at
+                    {"$convert": {"input": {"$ifNull": ["$completed_at", "$updated_at"]}, "to": "date", "onError": None, "onNull": None}},
+                    {"$convert": {"input": "$created_at", "to": "date", "onError": None, "onNull": None}}
+                ]},
+                None
+            ]}
+        }},
+        {"$group": {
+            "_id": "$assignee",
+            "assigned_tasks": {"$sum": 1},
+            "completed_tasks": {"$sum": {"$cond": ["$completed", 1, 0]}},
+            "completion_ms_total": {"$sum": {
+                "$cond": [{"$gte": ["$completion_ms", 0]}, "$completion_ms", 0]
+            }},
+            "completion_samples": {"$sum": {
+                "$cond": [{"$gte": ["$completion_ms", 0]}, 1, 0]
+            }}
+        }},
+        # Bring in every member so people without tasks are still listed
+        {"$unionWith": {
+            "coll": "organization_members",
+            "pipeline": [
+                {"$match": {"organization_id": org["_id"]}},
+                {"$project": {"_id": "$user_id", "member_since": "$_id"}}
+            ]
+        }},
+        {"$group": {
+            "_id": "$_id",
+            "member_since": {"$max": "$member_since"},
+            "assigned_tasks": {"$sum": "$assigned_tasks"},
+            "completed_tasks": {"$sum": "$completed_tasks"},
+            "completion_ms_total": {"$sum": "$completion_ms_total"},
+            "completion_samples": {"$sum": "$completion_samples"}
+        }},
+        {"$lookup": {
+            "from": "users",
+            "let": {"user_id": "$_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$user_id"]}}},
+                {"$project": {"first_name": 1, "last_name": 1}}
+            ],
+            "as": "user"
+        }},
+        {"$sort": {"member_since": 1}}
+    ]
+    rows = await db.tasks.aggregate(pipeline).to_list(length=None)
+    
+    unassigned = {"assigned_tasks": 0, "completed_tasks": 0, "completion_ms_total": 0, "completion_samples": 0}
+    members = []
+    for row in rows:
+        if row["_id"] is None:
+            unassigned = row
+        elif row.get("member_since") is not None:
+            members.append(row)
     
-    print(f"DEBUG Team Reports: Found {unassigned_tasks} unassigned tasks, {unassigned_completed_tasks} completed")
+    total_members = len(members)
+    unassigned_tasks = unassigned["assigned_tasks"]
+    unassigned_completed_tasks = unassigned["completed_tasks"]
     
     team_stats = []
-    member_count = 0
-    total_members = await db.organization_members.count_documents({"organization_id": org["id"]})
-    
-    async for membership in db.organization_members.find({"organization_id": org["id"]}):
-        member_count += 1
-        user = await db.users.find_one({"_id": ObjectId(membership["user_id"])})
-        if not user:
-            print(f"DEBUG Team Reports: User not found for membership {membership['user_id']}")
+    for member in members:
+        if not member["user"]:
             continue
+        user = member["user"][0]
         
-        print(f"DEBUG Team Reports: Processing user {user['first_name']} {user['last_name']} (ID: {membership['user_id']})")
-            
-        assigned_tasks = await db.tasks.count_documents({
-            "organization_id": org["id"],
-            "assigned_to": membership["user_id"]
-        })
-        completed_tasks = await db.tasks.count_documents({
-            "organization_id": org["id"],
-            "assigned_to": membership["user_id"],
-            "status": {"$in": ["completed", "done"]}
-        })
+        assigned_tasks = member["assigned_tasks"]
+        completed_tasks = member["completed_tasks"]
+        completion_ms_total = member["completion_ms_total"]
+        completion_samples = member["completion_samples"]
         
         # If this is the only team member and there are unassigned tasks, 
         # attribute them to this member for reporting purposes
         if total_members == 1 and unassigned_tasks > 0:
-            print(f"DEBUG Team Reports: Single member org - attributing {unassigned_tasks} unassigned tasks to {user['first_name']}")
             assigned_tasks += unassigned_tasks
             completed_tasks += unassigned_completed_tasks
-        
-        print(f"DEBUG Team Reports: User {user['first_name']} - assigned: {assigned_tasks}, completed: {completed_tasks}")
+            completion_ms_total += unassigned["completion_ms_total"]
+            completion_samples += unassigned["completion_samples"]
         
         completion_rate = (completed_tasks / assigned_tasks * 100) if assigned_tasks > 0 else 0
         
@@ -1658,7 +2393,9 @@ async def get_team_reports(org_slug: str, current_user = Depends(get_current_use
             "assigned_tasks": assigned_tasks,
             "completed_tasks": completed_tasks,
             "completion_rate": round(completion_rate, 1),
-            "average_completion_time": f"{2.5 + (hash(user['email']) % 20) / 10:.1f} days"  # Mock but consistent
+            "average_completion_time": format_completion_time(
+                completion_ms_total / completion_samples if completion_samples else None
+            )
         })
     
     # If there are unassigned tasks and multiple members, add an "Unassigned" entry
@@ -1672,7 +2409,6 @@ async def get_team_reports(org_slug: str, current_user = Depends(get_current_use
             "average_completion_time": "N/A"
         })
     
-    print(f"DEBUG Team Reports: Found {member_count} organization members, returning {len(team_stats)} team stats")
     return {"success": True, "data": team_stats}
 
 # Debug endpoint to check organization data
@@ -1682,9 +2418,9 @@ async def debug_data_check(org_slug: str, current_user = Depends(get_current_use
     try:
         org, user_role = await get_user_organization(org_slug, current_user["id"])
         
-        projects = await db.projects.find({"organization_id": org["id"]}).to_list(length=None)
-        tasks = await db.tasks.find({"organization_id": org["id"]}).to_list(length=None)
-        members = await db.organization_members.find({"organization_id": org["id"]}).to_list(length=None)
+        projects = await db.projects.find({"organization_id": org["_id"]}).to_list(length=None)
+        tasks = await db.tasks.find({"organization_id": org["_id"]}).to_list(length=None)
+        members = await db.organization_members.find({"organization_id": org["_id"]}).to_list(length=None)
         
         return {
             "success": True,
@@ -1708,12 +2444,12 @@ async def debug_data_check(org_slug: str, current_user = Depends(get_current_use
 @app.websocket("/ws/{org_slug}")
 async def websocket_endpoint(websocket: WebSocket, org_slug: str):
     # Get organization ID from slug
-    org = await db.organizations.find_one({"slug": org_slug})
+    org = await get_organization_by_slug(org_slug)
     if not org:
         await websocket.close(code=4004, reason="Organization not found")
         return
     
-    organization_id = str(org["_id"])
+    organization_id = org["id"]
     await websocket_manager.connect(websocket, organization_id)
     
     try:
@@ -1725,7 +2461,11 @@ async def websocket_endpoint(websocket: WebSocket, org_slug: str):
         websocket_manager.disconnect(websocket, organization_id)
 
 # Helper function to broadcast real-time updates
-async def broadcast_update(org_id: str, update_type: str, data: dict):
+async def broadcast_update(org_id: str, update_type: str, data: dict, version: Optional[int] = None):
+    # Writes that already took a change version for change_seq pass it in
+    if version is None:
+        await bump_change_version(org_id)
+    # Encoded once, by the manager, for all of the organization's connections
     message = {
         "type": update_type,
         "data": data,
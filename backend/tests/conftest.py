@@ -0,0 +1,10 @@
+"""
+Shared pytest setup: makes the backend modules (``app``, ``saas_server``)
+importable when pytest is run from the repository root or from backend/
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
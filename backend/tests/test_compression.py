@@ -0,0 +1,102 @@
+"""Accept-Encoding negotiation and the compression middleware (app.core.compression)"""
+import gzip
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+PREFERRED = ["br", "zstd", "gzip"]
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("br;q=0.0, zstd;q=0, gzip;q=0.5", "gzip"),
+    ("GZIP;q=1.0", "gzip"),
+    (" deflate , gzip ; q=0.8 ", "gzip"),
+    ("*", "br"),
+    ("*;q=0", None),
+    ("br;q=0, *", "zstd"),
+    ("gzip;q=0, *;q=0.5", "br"),
+    ("gzip;q=abc", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, PREFERRED) == expected
+
+
+def make_client(**options):
+    async def small(request):
+        return PlainTextResponse("x" * 100)
+
+    async def large(request):
+        return PlainTextResponse("row\n" * 1000)
+
+    async def image(request):
+        return PlainTextResponse("x" * 5000, media_type="image/png")
+
+    async def stream(request):
+        async def rows():
+            for number in range(3):
+                yield f"row {number}\n" * 100
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    app = Starlette(routes=[
+        Route("/small", small), Route("/large", large), Route("/image", image),
+        Route("/stream", stream), Route("/socket.io/large", large),
+    ])
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, encodings=["gzip"],
+                       exclude_paths=["/socket.io"], **options)
+    return TestClient(app)
+
+
+def raw_get(client, path, accept_encoding="gzip"):
+    """Response with the body as sent (the test client would otherwise decompress it)"""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_large_response_is_compressed():
+    response, body = raw_get(make_client(), "/large")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["content-length"] == str(len(body))
+    assert gzip.decompress(body) == b"row\n" * 1000
+
+
+@pytest.mark.parametrize("path, accept_encoding", [
+    ("/small", "gzip"),              # below minimum_size
+    ("/image", "gzip"),              # not a text-like type
+    ("/socket.io/large", "gzip"),    # excluded path
+    ("/large", "gzip;q=0"),          # refused by the client
+    ("/large", "br"),                # nothing the server produces
+])
+def test_response_is_sent_as_is(path, accept_encoding):
+    response, body = raw_get(make_client(), path, accept_encoding)
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(body))
+
+
+def test_stream_is_compressed_chunk_by_chunk():
+    response, body = raw_get(make_client(), "/stream")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+
+    # Each of the three chunks ends in a sync flush (an empty stored block),
+    # so its rows can be decoded as soon as it arrives
+    assert body.count(b"\x00\x00\xff\xff") >= 3
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(body).decode().count("row 2") == 100
+
+
+def test_stream_is_passed_through_when_streaming_is_off():
+    response, body = raw_get(make_client(streaming=False), "/stream")
+    assert "content-encoding" not in response.headers
+    assert body.decode().count("row 1") == 100
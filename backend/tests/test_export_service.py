@@ -0,0 +1,134 @@
+"""Streaming exports (app.services.export_service)"""
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.services.export_service import EXPORT_FIELDS, ExportService
+
+ORG_ID = ObjectId()
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def batch_size(self, size):
+        return self
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    """Just enough of a Motor collection for ExportService: equality and $in filters"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.finds = []
+
+    def find(self, query, projection=None):
+        self.finds.append((query, projection))
+
+        def matches(doc):
+            for field, condition in query.items():
+                if isinstance(condition, dict):
+                    if doc.get(field) not in condition["$in"]:
+                        return False
+                elif doc.get(field) != condition:
+                    return False
+            return True
+
+        return FakeCursor([dict(doc) for doc in self.docs if matches(doc)])
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+def make_task(title, created_at, **fields):
+    return {
+        "_id": ObjectId(), "organization_id": ORG_ID, "title": title,
+        "created_at": created_at, "status": "todo", **fields
+    }
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase(
+        tasks=FakeCollection([
+            make_task("second", datetime(2024, 1, 2), tags=["api", "ui"]),
+            make_task("first", datetime(2024, 1, 1), description="has, a comma"),
+            make_task("third", datetime(2024, 1, 3)),
+            make_task("other org", datetime(2024, 1, 1), organization_id=ObjectId()),
+        ]),
+        organization_members=FakeCollection([]),
+        users=FakeCollection([]),
+    )
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_is_one_chunk_per_batch(db):
+    chunks = await collect(ExportService(db, batch_size=2).stream("tasks", ORG_ID, "ndjson"))
+    assert len(chunks) == 2
+
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [row["title"] for row in rows] == ["first", "second", "third"]
+    assert list(rows[0]) == list(EXPORT_FIELDS["tasks"])
+    assert rows[0]["created_at"] == "2024-01-01T00:00:00"
+    assert rows[1]["tags"] == ["api", "ui"]
+    assert ObjectId(rows[0]["id"])
+
+
+@pytest.mark.asyncio
+async def test_csv_export_starts_with_the_header(db):
+    chunks = await collect(ExportService(db, batch_size=2).stream("tasks", ORG_ID, "csv"))
+    assert len(chunks) == 3
+
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [row["title"] for row in rows] == ["first", "second", "third"]
+    assert rows[0]["description"] == "has, a comma"
+    assert rows[1]["tags"] == "api;ui"
+    assert rows[2]["assigned_to"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_reads_only_exported_fields(db):
+    await collect(ExportService(db).stream("tasks", ORG_ID, "ndjson"))
+    query, projection = db.tasks.finds[0]
+    assert query == {"organization_id": ORG_ID}
+    assert "id" not in projection
+    assert set(projection) == set(EXPORT_FIELDS["tasks"]) - {"id"}
+
+
+@pytest.mark.asyncio
+async def test_member_export_joins_users():
+    user_id = ObjectId()
+    db = FakeDatabase(
+        organization_members=FakeCollection([
+            {"_id": ObjectId(), "organization_id": ORG_ID, "user_id": user_id, "role": "admin",
+             "joined_at": datetime(2024, 1, 1)},
+        ]),
+        users=FakeCollection([
+            {"_id": user_id, "email": "ada@example.com", "first_name": "Ada", "last_name": "Lovelace"},
+        ]),
+    )
+    chunks = await collect(ExportService(db).stream("members", ORG_ID, "ndjson"))
+    assert json.loads(chunks[0]) == {
+        "user_id": str(user_id), "email": "ada@example.com", "first_name": "Ada",
+        "last_name": "Lovelace", "role": "admin", "joined_at": "2024-01-01T00:00:00",
+    }
@@ -0,0 +1,38 @@
+"""Sparse fieldsets (app.core.fieldsets)"""
+import pytest
+
+from app.core.fieldsets import (
+    TASK_BOARD_FIELDS, TASK_FIELDS, TASK_PRESETS, projection, select_fields
+)
+from app.core.schema import InvalidDocument
+
+
+def test_no_fields_means_the_full_document():
+    assert select_fields(None, TASK_FIELDS) is None
+    assert select_fields(" , ", TASK_FIELDS) is None
+    assert projection(None, ["created_at"]) is None
+
+
+def test_selected_fields_keep_order_without_duplicates_or_id():
+    assert select_fields("status, title,id,status", TASK_FIELDS) == ("status", "title")
+
+
+def test_preset():
+    assert select_fields("board", TASK_FIELDS, TASK_PRESETS) == TASK_BOARD_FIELDS
+
+
+def test_preset_name_is_not_a_field_outside_presets():
+    with pytest.raises(InvalidDocument):
+        select_fields("board", TASK_FIELDS)
+
+
+@pytest.mark.parametrize("fields", ["password", "title,organization_id", "_id", "board,title"])
+def test_unknown_field_is_rejected(fields):
+    with pytest.raises(InvalidDocument) as excinfo:
+        select_fields(fields, TASK_FIELDS, TASK_PRESETS)
+    assert excinfo.value.field == "fields"
+
+
+def test_projection_always_includes_required_fields():
+    assert projection(("title",), ["created_at"]) == {"title": 1, "created_at": 1}
+    assert projection((), ["due_date"]) == {"due_date": 1}
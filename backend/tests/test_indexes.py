@@ -0,0 +1,24 @@
+"""Declarative index specification (app.core.indexes)"""
+import pytest
+
+from app.core.indexes import INDEX_SPEC
+
+
+@pytest.mark.parametrize("collection", sorted(INDEX_SPEC))
+def test_no_index_is_a_prefix_of_another(collection):
+    """Compound indexes serve their prefixes, so a prefix index is pure write cost"""
+    plain = [
+        tuple(index["keys"]) for index in INDEX_SPEC[collection]
+        if set(index) == {"keys"}  # unique / TTL indexes are not redundant
+    ]
+    for keys in plain:
+        for other in INDEX_SPEC[collection]:
+            other_keys = tuple(other["keys"])
+            assert not (len(keys) < len(other_keys) and other_keys[:len(keys)] == keys), \
+                f"{collection} index {keys} is a prefix of {other_keys}"
+
+
+@pytest.mark.parametrize("collection", sorted(INDEX_SPEC))
+def test_no_duplicate_indexes(collection):
+    keys = [tuple(index["keys"]) for index in INDEX_SPEC[collection]]
+    assert len(keys) == len(set(keys))
@@ -0,0 +1,86 @@
+"""Keyset pagination cursors and filters (app.core.pagination)"""
+import base64
+from datetime import datetime
+
+import pytest
+from bson import ObjectId, json_util
+
+from app.core.config import settings
+from app.core.pagination import (
+    ASCENDING, DESCENDING, decode_cursor, encode_cursor, keyset_filter, page_limit
+)
+from app.core.schema import InvalidDocument
+
+
+def test_cursor_round_trip_keeps_bson_types():
+    doc = {"_id": ObjectId(), "created_at": datetime(2024, 5, 1, 12, 30, 15, 123000)}
+    value, last_id = decode_cursor(encode_cursor(doc))
+    assert value == doc["created_at"]
+    assert isinstance(value, datetime)
+    assert last_id == doc["_id"]
+
+
+def test_cursor_round_trip_for_another_sort_field_and_null_value():
+    doc = {"_id": ObjectId(), "due_date": None}
+    assert decode_cursor(encode_cursor(doc, "due_date"), "due_date") == (None, doc["_id"])
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor({"_id": ObjectId(), "created_at": datetime(2024, 1, 1)})
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    base64.urlsafe_b64encode(b"{broken json").decode(),
+    base64.urlsafe_b64encode(b'["created_at", null]').decode(),
+    base64.urlsafe_b64encode(json_util.dumps(["created_at", None, "not-an-id"]).encode()).decode(),
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidDocument) as excinfo:
+        decode_cursor(cursor)
+    assert excinfo.value.field == "cursor"
+
+
+def test_cursor_for_a_different_sort_is_rejected():
+    cursor = encode_cursor({"_id": ObjectId(), "created_at": datetime(2024, 1, 1)}, "created_at")
+    with pytest.raises(InvalidDocument):
+        decode_cursor(cursor, "due_date")
+
+
+def test_keyset_filter_continues_after_the_cursor():
+    last = {"_id": ObjectId(), "created_at": datetime(2024, 1, 1)}
+    query = keyset_filter({"organization_id": 1}, encode_cursor(last), direction=ASCENDING)
+    assert query == {
+        "organization_id": 1,
+        "$or": [
+            {"created_at": last["created_at"], "_id": {"$gt": last["_id"]}},
+            {"created_at": {"$gt": last["created_at"]}},
+        ],
+    }
+
+
+def test_keyset_filter_descending_includes_nulls_after_dates():
+    last = {"_id": ObjectId(), "due_date": datetime(2024, 1, 1)}
+    query = keyset_filter({}, encode_cursor(last, "due_date"), "due_date", DESCENDING)
+    assert {"due_date": None} in query["$or"]
+    assert {"due_date": {"$lt": last["due_date"]}} in query["$or"]
+
+
+def test_keyset_filter_keeps_an_existing_or():
+    last = {"_id": ObjectId(), "created_at": datetime(2024, 1, 1)}
+    base = {"$or": [{"a": 1}, {"b": 2}]}
+    query = keyset_filter(base, encode_cursor(last))
+    assert query["$and"][0] == base
+
+
+def test_keyset_filter_without_cursor_is_unchanged():
+    query = {"organization_id": 1}
+    assert keyset_filter(query, None) is query
+
+
+def test_page_limit_is_clamped():
+    assert page_limit(None) == settings.DEFAULT_PAGE_SIZE
+    assert page_limit(0) == 1
+    assert page_limit(settings.MAX_PAGE_SIZE + 1) == settings.MAX_PAGE_SIZE
@@ -0,0 +1,103 @@
+"""Fractional ranks for board columns (app.core.ranking)"""
+import random
+
+import pytest
+
+from app.core.ranking import (
+    DIGITS, FIRST_RANK, RANK_WIDTH, rank_after, rank_before, rank_between, spaced_ranks
+)
+
+
+def assert_valid(rank):
+    assert rank, "empty rank"
+    assert set(rank) <= set(DIGITS)
+    assert not rank.endswith(DIGITS[0]), f"{rank!r} ends in {DIGITS[0]!r}"
+
+
+def test_empty_column_gets_the_first_rank():
+    assert rank_between(None, None) == FIRST_RANK
+
+
+@pytest.mark.parametrize("low, high", [("V", "V"), ("W", "V"), ("V1", "V")])
+def test_out_of_order_neighbours_are_rejected(low, high):
+    with pytest.raises(ValueError):
+        rank_between(low, high)
+
+
+@pytest.mark.parametrize("low, high", [
+    ("", "1"), ("", "01"), ("", "0001"), ("1", "2"), ("1", "11"), ("V", "V1"),
+    ("Vz", "W"), ("zzzz", "zzzz1"), ("0001", "0002"), ("A", "z"),
+])
+def test_rank_between_is_strictly_between(low, high):
+    rank = rank_between(low, high)
+    assert_valid(rank)
+    assert low < rank < high
+
+
+@pytest.mark.parametrize("rank", ["1", "01", "001", "0001", "00001", "1z", "V", "zzzz"])
+def test_rank_before_is_never_empty(rank):
+    lower = rank_between(None, rank)
+    assert_valid(lower)
+    assert lower < rank
+
+
+@pytest.mark.parametrize("rank", ["V", "z", "zzzz", "zzzzz", "0001", "Vzz"])
+def test_rank_after(rank):
+    higher = rank_between(rank, None)
+    assert_valid(higher)
+    assert higher > rank
+
+
+def test_appends_stay_at_rank_width():
+    rank = FIRST_RANK
+    for _ in range(5000):
+        following = rank_after(rank)
+        assert following > rank
+        rank = following
+    assert len(rank) <= RANK_WIDTH
+
+
+def test_prepends_stay_at_rank_width():
+    rank = FIRST_RANK
+    for _ in range(5000):
+        preceding = rank_before(rank)
+        assert preceding < rank
+        rank = preceding
+    assert len(rank) <= RANK_WIDTH
+
+
+def test_random_moves_keep_a_strict_order():
+    rng = random.Random(23)
+    column = [FIRST_RANK]
+    for _ in range(2000):
+        index = rng.randint(0, len(column))
+        low = column[index - 1] if index > 0 else None
+        high = column[index] if index < len(column) else None
+        rank = rank_between(low, high)
+        assert_valid(rank)
+        column.insert(index, rank)
+    assert column == sorted(column)
+    assert len(set(column)) == len(column)
+
+
+def test_repeated_inserts_into_one_gap_grow_slowly():
+    # About one digit per six inserts (log base 62 of 2 per halving)
+    low, high = "V", "W"
+    for _ in range(60):
+        high = rank_between(low, high)
+        assert low < high
+    assert len(high) <= len(low) + 60 // 6 + 2
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 61, 62, 1000, 300000])
+def test_spaced_ranks(count):
+    ranks = list(spaced_ranks(count))
+    assert len(ranks) == count
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == count
+    for rank in ranks:
+        assert_valid(rank)
+    # Room is left between neighbours and at both ends
+    for low, high in zip([""] + ranks, ranks + [None]):
+        rank = rank_between(low, high) if low else rank_between(None, high)
+        assert (not low or low < rank) and (high is None or rank < high)
@@ -0,0 +1,50 @@
+"""orjson responses for BSON documents (app.core.responses)"""
+import json
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from starlette.responses import Response
+
+from app.core.responses import bson_response, document_view, dumps
+
+
+def test_dumps_encodes_bson_types():
+    oid = ObjectId()
+    encoded = json.loads(dumps({"id": oid, "ids": [oid], "at": datetime(2024, 5, 1, 12, 0, 1)}))
+    assert encoded == {"id": str(oid), "ids": [str(oid)], "at": "2024-05-01T12:00:01"}
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_document_view_does_not_mutate():
+    doc = {"_id": ObjectId(), "title": "t", "tags": ["a"]}
+    original = dict(doc)
+    view = document_view(doc)
+
+    assert doc == original
+    assert list(view) == ["id", "title", "tags"]
+    assert view["id"] == doc["_id"]
+    assert view["tags"] is doc["tags"]
+
+
+def test_document_view_without_id():
+    assert document_view({"title": "t"}) == {"title": "t"}
+
+
+def test_bson_response_carries_endpoint_headers():
+    # What FastAPI injects as an endpoint's ``response`` parameter
+    endpoint_response = Response()
+    del endpoint_response.headers["content-length"]
+    endpoint_response.headers["ETag"] = 'W/"3"'
+    oid = ObjectId()
+
+    response = bson_response({"data": [document_view({"_id": oid})]}, endpoint_response, status_code=207)
+    assert response.status_code == 207
+    assert response.headers["etag"] == 'W/"3"'
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(response.body))
+    assert json.loads(response.body) == {"data": [{"id": str(oid)}]}
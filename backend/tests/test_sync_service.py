@@ -0,0 +1,159 @@
+"""Delta sync tokens and pages (app.services.sync_service)"""
+import base64
+import time
+
+import pytest
+from bson import ObjectId, json_util
+
+from app.core.config import settings
+from app.core.schema import InvalidDocument
+from app.services.sync_service import (
+    SYNC_SOURCES, SyncService, SyncTokenExpired, decode_sync_token, encode_sync_token
+)
+
+ORG_ID = ObjectId()
+
+_OPERATORS = {
+    "$gt": lambda value, bound: value is not None and value > bound,
+    "$gte": lambda value, bound: value is not None and value >= bound,
+    "$lte": lambda value, bound: value is not None and value <= bound,
+}
+
+
+def matches(doc, query):
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(doc, branch) for branch in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not all(_OPERATORS[op](doc.get(field), bound) for op, bound in condition.items()):
+                return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+class FakeCollection:
+    def __init__(self, docs=()):
+        self.docs = list(docs)
+
+    def find(self, query):
+        return FakeCursor([doc for doc in self.docs if matches(doc, query)])
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+def entry(seq, **fields):
+    return {"_id": ObjectId(), "organization_id": ORG_ID, "change_seq": seq, **fields}
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase(
+        projects=FakeCollection([entry(1, name="p1"), entry(4, name="p4")]),
+        tasks=FakeCollection([entry(2, title="t2"), entry(3, title="t3"), entry(5, title="t5"),
+                              entry(3, title="other org", organization_id=ObjectId())]),
+        tombstones=FakeCollection([entry(3, collection="tasks", doc_id=ObjectId())]),
+    )
+
+
+def test_token_round_trip():
+    last_id = ObjectId()
+    seq, source, decoded_id, issued_at = decode_sync_token(encode_sync_token(7, 1, last_id))
+    assert (seq, source, decoded_id) == (7, 1, last_id)
+    assert abs(issued_at - time.time()) < 5
+
+
+@pytest.mark.parametrize("token", [
+    "???",
+    base64.urlsafe_b64encode(b"[1, 2]").decode(),
+    base64.urlsafe_b64encode(json_util.dumps(["7", 0, None, 0]).encode()).decode(),
+])
+def test_tampered_token_is_rejected(token):
+    with pytest.raises(InvalidDocument) as excinfo:
+        decode_sync_token(token)
+    assert excinfo.value.field == "since"
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_rejected(db):
+    issued_at = int(time.time()) - settings.SYNC_TOMBSTONE_TTL_DAYS * 86400 - 60
+    token = base64.urlsafe_b64encode(json_util.dumps([1, 0, None, issued_at]).encode()).decode()
+    with pytest.raises(SyncTokenExpired):
+        await SyncService(db).changes(str(ORG_ID), 5, since=token)
+
+
+@pytest.mark.asyncio
+async def test_initial_token_is_at_committed(db):
+    result = await SyncService(db).changes(str(ORG_ID), 3)
+    assert result["tasks"] == [] and result["has_more"] is False
+    seq, source, last_id, _ = decode_sync_token(result["next_token"])
+    assert (seq, source, last_id) == (3, len(SYNC_SOURCES), None)
+
+
+@pytest.mark.asyncio
+async def test_changes_stop_at_committed(db):
+    since = encode_sync_token(1, len(SYNC_SOURCES), None)
+    result = await SyncService(db).changes(str(ORG_ID), 3, since=since)
+
+    assert [task["title"] for task in result["tasks"]] == ["t2", "t3"]
+    assert result["projects"] == []
+    assert len(result["deleted"]["tasks"]) == 1
+    assert result["has_more"] is False
+    # The token stops at the last entry returned, never past committed
+    seq, _, _, _ = decode_sync_token(result["next_token"])
+    assert seq == 3
+
+    # Once version 5 is committed, the same token picks up 4 and 5
+    later = await SyncService(db).changes(str(ORG_ID), 5, since=result["next_token"])
+    assert [project["name"] for project in later["projects"]] == ["p4"]
+    assert [task["title"] for task in later["tasks"]] == ["t5"]
+
+
+@pytest.mark.asyncio
+async def test_nothing_committed_keeps_the_token_in_place(db):
+    since = encode_sync_token(5, len(SYNC_SOURCES), None)
+    result = await SyncService(db).changes(str(ORG_ID), 5, since=since)
+    assert result["tasks"] == [] and result["projects"] == []
+    assert decode_sync_token(result["next_token"])[:3] == (5, len(SYNC_SOURCES), None)
+
+
+@pytest.mark.asyncio
+async def test_pages_resume_within_a_change_seq(db):
+    since = encode_sync_token(0, len(SYNC_SOURCES), None)
+    seen = []
+    for _ in range(10):
+        result = await SyncService(db).changes(str(ORG_ID), 5, since=since, limit=1)
+        seen += [doc["change_seq"] for doc in result["projects"] + result["tasks"]]
+        seen += [3 for _ in result["deleted"]["tasks"]]
+        since = result["next_token"]
+        if not result["has_more"]:
+            break
+    assert sorted(seen) == [1, 2, 3, 3, 4, 5]
+
+
+def test_after_filters_are_capped_at_committed():
+    position = (2, 1, ObjectId())
+    for source in range(len(SYNC_SOURCES)):
+        query = SyncService._after(ORG_ID, source, position, 9)
+        assert query["change_seq"]["$lte"] == 9
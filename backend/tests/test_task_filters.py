@@ -0,0 +1,101 @@
+"""Task list filters and sorts (app.core.task_filters)"""
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.pagination import ASCENDING, DESCENDING
+from app.core.schema import InvalidDocument
+from app.core.task_filters import build_task_filter, parse_task_sort, split_values
+
+ORG_ID = ObjectId()
+
+
+def test_split_values_drops_blanks():
+    assert split_values(None) == []
+    assert split_values(" a, ,b ,,") == ["a", "b"]
+
+
+def test_single_values_are_equality_matches():
+    assignee = ObjectId()
+    query = build_task_filter(ORG_ID, status="In Progress", assignee=str(assignee), priority="HIGH", tag="api")
+    assert query == {
+        "organization_id": ORG_ID,
+        "status": "in_progress",
+        "assigned_to": assignee,
+        "priority": "high",
+        "tags": "api",
+    }
+
+
+def test_multiple_values():
+    query = build_task_filter(ORG_ID, status="todo,completed", assignee="none", tag="api,ui")
+    assert query["status"] == {"$in": ["todo", "done"]}
+    assert query["assigned_to"] is None
+    assert query["tags"] == {"$all": ["api", "ui"]}
+
+
+def test_due_date_range():
+    query = build_task_filter(ORG_ID, due_after="2024-01-01", due_before="2024-02-01T00:00:00Z")
+    assert query["due_date"] == {"$gte": datetime(2024, 1, 1), "$lt": datetime(2024, 2, 1)}
+
+
+@pytest.mark.parametrize("sort, expected", [
+    (None, ("created_at", ASCENDING)),
+    ("due_date", ("due_date", ASCENDING)),
+    ("-created_at", ("created_at", DESCENDING)),
+])
+def test_parse_task_sort(sort, expected):
+    assert parse_task_sort(sort) == expected
+
+
+@pytest.mark.parametrize("params, field", [
+    ({"assignee": "not-an-id"}, "assignee"),
+    ({"project_id": "123"}, "project_id"),
+    ({"due_before": "next tuesday"}, "due_before"),
+    ({"due_after": "2024-13-45"}, "due_after"),
+])
+def test_bad_filter_values_are_rejected(params, field):
+    with pytest.raises(InvalidDocument) as excinfo:
+        build_task_filter(ORG_ID, **params)
+    assert excinfo.value.field == field
+
+
+def test_unknown_sort_is_rejected():
+    with pytest.raises(InvalidDocument) as excinfo:
+        parse_task_sort("-title")
+    assert excinfo.value.field == "sort"
+
+
+@pytest.fixture
+def client():
+    """The server's InvalidDocument handler in front of a filter-only endpoint"""
+    from saas_server import invalid_document_handler
+
+    app = FastAPI()
+    app.add_exception_handler(InvalidDocument, invalid_document_handler)
+
+    @app.get("/tasks")
+    async def tasks(assignee: str = None, due_before: str = None, sort: str = None):
+        build_task_filter(ORG_ID, assignee=assignee, due_before=due_before)
+        parse_task_sort(sort)
+        return {}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("params, field", [
+    ({"assignee": "nobody"}, "assignee"),
+    ({"due_before": "soon"}, "due_before"),
+    ({"sort": "title"}, "sort"),
+])
+def test_bad_filter_values_return_422(client, params, field):
+    response = client.get("/tasks", params=params)
+    assert response.status_code == 422
+    assert response.json()["field"] == field
+
+
+def test_valid_filters_pass(client):
+    assert client.get("/tasks", params={"assignee": "none", "sort": "-due_date"}).status_code == 200
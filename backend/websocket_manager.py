@@ -1,41 +1,77 @@
-from typing import Dict, List
+from typing import Dict, Optional, Set
 from fastapi import WebSocket
-import json
 import asyncio
 
+from app.core.config import settings
+from app.core.responses import dumps
+
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-    
+    def __init__(self, send_timeout: Optional[float] = None):
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.send_timeout = send_timeout or settings.WEBSOCKET_SEND_TIMEOUT_SECONDS
+        self.dropped = 0
+        self._closing: Set[asyncio.Task] = set()
+
     async def connect(self, websocket: WebSocket, organization_id: str):
         await websocket.accept()
-        if organization_id not in self.active_connections:
-            self.active_connections[organization_id] = []
-        self.active_connections[organization_id].append(websocket)
-    
+        self.active_connections.setdefault(organization_id, set()).add(websocket)
+
     def disconnect(self, websocket: WebSocket, organization_id: str):
-        if organization_id in self.active_connections:
-            self.active_connections[organization_id].remove(websocket)
-            if not self.active_connections[organization_id]:
-                del self.active_connections[organization_id]
-    
+        connections = self.active_connections.get(organization_id)
+        if connections is None:
+            return
+        connections.discard(websocket)
+        if not connections:
+            del self.active_connections[organization_id]
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
         try:
             await websocket.send_text(message)
         except:
             pass  # Connection closed
-    
+
+    async def _send(self, websocket: WebSocket, text: str) -> bool:
+        try:
+            await asyncio.wait_for(websocket.send_text(text), self.send_timeout)
+            return True
+        except Exception:  # closed, or too slow to keep up
+            return False
+
+    def _drop(self, websocket: WebSocket, organization_id: str):
+        """Forget a connection that failed a send and close it in the background"""
+        self.disconnect(websocket, organization_id)
+        self.dropped += 1
+
+        async def close():
+            try:
+                await asyncio.wait_for(websocket.close(code=1011), self.send_timeout)
+            except Exception:
+                pass  # Already gone
+
+        task = asyncio.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
     async def broadcast_to_organization(self, message: dict, organization_id: str):
-        if organization_id in self.active_connections:
-            disconnected = []
-            for connection in self.active_connections[organization_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    disconnected.append(connection)
-            
-            # Clean up disconnected connections
-            for conn in disconnected:
-                self.active_connections[organization_id].remove(conn)
+        connections = self.active_connections.get(organization_id)
+        if not connections:
+            return
+
+        # Serialized once for every recipient, then sent to all of them at
+        # once so a slow client costs at most send_timeout and delays nobody
+        text = dumps(message).decode()
+        recipients = list(connections)  # connections may change while sending
+        delivered = await asyncio.gather(*(self._send(connection, text) for connection in recipients))
+
+        for connection, ok in zip(recipients, delivered):
+            if not ok:
+                self._drop(connection, organization_id)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "organizations": len(self.active_connections),
+            "connections": sum(len(connections) for connections in self.active_connections.values()),
+            "dropped": self.dropped
+        }
 
 websocket_manager = WebSocketManager()
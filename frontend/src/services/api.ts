@@ -1,5 +1,6 @@
 // API service for backend communication
 const API_BASE = 'http://localhost:8000/api';
+const PAGE_SIZE = 100;
 
 // Get JWT token from localStorage
 const getAuthToken = () => {
@@ -20,6 +21,27 @@ const getOrgSlug = () => {
   return directSlug;
 };
 
+// List endpoints return one page at a time; follow next_cursor until the
+// whole list has been read and return it in the single-response shape
+const fetchAllPages = async (url: string, init: RequestInit = {}) => {
+  const separator = url.includes('?') ? '&' : '?';
+  const data: any[] = [];
+  let cursor: string | null = null;
+  let body: any;
+  do {
+    const pageUrl = `${url}${separator}limit=${PAGE_SIZE}` +
+      (cursor ? `&cursor=${encodeURIComponent(cursor)}` : '');
+    const response = await fetch(pageUrl, init);
+    body = await response.json();
+    if (!response.ok || !Array.isArray(body.data)) {
+      return body;
+    }
+    data.push(...body.data);
+    cursor = body.next_cursor;
+  } while (cursor);
+  return { ...body, data, next_cursor: null };
+};
+
 // Create headers with authentication
 const getHeaders = () => {
   const token = getAuthToken();
@@ -123,10 +145,9 @@ export const api = {
   // Projects
   async getProjects() {
     const orgSlug = getOrgSlug();
-    const response = await fetch(`${API_BASE}/${orgSlug}/projects`, {
+    return fetchAllPages(`${API_BASE}/${orgSlug}/projects`, {
       headers: getHeaders(),
     });
-    return response.json();
   },
 
   async createProject(projectData: {
@@ -176,10 +197,9 @@ export const api = {
     const url = projectId
       ? `${API_BASE}/${orgSlug}/tasks?project_id=${projectId}`
       : `${API_BASE}/${orgSlug}/tasks`;
-    const response = await fetch(url, {
+    return fetchAllPages(url, {
       headers: getHeaders(),
     });
-    return response.json();
   },
 
   async createTask(taskData: {
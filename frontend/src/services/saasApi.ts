@@ -1,5 +1,6 @@
 // SaaS API service for database operations
 const API_BASE = 'http://localhost:8000/api';
+const PAGE_SIZE = 100;
 
 // Helper to get auth token
 const getAuthToken = () => localStorage.getItem('access_token');
@@ -14,6 +15,31 @@ const getOrgSlug = () => {
   return null;
 };
 
+// Helper to read every page of a list endpoint by following next_cursor
+const fetchAllPages = async (url: string, token: string, errorMessage: string) => {
+  const data: any[] = [];
+  let cursor: string | null = null;
+  let body: any;
+  do {
+    const pageUrl = `${url}?limit=${PAGE_SIZE}` +
+      (cursor ? `&cursor=${encodeURIComponent(cursor)}` : '');
+    const response = await fetch(pageUrl, {
+      headers: {
+        Authorization: `Bearer ${token}`,
+      },
+    });
+
+    if (!response.ok) {
+      throw new Error(errorMessage);
+    }
+
+    body = await response.json();
+    data.push(...body.data);
+    cursor = body.next_cursor;
+  } while (cursor);
+  return { ...body, data, next_cursor: null };
+};
+
 // Auth API calls
 export const authApi = {
   signup: async (data: {
@@ -65,17 +91,7 @@ export const projectsApi = {
       throw new Error('Authentication required');
     }
 
-    const response = await fetch(`${API_BASE}/${orgSlug}/projects`, {
-      headers: {
-        Authorization: `Bearer ${token}`,
-      },
-    });
-
-    if (!response.ok) {
-      throw new Error('Failed to fetch projects');
-    }
-
-    return response.json();
+    return fetchAllPages(`${API_BASE}/${orgSlug}/projects`, token, 'Failed to fetch projects');
   },
 
   create: async (project: {
@@ -172,17 +188,7 @@ export const tasksApi = {
       throw new Error('Authentication required');
     }
 
-    const response = await fetch(`${API_BASE}/${orgSlug}/tasks`, {
-      headers: {
-        Authorization: `Bearer ${token}`,
-      },
-    });
-
-    if (!response.ok) {
-      throw new Error('Failed to fetch tasks');
-    }
-
-    return response.json();
+    return fetchAllPages(`${API_BASE}/${orgSlug}/tasks`, token, 'Failed to fetch tasks');
   },
 
   create: async (task: {
@@ -283,20 +289,11 @@ export const tasksApi = {
       throw new Error('Authentication required');
     }
 
-    const response = await fetch(
+    return fetchAllPages(
       `${API_BASE}/${orgSlug}/projects/${projectId}/tasks`,
-      {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      }
+      token,
+      'Failed to fetch project tasks'
     );
-
-    if (!response.ok) {
-      throw new Error('Failed to fetch project tasks');
-    }
-
-    return response.json();
   },
 
   createProjectTask: async (